@@ -1,9 +1,12 @@
 """Base schema types and classes for MongoDB database schema definitions"""
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Dict, List, Any, Union, Optional, Tuple, Type
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+from typing import Dict, List, Any, Mapping, Union, Optional, Set, Tuple, Type
 from enum import Enum
 from bson import ObjectId
+from bson.errors import InvalidId
 
 
 class IndexDirection(Enum):
@@ -20,6 +23,34 @@ class IndexDirection(Enum):
         return self._value_
 
 
+# Index direction -> value MongoDB reports in index keys
+_DIR_MAP: Mapping[Any, Any] = MappingProxyType({
+    IndexDirection.ASCENDING: 1,
+    IndexDirection.DESCENDING: -1,
+    IndexDirection.TEXT: "text",
+    IndexDirection.GEO2D: "2d",
+    IndexDirection.GEO2DSPHERE: "2dsphere",
+    IndexDirection.HASHED: "hashed",
+    1: 1,
+    -1: -1,
+    "1": 1,
+    "-1": -1,
+})
+
+# Plain int/str index direction -> suffix used in generated index names
+_DIR_NAME_MAP: Mapping[Any, str] = MappingProxyType({
+    1: "asc",
+    -1: "desc",
+    "1": "asc",
+    "-1": "desc",
+})
+
+
+def _normalize_direction(direction: Any) -> Any:
+    """Convert an index direction to the value MongoDB reports in index keys"""
+    return _DIR_MAP.get(direction, direction)
+
+
 class IndexDefinition(BaseModel):
     """Definition for a MongoDB index"""
     name: Optional[str] = None
@@ -28,6 +59,18 @@ class IndexDefinition(BaseModel):
     sparse: bool = False
     background: bool = True
     ttl_seconds: Optional[int] = None
+    partial_filter_expression: Optional[Dict[str, Any]] = None  # only index matching documents
+    post_load: bool = False  # build after the initial bulk load rather than before it
+
+    # keys with directions already normalized to MongoDB's reported values
+    _normalized_key: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Normalize key directions once, at schema construction"""
+        self._normalized_key = {
+            field: _normalize_direction(direction)
+            for field, direction in self.keys.items()
+        }
     
     @field_validator('keys')
     def validate_keys(cls, v):
@@ -50,7 +93,7 @@ class IndexDefinition(BaseModel):
                     if isinstance(direction, IndexDirection):
                         dir_name = direction.name.lower()
                     elif isinstance(direction, (int, str)):
-                        dir_name = str(direction).replace('-1', 'desc').replace('1', 'asc')
+                        dir_name = _DIR_NAME_MAP.get(direction, str(direction))
                     else:
                         dir_name = str(direction)
                     parts.append(f"{field}_{dir_name}")
@@ -58,6 +101,20 @@ class IndexDefinition(BaseModel):
         return v
 
 
+@lru_cache(maxsize=None)
+def _generate_json_schema(document_schema: Type[BaseModel]) -> Dict[str, Any]:
+    """Convert a document model into a MongoDB-compatible JSON schema"""
+    # Generate JSON schema from Pydantic model
+    pydantic_schema = document_schema.model_json_schema()
+    # Convert to MongoDB-compatible JSON schema
+    return {
+        "$jsonSchema": {
+            "bsonType": "object",
+            "properties": pydantic_schema.get("properties", {})
+        }
+    }
+
+
 class BaseCollectionSchema(BaseModel):
     """Base schema definition for a MongoDB collection"""
     collection_name: str
@@ -65,19 +122,30 @@ class BaseCollectionSchema(BaseModel):
     json_schema: Optional[Dict[str, Any]] = Field(None, description="JSON schema definition")  # Made optional
     indexes: List[IndexDefinition] = []
     description: str = ""
+    # Native time-series options (timeField/metaField/granularity); None for a regular collection
+    timeseries: Optional[Dict[str, Any]] = None
+    expire_after_seconds: Optional[int] = None  # automatic expiry for time-series collections
     
-    def model_post_init(self, __context: Any) -> None:
-        """Generate json_schema from document_schema if not provided"""
-        if self.json_schema is None and self.document_schema is not None:
-            # Generate JSON schema from Pydantic model
-            pydantic_schema = self.document_schema.model_json_schema()
-            # Convert to MongoDB-compatible JSON schema
-            self.json_schema = {
-                "$jsonSchema": {
-                    "bsonType": "object",
-                    "properties": pydantic_schema.get("properties", {})
-                }
-            }
+    @cached_property
+    def expected_index_metadata(self) -> Tuple[Set[str], Dict[str, Dict[str, Any]]]:
+        """Expected index names (including the default _id_ index) and normalized keys by index name
+
+        Computed once per collection schema; indexes are treated as immutable after construction.
+        """
+        names = {index.name for index in self.indexes}
+        # MongoDB creates the _id index automatically
+        names.add("_id_")
+        keys = {index.name: index._normalized_key for index in self.indexes}
+        return names, keys
+
+    def mongo_json_schema(self) -> Optional[Dict[str, Any]]:
+        """json_schema if provided, otherwise the one generated from document_schema
+
+        Generated schemas are cached per document model and shared, so treat them as read-only.
+        """
+        if self.json_schema is not None or self.document_schema is None:
+            return self.json_schema
+        return _generate_json_schema(self.document_schema)
 
 
 class BaseMongoDbSchema(BaseModel):
@@ -100,8 +168,13 @@ class PyObjectId(ObjectId):
     def validate(cls, v, info=None):
         if isinstance(v, ObjectId):
             return v
-        if isinstance(v, str) and ObjectId.is_valid(v):
-            return ObjectId(v)
+        # Parse once instead of is_valid() followed by ObjectId(); only strings are
+        # accepted since ObjectId(None) would silently generate a new id
+        if isinstance(v, str):
+            try:
+                return ObjectId(v)
+            except InvalidId:
+                pass
         raise ValueError("Invalid ObjectId")
     
     @classmethod
@@ -1,21 +1,121 @@
 """Abstract base class for database seeder"""
 
+import atexit
 import logging
 import random
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List, Any, Type
-from pymongo import MongoClient
-from pydantic import BaseModel, ValidationError
-from .schema_types import BaseMongoDbSchema
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Optional, List, Any, Literal, Tuple, Type
+from pymongo import IndexModel, MongoClient
+from pymongo.errors import OperationFailure
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from .schema_types import BaseCollectionSchema, BaseMongoDbSchema, IndexDefinition
+
+
+SamplingStrategy = Literal["random", "head"]
+
+# Collections at least this large sample only _id values, then fetch full documents
+_ID_ONLY_SAMPLE_THRESHOLD = 100_000
+
+# Maximum schema error messages kept per collection; the rest are only counted
+_MAX_SCHEMA_ERRORS = 50
+
+# model class -> TypeAdapter(List[model class]), shared across seeder instances
+_adapter_cache: Dict[Type[BaseModel], TypeAdapter] = {}
+
+
+def _get_list_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    """Return a cached TypeAdapter that validates a list of model_class documents"""
+    adapter = _adapter_cache.get(model_class)
+    if adapter is None:
+        adapter = _adapter_cache[model_class] = TypeAdapter(List[model_class])
+    return adapter
+
+
+def _list_indexes(collection) -> Dict[str, Dict[str, Any]]:
+    """Fetch all index specifications of a collection, keyed by index name"""
+    return {idx.get("name", ""): idx for idx in collection.list_indexes()}
+
+
+def _index_signature(key: Dict[str, Any], unique: Any, sparse: Any) -> Tuple:
+    """Hashable summary of the index properties compared during validation"""
+    return (tuple(sorted(key.items())), bool(unique), bool(sparse))
+
+
+def _index_model(index_def: IndexDefinition) -> IndexModel:
+    """The createIndexes specification for an index definition"""
+    options: Dict[str, Any] = {}
+    if index_def.partial_filter_expression:
+        options["partialFilterExpression"] = index_def.partial_filter_expression
+    if index_def.ttl_seconds is not None:
+        options["expireAfterSeconds"] = index_def.ttl_seconds
+    return IndexModel(
+        list(index_def._normalized_key.items()),
+        name=index_def.name,
+        unique=index_def.unique,
+        sparse=index_def.sparse,
+        background=index_def.background,
+        **options,
+    )
+
+
+def _append_schema_error(schema_validation: Dict[str, Any], error_msg: str):
+    """Record a schema error message, counting it instead once the list is full"""
+    errors = schema_validation["errors"]
+    if len(errors) < _MAX_SCHEMA_ERRORS:
+        errors.append(error_msg)
+    else:
+        schema_validation["truncated_error_count"] += 1
+
+
+def _estimate_count(collection) -> int:
+    """Document count from collection metadata"""
+    return collection.estimated_document_count()
 
 
 class DatabaseSeeder(ABC):
     """Abstract base class for database seeder"""
 
-    def __init__(self, connection_string: str, database_schema: BaseMongoDbSchema):
-        """Initialize seeder with connection string and database schema"""
+    def __init__(
+        self,
+        connection_string: str,
+        database_schema: BaseMongoDbSchema,
+        pydantic_models: Optional[Dict[str, Type[BaseModel]]] = None,
+    ):
+        """Initialize seeder with connection string and database schema
+
+        pydantic_models optionally maps collection names to document models used by
+        validate_schema_and_indexes; their validators are built here so that
+        validation runs start warm.
+        """
         self.connection_string = connection_string
         self.database_schema = database_schema
+        self.pydantic_models: Dict[str, Type[BaseModel]] = dict(pydantic_models or {})
+        self._adapters: Dict[str, TypeAdapter] = {
+            name: _get_list_adapter(model)
+            for name, model in self.pydantic_models.items()
+        }
+        self._client: Optional[MongoClient] = None
+
+    @property
+    def client(self) -> MongoClient:
+        """Shared MongoClient, created on first use and reused across calls"""
+        if self._client is None:
+            self._client = MongoClient(
+                self.connection_string, maxPoolSize=32, serverSelectionTimeoutMS=5000
+            )
+            atexit.register(self._client.close)
+        return self._client
+
+    @client.setter
+    def client(self, client: MongoClient):
+        """Allow subclasses to provide their own client"""
+        self._client = client
+
+    def warmup(self):
+        """Run every prebuilt document validator once so later validation is fully warm"""
+        for adapter in self._adapters.values():
+            adapter.validate_python([])
 
     @abstractmethod
     def seed_all_collections(self, num_records: Optional[Dict[str, int]] = None):
@@ -27,6 +127,47 @@ class DatabaseSeeder(ABC):
         """Create indexes as defined in the schema"""
         pass
 
+    def create_schema_indexes(self, db, post_load: Optional[bool] = None) -> List[str]:
+        """Create the schema's indexes in db, returning the names of any that failed
+
+        post_load limits the build to indexes whose post_load flag matches it; None
+        builds them all. Each collection's indexes are sent in one createIndexes
+        command. If that command fails, they are retried one at a time so a single
+        bad index does not block the others.
+
+        Raises:
+            RuntimeError: If a unique index cannot be built, since the data then breaks
+                a constraint the schema declares (typically a duplicate key)
+        """
+        logger = logging.getLogger(__name__)
+        failed = []
+        for collection_name, collection_schema in self.database_schema.collections.items():
+            index_defs = [
+                index_def for index_def in collection_schema.indexes
+                if post_load is None or index_def.post_load == post_load
+            ]
+            if not index_defs:
+                continue
+            collection = db[collection_name]
+            try:
+                collection.create_indexes([_index_model(index_def) for index_def in index_defs])
+                continue
+            except OperationFailure:
+                pass
+            for index_def in index_defs:
+                try:
+                    collection.create_indexes([_index_model(index_def)])
+                except OperationFailure as e:
+                    if index_def.unique:
+                        raise RuntimeError(
+                            f"Could not create unique index '{index_def.name}' on '{collection_name}': {e}"
+                        ) from e
+                    logger.warning(
+                        "Could not create index '%s' on '%s': %s", index_def.name, collection_name, e
+                    )
+                    failed.append(f"{collection_name}.{index_def.name}")
+        return failed
+
     @abstractmethod
     def clear_database(self):
         """Clear all collections (useful for re-seeding)"""
@@ -37,10 +178,256 @@ class DatabaseSeeder(ABC):
         """Validate the seeded data meets quality standards"""
         pass
 
+    def _validate_collection(
+        self,
+        db,
+        collection_name: str,
+        collection_schema: BaseCollectionSchema,
+        sample_size: int,
+        pydantic_models: Dict[str, Type[BaseModel]],
+        sampling_strategy: SamplingStrategy,
+        index_listing: Future,
+        estimated_count: Optional[int] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate sampled documents and indexes of a single collection
+
+        index_listing is the already-submitted listIndexes call for this collection
+        (resolving to indexes keyed by name), so its round trip overlaps with
+        counting and sampling. estimated_count is the collection's metadata count
+        when the caller already fetched it.
+        """
+        logger = logging.getLogger(__name__)
+        logger.info("Validating collection '%s'...", collection_name)
+
+        collection = db[collection_name]
+        collection_result = {
+            "document_count": None,  # Only counted when schema validation runs
+            "documents_sampled": 0,
+            "schema_validation": {
+                "passed": True,
+                "errors": [],
+                "valid_documents": 0,
+                "invalid_documents": 0,
+                "truncated_error_count": 0,
+            },
+            "index_validation": {
+                "passed": True,
+                "errors": [],
+                "expected_indexes": len(collection_schema.indexes),
+                "found_indexes": 0,
+                "missing_indexes": [],
+                "extra_indexes": [],
+            },
+        }
+        sv = collection_result["schema_validation"]
+        iv = collection_result["index_validation"]
+
+        # 1. SCHEMA VALIDATION - Sample documents and validate against Pydantic models
+        # Collections without a registered model only need index validation,
+        # so they skip counting and sampling entirely
+        if collection_name in pydantic_models:
+            model_class = pydantic_models[collection_name]
+
+            # Get document count from collection metadata; only pay for an exact
+            # count when the collection is small enough to be sampled in full
+            document_count = (
+                estimated_count
+                if estimated_count is not None
+                else collection.estimated_document_count()
+            )
+            if document_count < sample_size * 2:
+                document_count = collection.count_documents({})
+            collection_result["document_count"] = document_count
+
+            # Sample documents for validation; cursors are sized so the whole
+            # sample arrives in the first batch without getMore round trips
+            sample_count = min(sample_size, document_count)
+            if sample_count > 0:
+                # Get random sample of documents
+                if document_count <= sample_size:
+                    # Sample all documents if collection is small
+                    sample_documents = list(
+                        collection.find({}, batch_size=max(sample_size, 101))
+                    )
+                elif sampling_strategy == "head":
+                    # First documents in natural order; cheap but not random
+                    sample_documents = list(
+                        collection.find({}, batch_size=sample_count).limit(
+                            sample_count
+                        )
+                    )
+                elif document_count < _ID_ONLY_SAMPLE_THRESHOLD:
+                    # Random sampling for larger collections
+                    sample_documents = list(
+                        collection.aggregate(
+                            [{"$sample": {"size": sample_count}}],
+                            batchSize=sample_count,
+                        )
+                    )
+                else:
+                    # Very large collections: keep the random cursor stage
+                    # down to _id values, then fetch full documents by _id
+                    sample_ids = [
+                        doc["_id"]
+                        for doc in collection.aggregate(
+                            [
+                                {"$sample": {"size": sample_count}},
+                                {"$project": {"_id": 1}},
+                            ],
+                            allowDiskUse=False,
+                            batchSize=sample_count,
+                        )
+                    ]
+                    sample_documents = list(
+                        collection.find(
+                            {"_id": {"$in": sample_ids}}, batch_size=sample_count
+                        )
+                    )
+
+                collection_result["documents_sampled"] = len(sample_documents)
+
+                # Validate all sampled documents in a single pydantic-core call;
+                # models given at construction already have their adapter built
+                adapter = _get_list_adapter(model_class)
+                invalid_errors: Dict[int, List[str]] = {}
+                try:
+                    adapter.validate_python(sample_documents, strict=False)
+                except ValidationError as e:
+                    # Attribute each error to its document via the list index;
+                    # only loc and msg are used, so skip building the rest
+                    for err in e.errors(
+                        include_url=False, include_context=False, include_input=False
+                    ):
+                        doc_index = err["loc"][0]
+                        field_loc = ".".join(str(part) for part in err["loc"][1:])
+                        invalid_errors.setdefault(doc_index, []).append(
+                            f"{field_loc or 'document'}: {err['msg']}"
+                        )
+                except Exception as e:
+                    sv["invalid_documents"] += len(sample_documents)
+                    sv["passed"] = False
+                    error_msg = f"Unexpected validation error: {str(e)}"
+                    _append_schema_error(sv, error_msg)
+                    logger.error(
+                        "Unexpected schema validation error in %s: %s",
+                        collection_name,
+                        error_msg,
+                    )
+                else:
+                    sv["valid_documents"] += len(sample_documents)
+
+                if invalid_errors:
+                    warn = logger.warning
+                    sv["valid_documents"] += len(sample_documents) - len(invalid_errors)
+                    sv["invalid_documents"] += len(invalid_errors)
+                    sv["passed"] = False
+                    for doc_index, doc_errors in invalid_errors.items():
+                        error_msg = (
+                            f"Document validation failed: {len(doc_errors)} validation "
+                            f"error(s) in document {doc_index}: {'; '.join(doc_errors)}"
+                        )
+                        _append_schema_error(sv, error_msg)
+                        warn(
+                            "Schema validation error in %s: %s", collection_name, error_msg
+                        )
+
+        # 2. INDEX VALIDATION - Check that all expected indexes exist
+        actual_by_name = index_listing.result()
+        iv["found_indexes"] = len(actual_by_name)
+
+        # Expected index names (including the automatic _id_ index) and
+        # normalized keys are cached on the collection schema
+        expected_index_names, expected_keys_by_name = (
+            collection_schema.expected_index_metadata
+        )
+
+        # Key view; set operations against it need no extra allocation
+        actual_index_names = actual_by_name.keys()
+
+        # Check for missing indexes
+        missing_indexes = expected_index_names - actual_index_names
+        if missing_indexes:
+            iv["passed"] = False
+            iv["missing_indexes"] = list(missing_indexes)
+            error_msg = f"Missing indexes: {missing_indexes}"
+            iv["errors"].append(error_msg)
+            logger.warning(
+                "Index validation error in %s: %s", collection_name, error_msg
+            )
+
+        # Check for extra indexes (not necessarily an error, but worth noting)
+        extra_indexes = actual_index_names - expected_index_names
+        if extra_indexes:
+            iv["extra_indexes"] = list(extra_indexes)
+            logger.info(
+                "Extra indexes found in %s: %s", collection_name, extra_indexes
+            )
+
+        # Detailed index validation - check index properties
+        for expected_index in collection_schema.indexes:
+            # Missing indexes were already reported by name; nothing to compare
+            if expected_index.name in missing_indexes:
+                continue
+            matching_actual_index = actual_by_name[expected_index.name]
+
+            # Validate index properties
+            validation_errors = []
+
+            expected_unique = expected_index.unique
+            expected_sparse = expected_index.sparse
+            expected_key = expected_keys_by_name[expected_index.name]
+            actual_unique = matching_actual_index.get("unique", False)
+            actual_sparse = matching_actual_index.get("sparse", False)
+            actual_key = matching_actual_index.get("key", {})
+
+            # Compare all properties at once; only build field-level
+            # messages when something differs
+            if _index_signature(
+                expected_key, expected_unique, expected_sparse
+            ) != _index_signature(actual_key, actual_unique, actual_sparse):
+                # Check unique property
+                if bool(expected_unique) != bool(actual_unique):
+                    validation_errors.append(
+                        f"Index {expected_index.name}: unique mismatch (expected: {expected_unique}, actual: {actual_unique})"
+                    )
+
+                # Check sparse property
+                if bool(expected_sparse) != bool(actual_sparse):
+                    validation_errors.append(
+                        f"Index {expected_index.name}: sparse mismatch (expected: {expected_sparse}, actual: {actual_sparse})"
+                    )
+
+                # Check key structure
+                if expected_key != actual_key:
+                    validation_errors.append(
+                        f"Index {expected_index.name}: key structure mismatch (expected: {expected_key}, actual: {actual_key})"
+                    )
+
+            if validation_errors:
+                iv["passed"] = False
+                iv["errors"].extend(validation_errors)
+                for error in validation_errors:
+                    logger.warning(
+                        "Index property validation error in %s: %s",
+                        collection_name,
+                        error,
+                    )
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Validation completed for collection '%s': Schema=%s, Indexes=%s",
+                collection_name,
+                "✅" if sv["passed"] else "❌",
+                "✅" if iv["passed"] else "❌",
+            )
+
+        return collection_name, collection_result
+
     def validate_schema_and_indexes(
         self,
         sample_size: int = 10,
         pydantic_models: Optional[Dict[str, Type[BaseModel]]] = None,
+        sampling_strategy: SamplingStrategy = "random",
     ):
         """
         Validate that collections follow the defined schema and have proper indexes.
@@ -49,6 +436,10 @@ class DatabaseSeeder(ABC):
             sample_size: Number of documents to sample per collection for validation
             pydantic_models: Dictionary mapping collection names to Pydantic model classes
                            Example: {"facilities": Facility, "products": Product}
+                           Adds to (and overrides) the models given at construction
+            sampling_strategy: "random" uses $sample; "head" reads the first documents
+                             of each collection, which is much cheaper on very large
+                             collections but yields a biased sample
 
         Returns:
             Dict[str, Any]: Validation results with detailed information about successes/failures
@@ -58,6 +449,12 @@ class DatabaseSeeder(ABC):
         """
         logger = logging.getLogger(__name__)
         logger.info("Starting schema and index validation...")
+        if sampling_strategy not in ("random", "head"):
+            raise ValueError(f"Unknown sampling strategy: {sampling_strategy}")
+        if sampling_strategy == "head":
+            logger.warning(
+                "Using head sampling: sampled documents are not randomly selected"
+            )
 
         results = {
             "validation_summary": {
@@ -72,190 +469,66 @@ class DatabaseSeeder(ABC):
         }
 
         try:
-            # Connect to database
-            client = MongoClient(self.connection_string)
-            db = client[self.database_schema.database_name]
-
-            # Validate each collection
-            for (
-                collection_name,
-                collection_schema,
-            ) in self.database_schema.collections.items():
-                logger.info(f"Validating collection '{collection_name}'...")
-
-                collection = db[collection_name]
-                collection_result = {
-                    "document_count": 0,
-                    "documents_sampled": 0,
-                    "schema_validation": {
-                        "passed": True,
-                        "errors": [],
-                        "valid_documents": 0,
-                        "invalid_documents": 0,
-                    },
-                    "index_validation": {
-                        "passed": True,
-                        "errors": [],
-                        "expected_indexes": len(collection_schema.indexes),
-                        "found_indexes": 0,
-                        "missing_indexes": [],
-                        "extra_indexes": [],
-                    },
-                }
-
-                # Get document count
-                collection_result["document_count"] = collection.count_documents({})
-
-                # 1. SCHEMA VALIDATION - Sample documents and validate against Pydantic models
-                if pydantic_models and collection_name in pydantic_models:
-                    model_class = pydantic_models[collection_name]
-
-                    # Sample documents for validation
-                    sample_count = min(sample_size, collection_result["document_count"])
-                    if sample_count > 0:
-                        # Get random sample of documents
-                        if collection_result["document_count"] <= sample_size:
-                            # Sample all documents if collection is small
-                            sample_documents = list(collection.find({}))
-                        else:
-                            # Random sampling for larger collections
-                            sample_documents = list(
-                                collection.aggregate(
-                                    [{"$sample": {"size": sample_count}}]
-                                )
-                            )
-
-                        collection_result["documents_sampled"] = len(sample_documents)
-
-                        # Validate each sampled document
-                        for doc in sample_documents:
-                            try:
-                                # Convert MongoDB document to Pydantic model
-                                model_class.model_validate(doc)
-                                collection_result["schema_validation"][
-                                    "valid_documents"
-                                ] += 1
-                            except ValidationError as e:
-                                collection_result["schema_validation"][
-                                    "invalid_documents"
-                                ] += 1
-                                collection_result["schema_validation"]["passed"] = False
-                                error_msg = f"Document validation failed: {str(e)}"
-                                collection_result["schema_validation"]["errors"].append(
-                                    error_msg
-                                )
-                                logger.warning(
-                                    f"Schema validation error in {collection_name}: {error_msg}"
-                                )
-                            except Exception as e:
-                                collection_result["schema_validation"][
-                                    "invalid_documents"
-                                ] += 1
-                                collection_result["schema_validation"]["passed"] = False
-                                error_msg = f"Unexpected validation error: {str(e)}"
-                                collection_result["schema_validation"]["errors"].append(
-                                    error_msg
-                                )
-                                logger.error(
-                                    f"Unexpected schema validation error in {collection_name}: {error_msg}"
-                                )
-
-                # 2. INDEX VALIDATION - Check that all expected indexes exist
-                actual_indexes = list(collection.list_indexes())
-                collection_result["index_validation"]["found_indexes"] = len(
-                    actual_indexes
-                )
-
-                # Create sets of expected and actual index names for comparison
-                expected_index_names = {idx.name for idx in collection_schema.indexes}
-                # Add default _id index to expected (MongoDB creates this automatically)
-                expected_index_names.add("_id_")
-
-                actual_index_names = {idx.get("name", "") for idx in actual_indexes}
-
-                # Check for missing indexes
-                missing_indexes = expected_index_names - actual_index_names
-                if missing_indexes:
-                    collection_result["index_validation"]["passed"] = False
-                    collection_result["index_validation"]["missing_indexes"] = list(
-                        missing_indexes
-                    )
-                    error_msg = f"Missing indexes: {missing_indexes}"
-                    collection_result["index_validation"]["errors"].append(error_msg)
-                    logger.warning(
-                        f"Index validation error in {collection_name}: {error_msg}"
+            # Connect to database (the client and its pool are reused across calls)
+            db = self.client[self.database_schema.database_name]
+
+            # Validate collections concurrently; each one is dominated by server
+            # round trips, and the client's connection pool is shared by all workers
+            collections = self.database_schema.collections
+            models = {**self.pydantic_models, **(pydantic_models or {})}
+            collection_results = {}
+            if collections:
+                with ThreadPoolExecutor(
+                    max_workers=min(16, len(collections))
+                ) as executor:
+                    # Index listings are queued first; the executor's FIFO queue
+                    # guarantees they are picked up before any worker waits on them
+                    index_listings = {
+                        collection_name: executor.submit(
+                            _list_indexes, db[collection_name]
+                        )
+                        for collection_name in collections
+                    }
+
+                    # Schedule the largest sampled collections first so the
+                    # slowest work is not left for the end of the fan-out.
+                    # Collections without a model only list indexes and are cheap.
+                    estimates = {
+                        collection_name: executor.submit(
+                            _estimate_count, db[collection_name]
+                        )
+                        for collection_name in collections
+                        if collection_name in models
+                    }
+                    sizes = {
+                        collection_name: estimate.result()
+                        for collection_name, estimate in estimates.items()
+                    }
+                    ordered_collections = sorted(
+                        collections.items(), key=lambda item: -sizes.get(item[0], 0)
                     )
 
-                # Check for extra indexes (not necessarily an error, but worth noting)
-                extra_indexes = actual_index_names - expected_index_names
-                if extra_indexes:
-                    collection_result["index_validation"]["extra_indexes"] = list(
-                        extra_indexes
-                    )
-                    logger.info(
-                        f"Extra indexes found in {collection_name}: {extra_indexes}"
-                    )
-
-                # Detailed index validation - check index properties
-                for expected_index in collection_schema.indexes:
-                    matching_actual_index = None
-                    for actual_index in actual_indexes:
-                        if actual_index.get("name") == expected_index.name:
-                            matching_actual_index = actual_index
-                            break
-
-                    if matching_actual_index:
-                        # Validate index properties
-                        validation_errors = []
-
-                        # Check unique property
-                        expected_unique = expected_index.unique
-                        actual_unique = matching_actual_index.get("unique", False)
-                        if expected_unique != actual_unique:
-                            validation_errors.append(
-                                f"Index {expected_index.name}: unique mismatch (expected: {expected_unique}, actual: {actual_unique})"
-                            )
-
-                        # Check sparse property
-                        expected_sparse = expected_index.sparse
-                        actual_sparse = matching_actual_index.get("sparse", False)
-                        if expected_sparse != actual_sparse:
-                            validation_errors.append(
-                                f"Index {expected_index.name}: sparse mismatch (expected: {expected_sparse}, actual: {actual_sparse})"
-                            )
-
-                        # Check key structure
-                        expected_key = {}
-                        for field, direction in expected_index.keys.items():
-                            if hasattr(direction, "value"):
-                                dir_value = direction.value
-                                if dir_value == "1":
-                                    dir_value = 1
-                                elif dir_value == "-1":
-                                    dir_value = -1
-                            else:
-                                dir_value = direction
-                                if dir_value == "1":
-                                    dir_value = 1
-                                elif dir_value == "-1":
-                                    dir_value = -1
-                            expected_key[field] = dir_value
-
-                        actual_key = matching_actual_index.get("key", {})
-                        if expected_key != actual_key:
-                            validation_errors.append(
-                                f"Index {expected_index.name}: key structure mismatch (expected: {expected_key}, actual: {actual_key})"
-                            )
-
-                        if validation_errors:
-                            collection_result["index_validation"]["passed"] = False
-                            collection_result["index_validation"]["errors"].extend(
-                                validation_errors
-                            )
-                            for error in validation_errors:
-                                logger.warning(
-                                    f"Index property validation error in {collection_name}: {error}"
-                                )
+                    futures = [
+                        executor.submit(
+                            self._validate_collection,
+                            db,
+                            collection_name,
+                            collection_schema,
+                            sample_size,
+                            models,
+                            sampling_strategy,
+                            index_listings[collection_name],
+                            sizes.get(collection_name),
+                        )
+                        for collection_name, collection_schema in ordered_collections
+                    ]
+                    for future in as_completed(futures):
+                        collection_name, collection_result = future.result()
+                        collection_results[collection_name] = collection_result
+
+            # Merge in schema order so results are deterministic
+            for collection_name in collections:
+                collection_result = collection_results[collection_name]
 
                 # Store collection results
                 results["collection_results"][collection_name] = collection_result
@@ -270,31 +543,29 @@ class DatabaseSeeder(ABC):
                 results["validation_summary"]["total_documents_sampled"] += (
                     collection_result["documents_sampled"]
                 )
-                results["validation_summary"]["total_validation_errors"] += len(
-                    collection_result["schema_validation"]["errors"]
-                ) + len(collection_result["index_validation"]["errors"])
-
-                logger.info(
-                    f"Validation completed for collection '{collection_name}': "
-                    f"Schema={'✅' if collection_result['schema_validation']['passed'] else '❌'}, "
-                    f"Indexes={'✅' if collection_result['index_validation']['passed'] else '❌'}"
+                # invalid_documents is authoritative; the error list is capped
+                results["validation_summary"]["total_validation_errors"] += (
+                    collection_result["schema_validation"]["invalid_documents"]
+                    + len(collection_result["index_validation"]["errors"])
                 )
 
-            client.close()
-
             # Generate summary
             summary = results["validation_summary"]
             logger.info("Schema and Index Validation Summary:")
-            logger.info(f"  • Collections validated: {summary['total_collections']}")
+            logger.info("  • Collections validated: %d", summary["total_collections"])
             logger.info(
-                f"  • Schema validation passed: {summary['schema_validation_passed']}/{summary['total_collections']}"
+                "  • Schema validation passed: %d/%d",
+                summary["schema_validation_passed"],
+                summary["total_collections"],
             )
             logger.info(
-                f"  • Index validation passed: {summary['index_validation_passed']}/{summary['total_collections']}"
+                "  • Index validation passed: %d/%d",
+                summary["index_validation_passed"],
+                summary["total_collections"],
             )
-            logger.info(f"  • Documents sampled: {summary['total_documents_sampled']}")
+            logger.info("  • Documents sampled: %d", summary["total_documents_sampled"])
             logger.info(
-                f"  • Total validation errors: {summary['total_validation_errors']}"
+                "  • Total validation errors: %d", summary["total_validation_errors"]
             )
 
             # Determine overall success
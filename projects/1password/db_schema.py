@@ -4,8 +4,9 @@ Comprehensive database schema for security event monitoring and audit trails
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Literal
-from pydantic import Field, field_validator
+from typing import Dict, List, Optional, Any, Type
+from pydantic import BaseModel, Field, field_validator
+from typing_extensions import NotRequired, TypedDict  # pydantic requires these over typing's on Python < 3.12
 
 from mimoid import (
     BaseMongoDbSchema, BaseCollectionSchema, BaseMongoDbDocumentSchema,
@@ -13,7 +14,10 @@ from mimoid import (
 )
 
 # Enums and Type Definitions
-AuditEventAction = Literal[
+# Kept as frozensets and checked by field validators rather than Literal types:
+# a set lookup is cheaper than pydantic's per-member Literal match on these
+# large vocabularies.
+_AUDIT_EVENT_ACTIONS = frozenset({
     "activate", "update", "delete", "convert", "enblduo", "updatduo", "disblduo",
     "rdmchild", "detchild", "dlgsess", "create", "deolddev", "dealldev", "reauth",
     "begin", "complete", "propose", "updatfw", "join", "leave", "role", "purge",
@@ -25,26 +29,29 @@ AuditEventAction = Literal[
     "sendts", "unknown", "completr", "cancelr", "trvlaway", "trvlback", "changeks",
     "changemp", "changesk", "changenm", "changela", "tdvcsso", "sdvcsso", "patch",
     "updatea", "vrfydmn", "uvrfydmn", "dvrfydmn"
-]
+})
 
-AuditEventObjectType = Literal[
+_AUDIT_EVENT_OBJECT_TYPES = frozenset({
     "account", "user", "device", "group", "gm", "vault", "item", "items",
     "itemhist", "vaultkey", "template", "uva", "gva", "invite", "ec", "miguser",
     "sso", "sub", "card", "pm", "slackapp", "file", "famchild", "sa", "satoken",
     "dlgdsess", "ssotkn", "report"
-]
+})
 
-ItemUsageAction = Literal[
+_ITEM_USAGE_ACTIONS = frozenset({
     "fill", "select-sso-provider", "enter-item-edit-mode", "export",
     "share", "secure-copy", "reveal", "server-create", "server-update", "server-fetch"
-]
+})
 
-SignInAttemptCategory = Literal[
+_SIGN_IN_ATTEMPT_CATEGORIES = frozenset({
     "success", "credentials_failed", "mfa_failed", "sso_failed",
     "modern_version_failed", "firewall_failed", "firewall_reported_success"
-]
+})
 
-SignInAttemptType = Literal[
+# Every sign-in category except "success" (partial indexes cannot filter on $ne)
+FAILED_SIGN_IN_CATEGORIES = sorted(_SIGN_IN_ATTEMPT_CATEGORIES - {"success"})
+
+_SIGN_IN_ATTEMPT_TYPES = frozenset({
     "credentials_ok", "mfa_ok", "password_secret_bad", "mfa_missing",
     "totp_disabled", "totp_bad", "totp_timeout", "u2f_disabled", "u2f_bad",
     "u2f_timout", "duo_disabled", "duo_bad", "duo_timeout", "duo_native_bad",
@@ -53,46 +60,56 @@ SignInAttemptType = Literal[
     "code_disabled", "code_bad", "code_timeout", "ip_blocked", "continent_blocked",
     "country_blocked", "anonymous_blocked", "all_blocked", "modern_version_missing",
     "modern_version_old"
-]
+})
+
+def _check_member(value: str, allowed: frozenset, field: str) -> str:
+    if value not in allowed:
+        raise ValueError(f"Invalid {field}: {value!r}")
+    return value
 
 # Embedded Document Schemas
-class LocationSchema(BaseMongoDbDocumentSchema):
-    city: Optional[str] = None
-    country: Optional[str] = None
-    region: Optional[str] = None
-    latitude: Optional[float] = None
-    longitude: Optional[float] = None
-
-class ClientSchema(BaseMongoDbDocumentSchema):
-    app_name: Optional[str] = None
-    app_version: Optional[str] = None
-    ip_address: Optional[str] = None
-    os_name: Optional[str] = None
-    os_version: Optional[str] = None
-    platform_name: Optional[str] = None
-    platform_version: Optional[str] = None
+# Plain TypedDicts: these are stored as subdocuments and carry no behaviour, so the
+# seeder builds them as dicts while pydantic still validates and exports them
+class LocationSchema(TypedDict, total=False):
+    city: Optional[str]
+    country: Optional[str]
+    region: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
 
-class SessionSchema(BaseMongoDbDocumentSchema):
+class ClientSchema(TypedDict, total=False):
+    app_name: Optional[str]
+    app_version: Optional[str]
+    ip_address: Optional[str]
+    os_name: Optional[str]
+    os_version: Optional[str]
+    platform_name: Optional[str]
+    platform_version: Optional[str]
+
+class SessionSchema(TypedDict):
     uuid: str
     device_uuid: str
-    ip: Optional[str] = None
+    ip: NotRequired[Optional[str]]
     login_time: datetime
 
-class UserRefSchema(BaseMongoDbDocumentSchema):
+class UserRefSchema(TypedDict):
     uuid: str
-    email: Optional[str] = None
-    name: Optional[str] = None
+    email: NotRequired[Optional[str]]
+    name: NotRequired[Optional[str]]
 
-class DetailsSchema(BaseMongoDbDocumentSchema):
-    value: Optional[str] = None
+class DetailsSchema(TypedDict, total=False):
+    value: Optional[str]
 
 # Main Document Schemas
+# The seeder writes every collection as plain dicts without instantiating these
+# models; they remain the reference for document shape and are used to validate
+# sampled documents after seeding.
 class UserSchema(BaseMongoDbDocumentSchema):
     uuid: str = Field(..., description="1Password user UUID")
     email: str
     name: str
     is_active: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime
     last_seen: Optional[datetime] = None
     role: Optional[str] = None
     custom_fields: Dict[str, Any] = Field(default_factory=dict)
@@ -105,7 +122,7 @@ class DeviceSchema(BaseMongoDbDocumentSchema):
     os_version: Optional[str] = None
     platform: Optional[str] = None
     is_trusted: bool = True
-    registered_at: datetime = Field(default_factory=datetime.utcnow)
+    registered_at: datetime
     last_used: Optional[datetime] = None
     custom_fields: Dict[str, Any] = Field(default_factory=dict)
 
@@ -115,7 +132,7 @@ class VaultSchema(BaseMongoDbDocumentSchema):
     description: Optional[str] = None
     is_shared: bool = False
     created_by: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime
     permissions: List[Dict[str, Any]] = Field(default_factory=list)
     custom_fields: Dict[str, Any] = Field(default_factory=dict)
 
@@ -125,18 +142,19 @@ class ItemSchema(BaseMongoDbDocumentSchema):
     title: str
     category: str
     created_by: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime
+    updated_at: datetime
     version: int = 1
     is_trashed: bool = False
     tags: List[str] = Field(default_factory=list)
     custom_fields: Dict[str, Any] = Field(default_factory=dict)
 
+# Event schemas
 class AuditEventSchema(BaseMongoDbDocumentSchema):
     uuid: str = Field(..., description="Event UUID")
     timestamp: datetime
-    action: AuditEventAction
-    object_type: AuditEventObjectType
+    action: str
+    object_type: str
     object_uuid: Optional[str] = None
     actor_uuid: str
     aux_id: Optional[int] = None
@@ -145,10 +163,20 @@ class AuditEventSchema(BaseMongoDbDocumentSchema):
     location: Optional[LocationSchema] = None
     session: Optional[SessionSchema] = None
 
+    @field_validator("action")
+    @classmethod
+    def validate_action(cls, v: str) -> str:
+        return _check_member(v, _AUDIT_EVENT_ACTIONS, "action")
+
+    @field_validator("object_type")
+    @classmethod
+    def validate_object_type(cls, v: str) -> str:
+        return _check_member(v, _AUDIT_EVENT_OBJECT_TYPES, "object_type")
+
 class ItemUsageSchema(BaseMongoDbDocumentSchema):
     uuid: str = Field(..., description="Usage event UUID")
     timestamp: datetime
-    action: ItemUsageAction
+    action: str
     item_uuid: str
     vault_uuid: str
     user: UserRefSchema
@@ -156,11 +184,16 @@ class ItemUsageSchema(BaseMongoDbDocumentSchema):
     location: Optional[LocationSchema] = None
     used_version: Optional[int] = None
 
+    @field_validator("action")
+    @classmethod
+    def validate_action(cls, v: str) -> str:
+        return _check_member(v, _ITEM_USAGE_ACTIONS, "action")
+
 class SignInAttemptSchema(BaseMongoDbDocumentSchema):
     uuid: str = Field(..., description="Sign-in attempt UUID")
     timestamp: datetime
-    category: SignInAttemptCategory
-    type: SignInAttemptType
+    category: str
+    type: str
     target_user: UserRefSchema
     session_uuid: Optional[str] = None
     client: Optional[ClientSchema] = None
@@ -168,84 +201,104 @@ class SignInAttemptSchema(BaseMongoDbDocumentSchema):
     country: Optional[str] = None
     details: Optional[DetailsSchema] = None
 
+    @field_validator("category")
+    @classmethod
+    def validate_category(cls, v: str) -> str:
+        return _check_member(v, _SIGN_IN_ATTEMPT_CATEGORIES, "category")
+
+    @field_validator("type")
+    @classmethod
+    def validate_type(cls, v: str) -> str:
+        return _check_member(v, _SIGN_IN_ATTEMPT_TYPES, "type")
+
+# Event collections are native time-series collections; generated events span the
+# last 30 days, so retention is long enough to keep the whole seeded window
+EVENT_RETENTION_SECONDS = 90 * 24 * 60 * 60
+
 # Collection Schemas
 class UsersCollection(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = UserSchema.model_json_schema()
+    document_schema: Optional[Type[BaseModel]] = UserSchema
     indexes: List[IndexDefinition] = [
         IndexDefinition(name="uuid_unique", keys={"uuid": IndexDirection.ASCENDING}, unique=True),
         IndexDefinition(name="email_unique", keys={"email": IndexDirection.ASCENDING}, unique=True),
-        IndexDefinition(name="created_at_desc", keys={"created_at": IndexDirection.DESCENDING}),
-        IndexDefinition(name="last_seen_desc", keys={"last_seen": IndexDirection.DESCENDING}),
+        IndexDefinition(name="created_at_desc", keys={"created_at": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="last_seen_desc", keys={"last_seen": IndexDirection.DESCENDING}, post_load=True),
     ]
     description: str = "1Password user accounts and profiles"
 
 class DevicesCollection(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = DeviceSchema.model_json_schema()
+    document_schema: Optional[Type[BaseModel]] = DeviceSchema
     indexes: List[IndexDefinition] = [
         IndexDefinition(name="uuid_unique", keys={"uuid": IndexDirection.ASCENDING}, unique=True),
-        IndexDefinition(name="user_uuid_idx", keys={"user_uuid": IndexDirection.ASCENDING}),
-        IndexDefinition(name="user_last_used_idx", keys={"user_uuid": IndexDirection.ASCENDING, "last_used": IndexDirection.DESCENDING}),
-        IndexDefinition(name="registered_at_desc", keys={"registered_at": IndexDirection.DESCENDING}),
+        IndexDefinition(name="user_last_used_idx", keys={"user_uuid": IndexDirection.ASCENDING, "last_used": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="registered_at_desc", keys={"registered_at": IndexDirection.DESCENDING}, post_load=True),
     ]
     description: str = "1Password devices and client information"
 
 class VaultsCollection(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = VaultSchema.model_json_schema()
+    document_schema: Optional[Type[BaseModel]] = VaultSchema
     indexes: List[IndexDefinition] = [
         IndexDefinition(name="uuid_unique", keys={"uuid": IndexDirection.ASCENDING}, unique=True),
-        IndexDefinition(name="created_by_idx", keys={"created_by": IndexDirection.ASCENDING}),
-        IndexDefinition(name="is_shared_idx", keys={"is_shared": IndexDirection.ASCENDING}),
-        IndexDefinition(name="created_at_desc", keys={"created_at": IndexDirection.DESCENDING}),
+        IndexDefinition(name="created_by_idx", keys={"created_by": IndexDirection.ASCENDING}, post_load=True),
+        IndexDefinition(name="is_shared_idx", keys={"is_shared": IndexDirection.ASCENDING}, post_load=True),
+        IndexDefinition(name="created_at_desc", keys={"created_at": IndexDirection.DESCENDING}, post_load=True),
     ]
     description: str = "1Password vaults and access control"
 
 class ItemsCollection(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = ItemSchema.model_json_schema()
+    document_schema: Optional[Type[BaseModel]] = ItemSchema
     indexes: List[IndexDefinition] = [
         IndexDefinition(name="uuid_unique", keys={"uuid": IndexDirection.ASCENDING}, unique=True),
-        IndexDefinition(name="vault_uuid_idx", keys={"vault_uuid": IndexDirection.ASCENDING}),
-        IndexDefinition(name="vault_updated_idx", keys={"vault_uuid": IndexDirection.ASCENDING, "updated_at": IndexDirection.DESCENDING}),
-        IndexDefinition(name="created_by_idx", keys={"created_by": IndexDirection.ASCENDING}),
-        IndexDefinition(name="category_idx", keys={"category": IndexDirection.ASCENDING}),
-        IndexDefinition(name="is_trashed_idx", keys={"is_trashed": IndexDirection.ASCENDING}),
+        IndexDefinition(name="vault_updated_idx", keys={"vault_uuid": IndexDirection.ASCENDING, "updated_at": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="created_by_idx", keys={"created_by": IndexDirection.ASCENDING}, post_load=True),
+        IndexDefinition(name="category_idx", keys={"category": IndexDirection.ASCENDING}, post_load=True),
+        IndexDefinition(name="is_trashed_idx", keys={"is_trashed": IndexDirection.ASCENDING}, post_load=True),
     ]
     description: str = "1Password vault items and credentials"
 
 class AuditEventsCollection(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = AuditEventSchema.model_json_schema()
+    document_schema: Optional[Type[BaseModel]] = AuditEventSchema
+    timeseries: Optional[Dict[str, Any]] = {"timeField": "timestamp", "metaField": "actor_uuid", "granularity": "minutes"}
+    expire_after_seconds: Optional[int] = EVENT_RETENTION_SECONDS
+    # Time-series collections cannot have unique indexes and are clustered by time
     indexes: List[IndexDefinition] = [
-        IndexDefinition(name="uuid_unique", keys={"uuid": IndexDirection.ASCENDING}, unique=True),
-        IndexDefinition(name="timestamp_desc", keys={"timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="actor_timestamp_idx", keys={"actor_uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="action_timestamp_idx", keys={"action": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="object_type_timestamp_idx", keys={"object_type": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="object_uuid_timestamp_idx", keys={"object_uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="location_country_timestamp_idx", keys={"location.country": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
+        IndexDefinition(name="uuid_idx", keys={"uuid": IndexDirection.ASCENDING}, post_load=True),
+        IndexDefinition(name="action_timestamp_idx", keys={"action": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        # Equality on object_type and/or actor_uuid, then timestamp sort/range (ESR);
+        # actor-only lookups use the metaField + timeField index MongoDB 6.3+ creates
+        IndexDefinition(name="obj_actor_ts_idx", keys={"object_type": IndexDirection.ASCENDING, "actor_uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="object_uuid_timestamp_idx", keys={"object_uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="location_country_timestamp_idx", keys={"location.country": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
     ]
     description: str = "1Password audit events and action tracking"
 
 class ItemUsagesCollection(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = ItemUsageSchema.model_json_schema()
+    document_schema: Optional[Type[BaseModel]] = ItemUsageSchema
+    timeseries: Optional[Dict[str, Any]] = {"timeField": "timestamp", "metaField": "user", "granularity": "minutes"}
+    expire_after_seconds: Optional[int] = EVENT_RETENTION_SECONDS
+    # Time-series collections cannot have unique indexes and are clustered by time
     indexes: List[IndexDefinition] = [
-        IndexDefinition(name="uuid_unique", keys={"uuid": IndexDirection.ASCENDING}, unique=True),
-        IndexDefinition(name="timestamp_desc", keys={"timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="item_timestamp_idx", keys={"item_uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="vault_timestamp_idx", keys={"vault_uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="user_timestamp_idx", keys={"user.uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="action_timestamp_idx", keys={"action": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
+        IndexDefinition(name="uuid_idx", keys={"uuid": IndexDirection.ASCENDING}, post_load=True),
+        IndexDefinition(name="item_timestamp_idx", keys={"item_uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="vault_timestamp_idx", keys={"vault_uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="user_timestamp_idx", keys={"user.uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="action_timestamp_idx", keys={"action": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
     ]
     description: str = "1Password item usage events and access patterns"
 
 class SignInAttemptsCollection(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = SignInAttemptSchema.model_json_schema()
+    document_schema: Optional[Type[BaseModel]] = SignInAttemptSchema
+    timeseries: Optional[Dict[str, Any]] = {"timeField": "timestamp", "metaField": "target_user", "granularity": "minutes"}
+    expire_after_seconds: Optional[int] = EVENT_RETENTION_SECONDS
+    # Time-series collections cannot have unique indexes and are clustered by time
     indexes: List[IndexDefinition] = [
-        IndexDefinition(name="uuid_unique", keys={"uuid": IndexDirection.ASCENDING}, unique=True),
-        IndexDefinition(name="timestamp_desc", keys={"timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="target_user_timestamp_idx", keys={"target_user.uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="category_timestamp_idx", keys={"category": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="type_timestamp_idx", keys={"type": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="location_country_timestamp_idx", keys={"location.country": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
-        IndexDefinition(name="client_ip_timestamp_idx", keys={"client.ip_address": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}),
+        IndexDefinition(name="uuid_idx", keys={"uuid": IndexDirection.ASCENDING}, post_load=True),
+        IndexDefinition(name="target_user_timestamp_idx", keys={"target_user.uuid": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="category_timestamp_idx", keys={"category": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="failed_partial_idx", keys={"timestamp": IndexDirection.DESCENDING}, partial_filter_expression={"category": {"$in": FAILED_SIGN_IN_CATEGORIES}}, post_load=True),
+        IndexDefinition(name="type_timestamp_idx", keys={"type": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="location_country_timestamp_idx", keys={"location.country": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
+        IndexDefinition(name="client_ip_timestamp_idx", keys={"client.ip_address": IndexDirection.ASCENDING, "timestamp": IndexDirection.DESCENDING}, post_load=True),
     ]
     description: str = "1Password sign-in attempts and authentication events"
 
@@ -4,6 +4,7 @@
 Main execution script for generating and validating the 1Password events database
 """
 
+import io
 import os
 import sys
 import time
@@ -20,14 +21,13 @@ try:
 except ImportError:
     print("💡 Install python-dotenv to automatically load .env file: pip install python-dotenv")
 
+from db_schema import FAILED_SIGN_IN_CATEGORIES
 from seed_db import OnePasswordSeeder
 
-def check_mongodb_connection(connection_string: str) -> bool:
+def check_mongodb_connection(client: MongoClient) -> bool:
     """Check if MongoDB is accessible"""
     try:
-        client = MongoClient(connection_string, serverSelectionTimeoutMS=5000)
         client.admin.command('ping')
-        client.close()
         return True
     except (ConnectionFailure, ServerSelectionTimeoutError) as e:
         print(f"❌ MongoDB connection failed: {e}")
@@ -35,79 +35,88 @@ def check_mongodb_connection(connection_string: str) -> bool:
 
 def print_validation_results(results: Dict[str, Any]) -> None:
     """Print validation results in a formatted way"""
-    print("\n" + "="*60)
-    print("DATABASE VALIDATION RESULTS")
-    print("="*60)
+    buf = io.StringIO()
+    print("\n" + "="*60, file=buf)
+    print("DATABASE VALIDATION RESULTS", file=buf)
+    print("="*60, file=buf)
     
-    print("\n📊 Collection Counts:")
-    print("-" * 40)
+    print("\n📊 Collection Counts:", file=buf)
+    print("-" * 40, file=buf)
     for collection_name, stats in results.items():
         if isinstance(stats, dict) and 'count' in stats:
             status = stats['status']
             count = stats['count']
             expected = stats.get('expected_min', 0)
-            print(f"{status} {collection_name:20}: {count:,} documents (min: {expected:,})")
+            print(f"{status} {collection_name:20}: {count:,} documents (min: {expected:,})", file=buf)
     
     if 'integrity_checks' in results:
-        print("\n🔗 Referential Integrity:")
-        print("-" * 40)
+        print("\n🔗 Referential Integrity:", file=buf)
+        print("-" * 40, file=buf)
         integrity = results['integrity_checks']
         for check_name, count in integrity.items():
             check_display = check_name.replace('_', ' ').title()
-            print(f"✓ {check_display:30}: {count:,}")
+            status = "✓" if count == 0 else "✗"
+            print(f"{status} {check_display:30}: {count:,}", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
 
-def print_database_info(seeder: OnePasswordSeeder) -> None:
+def print_database_info(seeder: OnePasswordSeeder, client: MongoClient) -> None:
     """Print database information and sample queries"""
-    print("\n" + "="*60)
-    print("DATABASE INFORMATION")
-    print("="*60)
+    buf = io.StringIO()
+    print("\n" + "="*60, file=buf)
+    print("DATABASE INFORMATION", file=buf)
+    print("="*60, file=buf)
     
-    print(f"\n📋 Database: {seeder.database_schema.database_name}")
-    print(f"🔗 Connection: {seeder.connection_string}")
-    print(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"\n📋 Database: {seeder.database_schema.database_name}", file=buf)
+    print(f"🔗 Connection: {seeder.connection_string}", file=buf)
+    print(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=buf)
     
-    print("\n📚 Collections:")
-    print("-" * 40)
-    db, client = seeder.get_database()
+    print("\n📚 Collections:", file=buf)
+    print("-" * 40, file=buf)
+    db = client[seeder.database_schema.database_name]
     for collection_name in seeder.database_schema.collections:
-        count = db[collection_name].count_documents({})
-        print(f"  • {collection_name:20}: {count:,} documents")
-    client.close()
+        count = db[collection_name].estimated_document_count()
+        print(f"  • {collection_name:20}: {count:,} documents", file=buf)
     
-    print("\n🔍 Sample Queries:")
-    print("-" * 40)
-    
-    db, client = seeder.get_database()
+    print("\n🔍 Sample Queries:", file=buf)
+    print("-" * 40, file=buf)
     
     # Recent audit events
     recent_events = list(db.audit_events.find().sort("timestamp", -1).limit(3))
     if recent_events:
-        print(f"  Recent audit events: {len(recent_events)} found")
+        print(f"  Recent audit events: {len(recent_events)} found", file=buf)
         for event in recent_events:
-            print(f"    - {event['action']} on {event['object_type']} at {event['timestamp']}")
+            print(f"    - {event['action']} on {event['object_type']} at {event['timestamp']}", file=buf)
     
     # Failed sign-in attempts
-    failed_attempts = db.sign_in_attempts.count_documents({"category": {"$ne": "success"}})
-    total_attempts = db.sign_in_attempts.count_documents({})
+    # No hint: failed_partial_idx is built post-load and may be missing on older servers;
+    # the planner serves the $in from category_timestamp_idx either way
+    failed_attempts = db.sign_in_attempts.count_documents(
+        {"category": {"$in": FAILED_SIGN_IN_CATEGORIES}}
+    )
+    total_attempts = db.sign_in_attempts.estimated_document_count()
     if total_attempts > 0:
         failure_rate = (failed_attempts / total_attempts) * 100
-        print(f"  Sign-in failure rate: {failure_rate:.1f}% ({failed_attempts:,}/{total_attempts:,})")
+        print(f"  Sign-in failure rate: {failure_rate:.1f}% ({failed_attempts:,}/{total_attempts:,})", file=buf)
     
     # Most active users
     pipeline = [
         {"$group": {"_id": "$actor_uuid", "event_count": {"$sum": 1}}},
         {"$sort": {"event_count": -1}},
-        {"$limit": 3}
+        {"$limit": 3},
+        # Resolve names server-side against users.uuid_unique instead of one
+        # find_one round trip per user
+        {"$lookup": {"from": "users", "localField": "_id", "foreignField": "uuid", "as": "user"}},
+        {"$project": {"event_count": 1, "name": {"$arrayElemAt": ["$user.name", 0]}}}
     ]
     active_users = list(db.audit_events.aggregate(pipeline))
     if active_users:
-        print(f"  Most active users: {len(active_users)} found")
+        print(f"  Most active users: {len(active_users)} found", file=buf)
         for user in active_users:
-            user_info = db.users.find_one({"uuid": user["_id"]})
-            name = user_info.get("name", "Unknown") if user_info else "Unknown"
-            print(f"    - {name}: {user['event_count']:,} events")
+            name = user.get("name", "Unknown")
+            print(f"    - {name}: {user['event_count']:,} events", file=buf)
     
-    client.close()
+    sys.stdout.write(buf.getvalue())
 
 def main():
     """Main execution function"""
@@ -118,8 +127,11 @@ def main():
     connection_string = os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
     print(f"📡 Connecting to MongoDB: {connection_string}")
     
+    # One client (and connection pool) for the whole run
+    client = MongoClient(connection_string, serverSelectionTimeoutMS=5000, maxPoolSize=50)
+    
     # Check MongoDB connection
-    if not check_mongodb_connection(connection_string):
+    if not check_mongodb_connection(client):
         print("❌ Cannot connect to MongoDB. Please ensure MongoDB is running.")
         print("   Set MONGODB_URI environment variable if using a different connection string.")
         sys.exit(1)
@@ -129,10 +141,10 @@ def main():
     try:
         # Initialize seeder
         print("\n🌱 Initializing database seeder...")
-        seeder = OnePasswordSeeder(connection_string)
+        seeder = OnePasswordSeeder(connection_string, client=client)
+        seeder.mongoimport_path = os.getenv('MONGOIMPORT_PATH')
         
         # Check if database already exists
-        client = MongoClient(connection_string)
         existing_dbs = client.list_database_names()
         
         if seeder.database_schema.database_name in existing_dbs:
@@ -145,8 +157,6 @@ def main():
                 print("❌ Aborted. Database was not modified.")
                 sys.exit(0)
         
-        client.close()
-        
         # Start seeding
         print(f"\n🚀 Starting database generation...")
         start_time = time.time()
@@ -164,7 +174,7 @@ def main():
         print_validation_results(validation_results)
         
         # Print database info
-        print_database_info(seeder)
+        print_database_info(seeder, client)
         
         print("\n" + "="*60)
         print("🎉 SUCCESS: 1Password Events Database Generated!")
@@ -190,6 +200,8 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        client.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
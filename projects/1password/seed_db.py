@@ -3,26 +3,57 @@
 Generates realistic security event data for testing and development
 """
 
+import multiprocessing
+import os
 import random
 import secrets
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import Iterator, List, Dict, Any, NamedTuple, Optional, Set
+from bson import encode, json_util
+from bson.raw_bson import RawBSONDocument
 from faker import Faker
 from pymongo import MongoClient
+from pymongo.write_concern import WriteConcern
 
 from mimoid import DatabaseSeeder
-from db_schema import (
-    OnePasswordEventsDatabase,
-    UserSchema, DeviceSchema, VaultSchema, ItemSchema,
-    AuditEventSchema, ItemUsageSchema, SignInAttemptSchema,
-    LocationSchema, ClientSchema, SessionSchema, UserRefSchema, DetailsSchema
-)
+from db_schema import OnePasswordEventsDatabase
+
+# Documents are built as plain dicts shaped like the db_schema models; these hold
+# only the fields later collections reference
+class UserRef(NamedTuple):
+    uuid: str
+    email: str
+    name: str
+
+class DeviceRef(NamedTuple):
+    uuid: str
+    user_uuid: str
+
+class VaultRef(NamedTuple):
+    uuid: str
+
+class ItemRef(NamedTuple):
+    uuid: str
+    vault_uuid: str
+    version: int
+
+# Seeded after the reference collections, each from its generate_<name> method and num_<name> count
+EVENT_COLLECTIONS = ("audit_events", "item_usages", "sign_in_attempts")
 
 class OnePasswordSeeder(DatabaseSeeder):
-    def __init__(self, connection_string: str):
+    def __init__(self, connection_string: str, client: Optional[MongoClient] = None):
         from db_schema import database_schema
         super().__init__(connection_string, database_schema)
-        self.fake = Faker()
+        if client is not None:
+            # Share the caller's client instead of opening another connection pool
+            self.client = client
+        # Single locale, uniform provider sampling: skips locale resolution and the
+        # weighted-choice RNG on every Faker call
+        self.fake = Faker('en_US', use_weighting=False)
         Faker.seed(42)
         random.seed(42)
         
@@ -35,6 +66,22 @@ class OnePasswordSeeder(DatabaseSeeder):
         self.num_item_usages = 25000
         self.num_sign_in_attempts = 15000
         
+        # High-volume event collections are generated as plain dicts and
+        # inserted in large batches, bypassing pydantic entirely. Writes are
+        # acknowledged so failures surface and every batch is stored before the
+        # stored counts are checked and the post-load indexes are built
+        self.event_batch_size = 10000
+        self.event_write_concern = WriteConcern(w=1)
+        # The event collections only read the reference caches, so slices of them are
+        # generated in parallel worker processes
+        self.event_workers = os.cpu_count() or 1
+        # Concurrent insert_many calls per collection
+        self.insert_workers = 4
+        # Path to a mongoimport binary; when set, event collections are streamed to it as
+        # Extended JSON lines instead of being inserted through pymongo
+        self.mongoimport_path: Optional[str] = None
+        self.mongoimport_workers = 8
+        
         # 1Password-specific data
         self.app_names = [
             "1Password 8", "1Password 7", "1Password Extension", "1Password CLI",
@@ -63,23 +110,55 @@ class OnePasswordSeeder(DatabaseSeeder):
         ]
         
         # Cache for relationships
-        self.users = []
-        self.devices = []
-        self.vaults = []
-        self.items = []
-        self.sessions = []
+        self.users: List[UserRef] = []
+        self.devices: List[DeviceRef] = []
+        self.vaults: List[VaultRef] = []
+        self.items: List[ItemRef] = []
+        # All generated timestamps are relative to this one instant
+        self.reference_time = datetime.now()
+        # Pre-generated Faker output for the event hot loops; drawing from a pool skips
+        # Faker's provider dispatch on every document
+        self.ip_pool = [self.fake.ipv4() for _ in range(5000)]
+        self.sentence_pool = [self.fake.sentence() for _ in range(1000)]
+        # Embedded location/client subdocuments are reused across events and pre-encoded
+        # once: bson.encode copies an embedded RawBSONDocument's bytes verbatim instead
+        # of re-serializing the same subdocument for every event
+        self.location_pool = [RawBSONDocument(encode(self.generate_location())) for _ in range(2000)]
+        self.client_pool = [RawBSONDocument(encode(self.generate_client())) for _ in range(500)]
+        self.uuid_buffer: List[str] = []
 
     def get_database(self):
-        """Get database connection"""
-        client = MongoClient(self.connection_string)
-        return client[self.database_schema.database_name], client
+        """Get the seeded database on the shared client"""
+        return self.client[self.database_schema.database_name]
 
-    def generate_uuid(self) -> str:
-        """Generate 1Password-style UUID"""
+    def generate_uuids(self, n: int) -> List[str]:
+        """Generate n 1Password-style UUIDs
+
+        All characters come from a single random.choices call and are sliced into
+        UUIDs. With 130 random bits each, collisions are not worth tracking; the
+        reference collections' unique uuid indexes would still reject one.
+        """
         chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
-        return ''.join(random.choices(chars, k=26))
+        blob = ''.join(random.choices(chars, k=26 * n))
+        return [blob[start:start + 26] for start in range(0, len(blob), 26)]
 
-    def generate_location(self) -> LocationSchema:
+    def generate_uuid(self) -> str:
+        """Next 1Password-style UUID, taken from a batch generated ahead of time"""
+        if not self.uuid_buffer:
+            self.uuid_buffer = self.generate_uuids(self.event_batch_size)
+            self.uuid_buffer.reverse()
+        return self.uuid_buffer.pop()
+
+    def random_datetime(self, start_days: float, end_days: float = 0) -> datetime:
+        """Uniformly random datetime between start_days and end_days relative to reference_time
+
+        Plain arithmetic on a fixed reference time; far cheaper per document than
+        Faker's date parsing in date_time_between.
+        """
+        offset = start_days + (end_days - start_days) * random.random()
+        return self.reference_time + timedelta(days=offset)
+
+    def generate_location(self) -> Dict[str, Any]:
         """Generate realistic geolocation data"""
         locations = [
             {"city": "New York", "country": "US", "region": "New York", "lat": 40.7128, "lng": -74.0060},
@@ -95,162 +174,253 @@ class OnePasswordSeeder(DatabaseSeeder):
         ]
         
         loc_data = random.choice(locations)
-        return LocationSchema(
-            city=loc_data["city"],
-            country=loc_data["country"],
-            region=loc_data["region"],
-            latitude=loc_data["lat"] + random.uniform(-0.1, 0.1),
-            longitude=loc_data["lng"] + random.uniform(-0.1, 0.1)
-        )
+        return {
+            "city": loc_data["city"],
+            "country": loc_data["country"],
+            "region": loc_data["region"],
+            "latitude": loc_data["lat"] + random.uniform(-0.1, 0.1),
+            "longitude": loc_data["lng"] + random.uniform(-0.1, 0.1),
+        }
 
-    def generate_client(self) -> ClientSchema:
+    def generate_client(self) -> Dict[str, Any]:
         """Generate realistic client information"""
-        return ClientSchema(
-            app_name=random.choice(self.app_names),
-            app_version=f"{random.randint(8, 12)}.{random.randint(0, 9)}.{random.randint(0, 99)}",
-            ip_address=self.fake.ipv4(),
-            os_name=random.choice(self.os_names),
-            os_version=f"{random.randint(10, 14)}.{random.randint(0, 9)}.{random.randint(0, 9)}",
-            platform_name=random.choice(self.platforms),
-            platform_version=f"{random.randint(90, 120)}.0.{random.randint(1000, 9999)}.{random.randint(10, 99)}"
-        )
+        return {
+            "app_name": random.choice(self.app_names),
+            "app_version": f"{random.randint(8, 12)}.{random.randint(0, 9)}.{random.randint(0, 99)}",
+            "ip_address": random.choice(self.ip_pool),
+            "os_name": random.choice(self.os_names),
+            "os_version": f"{random.randint(10, 14)}.{random.randint(0, 9)}.{random.randint(0, 9)}",
+            "platform_name": random.choice(self.platforms),
+            "platform_version": f"{random.randint(90, 120)}.0.{random.randint(1000, 9999)}.{random.randint(10, 99)}",
+        }
 
-    def seed_users(self) -> None:
-        """Generate user data"""
-        print("Seeding users...")
-        users_data = []
-        
+    def generate_users(self) -> Iterator[Dict[str, Any]]:
+        """Yield user documents, caching each user for later references"""
+        # Bound methods as locals keep attribute lookups out of the loop
+        email = self.fake.email
+        name = self.fake.name
         for _ in range(self.num_users):
-            user = UserSchema(
-                uuid=self.generate_uuid(),
-                email=self.fake.email(),
-                name=self.fake.name(),
-                is_active=random.choice([True, True, True, False]),  # 75% active
-                created_at=self.fake.date_time_between(start_date='-2y', end_date='now'),
-                last_seen=self.fake.date_time_between(start_date='-30d', end_date='now') if random.random() > 0.1 else None,
-                role=random.choice(["admin", "member", "guest", "owner"]),
-                custom_fields={
+            user = {
+                "uuid": self.generate_uuid(),
+                "email": email(),
+                "name": name(),
+                "is_active": random.choice([True, True, True, False]),  # 75% active
+                "created_at": self.random_datetime(-730),
+                "last_seen": self.random_datetime(-30) if random.random() > 0.1 else None,
+                "role": random.choice(["admin", "member", "guest", "owner"]),
+                "custom_fields": {
                     "department": random.choice(["Engineering", "Marketing", "Sales", "HR", "Finance", "Operations"]),
                     "employee_id": f"EMP{random.randint(1000, 9999)}",
                     "security_clearance": random.choice(["basic", "elevated", "admin"])
-                }
-            )
-            users_data.append(user.model_dump())
-            self.users.append(user)
-        
-        db, client = self.get_database()
-        db.users.insert_many(users_data, ordered=False)
-        client.close()
-        print(f"Inserted {len(users_data)} users")
+                },
+            }
+            self.users.append(UserRef(user["uuid"], user["email"], user["name"]))
+            yield user
 
-    def seed_devices(self) -> None:
-        """Generate device data"""
-        print("Seeding devices...")
-        devices_data = []
-        
+    def seed_users(self) -> None:
+        """Generate user data"""
+        print("Seeding users...")
+        db = self.get_database()
+        inserted = self.insert_in_batches(db.users, self.generate_users())
+        print(f"Inserted {inserted} users")
+
+    def generate_devices(self) -> Iterator[Dict[str, Any]]:
+        """Yield device documents, caching each device for later references"""
+        first_name = self.fake.first_name
+        word = self.fake.word
+        bothify = self.fake.bothify
         for _ in range(self.num_devices):
             user = random.choice(self.users)
-            device = DeviceSchema(
-                uuid=self.generate_uuid(),
-                user_uuid=user.uuid,
-                name=f"{self.fake.first_name()}'s {random.choice(['MacBook', 'iPhone', 'iPad', 'Windows PC', 'Android'])}",
-                os_name=random.choice(self.os_names),
-                os_version=f"{random.randint(10, 14)}.{random.randint(0, 9)}",
-                platform=random.choice(self.platforms),
-                is_trusted=random.choice([True, True, True, False]),  # 75% trusted
-                registered_at=self.fake.date_time_between(start_date='-1y', end_date='now'),
-                last_used=self.fake.date_time_between(start_date='-7d', end_date='now') if random.random() > 0.2 else None,
-                custom_fields={
-                    "device_model": self.fake.word().title(),
-                    "serial_number": self.fake.bothify(text='###-???-####').upper(),
+            device = {
+                "uuid": self.generate_uuid(),
+                "user_uuid": user.uuid,
+                "name": f"{first_name()}'s {random.choice(['MacBook', 'iPhone', 'iPad', 'Windows PC', 'Android'])}",
+                "os_name": random.choice(self.os_names),
+                "os_version": f"{random.randint(10, 14)}.{random.randint(0, 9)}",
+                "platform": random.choice(self.platforms),
+                "is_trusted": random.choice([True, True, True, False]),  # 75% trusted
+                "registered_at": self.random_datetime(-365),
+                "last_used": self.random_datetime(-7) if random.random() > 0.2 else None,
+                "custom_fields": {
+                    "device_model": word().title(),
+                    "serial_number": bothify(text='###-???-####').upper(),
                     "managed": random.choice([True, False])
-                }
-            )
-            devices_data.append(device.model_dump())
-            self.devices.append(device)
-        
-        db, client = self.get_database()
-        db.devices.insert_many(devices_data, ordered=False)
-        client.close()
-        print(f"Inserted {len(devices_data)} devices")
+                },
+            }
+            self.devices.append(DeviceRef(device["uuid"], device["user_uuid"]))
+            yield device
 
-    def seed_vaults(self) -> None:
-        """Generate vault data"""
-        print("Seeding vaults...")
-        vaults_data = []
-        
-        for _ in range(self.num_vaults):
+    def seed_devices(self) -> None:
+        """Generate device data"""
+        print("Seeding devices...")
+        db = self.get_database()
+        inserted = self.insert_in_batches(db.devices, self.generate_devices())
+        print(f"Inserted {inserted} devices")
+
+    def generate_vaults(self) -> Iterator[Dict[str, Any]]:
+        """Yield vault documents, caching each vault for later references"""
+        # Draw every vault's permission count, grantees and roles up front
+        permission_counts = random.choices(range(1, 6), k=self.num_vaults)
+        total_permissions = sum(permission_counts)
+        grantees = iter(random.choices(self.users, k=total_permissions))
+        roles = iter(random.choices(["owner", "admin", "member", "viewer"], k=total_permissions))
+        company = self.fake.company
+        
+        for permission_count in permission_counts:
             creator = random.choice(self.users)
             vault_type = random.choice(self.vault_types)
-            vault = VaultSchema(
-                uuid=self.generate_uuid(),
-                name=f"{vault_type} Vault - {self.fake.company()}",
-                description=f"Vault for {vault_type.lower()} access and credentials",
-                is_shared=random.choice([True, False]),
-                created_by=creator.uuid,
-                created_at=self.fake.date_time_between(start_date='-1y', end_date='now'),
-                permissions=[
+            vault = {
+                "uuid": self.generate_uuid(),
+                "name": f"{vault_type} Vault - {company()}",
+                "description": f"Vault for {vault_type.lower()} access and credentials",
+                "is_shared": random.choice([True, False]),
+                "created_by": creator.uuid,
+                "created_at": self.random_datetime(-365),
+                "permissions": [
                     {
-                        "user_uuid": random.choice(self.users).uuid,
-                        "role": random.choice(["owner", "admin", "member", "viewer"]),
-                        "granted_at": self.fake.date_time_between(start_date='-6m', end_date='now')
-                    } for _ in range(random.randint(1, 5))
+                        "user_uuid": next(grantees).uuid,
+                        "role": next(roles),
+                        "granted_at": self.random_datetime(-182)
+                    } for _ in range(permission_count)
                 ],
-                custom_fields={
+                "custom_fields": {
                     "vault_type": vault_type,
                     "compliance_level": random.choice(["standard", "enhanced", "maximum"]),
                     "auto_lock": random.choice([True, False])
-                }
-            )
-            vaults_data.append(vault.model_dump())
-            self.vaults.append(vault)
-        
-        db, client = self.get_database()
-        db.vaults.insert_many(vaults_data, ordered=False)
-        client.close()
-        print(f"Inserted {len(vaults_data)} vaults")
+                },
+            }
+            self.vaults.append(VaultRef(vault["uuid"]))
+            yield vault
 
-    def seed_items(self) -> None:
-        """Generate item data"""
-        print("Seeding items...")
-        items_data = []
-        
-        for _ in range(self.num_items):
+    def seed_vaults(self) -> None:
+        """Generate vault data"""
+        print("Seeding vaults...")
+        db = self.get_database()
+        inserted = self.insert_in_batches(db.vaults, self.generate_vaults())
+        print(f"Inserted {inserted} vaults")
+
+    def generate_items(self) -> Iterator[Dict[str, Any]]:
+        """Yield item documents, caching each item for later references"""
+        company = self.fake.company
+        word = self.fake.word
+        url = self.fake.url
+        # Draw every item's tags in one Faker call and hand them out in order
+        tag_counts = random.choices(range(4), k=self.num_items)
+        tags = iter(self.fake.words(nb=sum(tag_counts)))
+        
+        for tag_count in tag_counts:
             vault = random.choice(self.vaults)
             creator = random.choice(self.users)
             category = random.choice(self.item_categories)
             
-            item = ItemSchema(
-                uuid=self.generate_uuid(),
-                vault_uuid=vault.uuid,
-                title=f"{category} - {self.fake.company() if category == 'Login' else self.fake.word().title()}",
-                category=category,
-                created_by=creator.uuid,
-                created_at=self.fake.date_time_between(start_date='-1y', end_date='now'),
-                updated_at=self.fake.date_time_between(start_date='-30d', end_date='now'),
-                version=random.randint(1, 10),
-                is_trashed=random.choice([False, False, False, True]),  # 25% trashed
-                tags=[self.fake.word() for _ in range(random.randint(0, 3))],
-                custom_fields={
-                    "website": self.fake.url() if category == "Login" else None,
+            item = {
+                "uuid": self.generate_uuid(),
+                "vault_uuid": vault.uuid,
+                "title": f"{category} - {company() if category == 'Login' else word().title()}",
+                "category": category,
+                "created_by": creator.uuid,
+                "created_at": self.random_datetime(-365),
+                "updated_at": self.random_datetime(-30),
+                "version": random.randint(1, 10),
+                "is_trashed": random.choice([False, False, False, True]),  # 25% trashed
+                "tags": list(islice(tags, tag_count)),
+                "custom_fields": {
+                    "website": url() if category == "Login" else None,
                     "last_modified_by": random.choice(self.users).uuid,
                     "security_score": random.randint(1, 100),
-                    "expiry_date": self.fake.future_datetime(end_date='+1y') if category in ["Credit Card", "Identity"] else None
-                }
-            )
-            items_data.append(item.model_dump())
-            self.items.append(item)
-        
-        db, client = self.get_database()
-        db.items.insert_many(items_data, ordered=False)
-        client.close()
-        print(f"Inserted {len(items_data)} items")
+                    "expiry_date": self.random_datetime(0, 365) if category in ["Credit Card", "Identity"] else None
+                },
+            }
+            self.items.append(ItemRef(item["uuid"], item["vault_uuid"], item["version"]))
+            yield item
 
-    def seed_audit_events(self) -> None:
-        """Generate audit event data"""
-        print("Seeding audit events...")
-        audit_events_data = []
-        
+    def seed_items(self) -> None:
+        """Generate item data"""
+        print("Seeding items...")
+        db = self.get_database()
+        inserted = self.insert_in_batches(db.items, self.generate_items())
+        print(f"Inserted {inserted} items")
+
+    def get_event_collection(self, db, name: str):
+        """Collection handle for event inserts, with the event_write_concern"""
+        return db.get_collection(name, write_concern=self.event_write_concern)
+
+    def insert_in_batches(self, collection, documents: Iterator[Dict[str, Any]]) -> int:
+        """Insert generated documents in unordered batches of event_batch_size, returning the count
+
+        Batches are written on insert_workers threads (pymongo releases the GIL on
+        socket I/O) while the next batch is generated; at most insert_workers
+        batches are in flight, which bounds memory. Documents are BSON-encoded as
+        they are batched, so in-flight batches hold compact bytes rather than dict
+        trees and the driver sends them as-is; the server assigns their _id.
+        """
+        inserted = 0
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.insert_workers) as executor:
+            while True:
+                batch = [RawBSONDocument(encode(doc)) for doc in islice(documents, self.event_batch_size)]
+                if not batch:
+                    break
+                if len(pending) >= self.insert_workers:
+                    pending.popleft().result()
+                pending.append(executor.submit(collection.insert_many, batch, ordered=False))
+                inserted += len(batch)
+            for future in pending:
+                future.result()
+        return inserted
+
+    def import_with_mongoimport(self, collection_name: str, documents: Iterator[Dict[str, Any]]) -> int:
+        """Stream generated documents to a mongoimport process, returning the count
+
+        Documents are written as relaxed Extended JSON so datetimes keep their BSON
+        type; mongoimport batches and inserts them on its own insertion workers.
+        """
+        process = subprocess.Popen(
+            [
+                self.mongoimport_path,
+                "--uri", self.connection_string,
+                "--db", self.database_schema.database_name,
+                "--collection", collection_name,
+                "--numInsertionWorkers", str(self.mongoimport_workers),
+                "--mode", "insert",
+                "--quiet",
+            ],
+            stdin=subprocess.PIPE,
+        )
+        imported = 0
+        try:
+            while True:
+                lines = [json_util.dumps(doc) + "\n" for doc in islice(documents, self.event_batch_size)]
+                if not lines:
+                    break
+                process.stdin.write("".join(lines).encode())
+                imported += len(lines)
+        finally:
+            process.stdin.close()
+            returncode = process.wait()
+        if returncode != 0:
+            raise RuntimeError(f"mongoimport exited with status {returncode} while loading {collection_name}")
+        return imported
+
+    def load_event_collection(self, db, collection_name: str) -> int:
+        """Generate and load an event collection, via mongoimport if configured and pymongo otherwise"""
+        documents = getattr(self, f"generate_{collection_name}")()
+        if self.mongoimport_path:
+            return self.import_with_mongoimport(collection_name, documents)
+        return self.insert_in_batches(self.get_event_collection(db, collection_name), documents)
+
+    def draw_choices(self, population: List[Any], n: int) -> Iterator[Any]:
+        """Yield n random picks from population, drawn one batch at a time
+
+        A single random.choices call per batch replaces a random.choice call per
+        document, while memory stays bounded by event_batch_size. Used both for
+        foreign keys and for constant vocabularies in the event hot loops.
+        """
+        for start in range(0, n, self.event_batch_size):
+            yield from random.choices(population, k=min(self.event_batch_size, n - start))
+
+    def generate_audit_events(self) -> Iterator[Dict[str, Any]]:
+        """Yield audit event documents shaped like AuditEventSchema"""
         actions = [
             "create", "update", "delete", "view", "export", "share", "grant", "revoke",
             "activate", "join", "leave", "role", "verify", "suspend", "begin", "complete",
@@ -260,104 +430,106 @@ class OnePasswordSeeder(DatabaseSeeder):
             "user", "device", "vault", "item", "group", "invite", "account", "sso"
         ]
         
-        for _ in range(self.num_audit_events):
-            actor = random.choice(self.users)
-            target_object = random.choice(object_types)
-            
+        devices_by_user: Dict[str, List[DeviceRef]] = {}
+        for device in self.devices:
+            devices_by_user.setdefault(device.user_uuid, []).append(device)
+        
+        n = self.num_audit_events
+        drawn = zip(
+            self.draw_choices(self.users, n),
+            self.draw_choices(actions, n),
+            self.draw_choices(object_types, n),
+            self.draw_choices(self.ip_pool, n),
+            self.draw_choices(self.location_pool, n),
+        )
+        for actor, action, target_object, ip, location in drawn:
             # Generate related session
-            device = random.choice([d for d in self.devices if d.user_uuid == actor.uuid] or self.devices)
-            session = SessionSchema(
-                uuid=self.generate_uuid(),
-                device_uuid=device.uuid,
-                ip=self.fake.ipv4(),
-                login_time=self.fake.date_time_between(start_date='-1d', end_date='now')
-            )
-            self.sessions.append(session)
+            device = random.choice(devices_by_user.get(actor.uuid) or self.devices)
+            session = {
+                "uuid": self.generate_uuid(),
+                "device_uuid": device.uuid,
+                "ip": ip,
+                "login_time": self.random_datetime(-1),
+            }
             
-            event = AuditEventSchema(
-                uuid=self.generate_uuid(),
-                timestamp=self.fake.date_time_between(start_date='-30d', end_date='now'),
-                action=random.choice(actions),
-                object_type=target_object,
-                object_uuid=self.generate_uuid(),
-                actor_uuid=actor.uuid,
-                aux_id=random.randint(1, 1000) if random.random() > 0.7 else None,
-                aux_info=self.fake.sentence() if random.random() > 0.8 else None,
-                aux_uuid=self.generate_uuid() if random.random() > 0.9 else None,
-                location=self.generate_location(),
-                session=session
-            )
-            audit_events_data.append(event.model_dump())
-        
-        # Insert in batches
-        batch_size = 1000
-        db, client = self.get_database()
-        for i in range(0, len(audit_events_data), batch_size):
-            batch = audit_events_data[i:i + batch_size]
-            db.audit_events.insert_many(batch, ordered=False)
-        client.close()
-        
-        print(f"Inserted {len(audit_events_data)} audit events")
+            yield {
+                "uuid": self.generate_uuid(),
+                "timestamp": self.random_datetime(-30),
+                "action": action,
+                "object_type": target_object,
+                "object_uuid": self.generate_uuid(),
+                "actor_uuid": actor.uuid,
+                "aux_id": random.randint(1, 1000) if random.random() > 0.7 else None,
+                "aux_info": random.choice(self.sentence_pool) if random.random() > 0.8 else None,
+                "aux_uuid": self.generate_uuid() if random.random() > 0.9 else None,
+                "location": location,
+                "session": session,
+            }
 
-    def seed_item_usages(self) -> None:
-        """Generate item usage data"""
-        print("Seeding item usages...")
-        usage_data = []
+    def seed_audit_events(self) -> None:
+        """Generate audit event data"""
+        print("Seeding audit events...")
+        db = self.get_database()
+        inserted = self.load_event_collection(db, "audit_events")
         
+        print(f"Inserted {inserted} audit events")
+
+    def generate_item_usages(self) -> Iterator[Dict[str, Any]]:
+        """Yield item usage documents shaped like ItemUsageSchema"""
         usage_actions = [
             "fill", "reveal", "secure-copy", "export", "share",
             "enter-item-edit-mode", "server-fetch", "select-sso-provider"
         ]
         
-        for _ in range(self.num_item_usages):
-            item = random.choice(self.items)
-            user = random.choice(self.users)
-            
-            usage = ItemUsageSchema(
-                uuid=self.generate_uuid(),
-                timestamp=self.fake.date_time_between(start_date='-30d', end_date='now'),
-                action=random.choice(usage_actions),
-                item_uuid=item.uuid,
-                vault_uuid=item.vault_uuid,
-                user=UserRefSchema(
-                    uuid=user.uuid,
-                    email=user.email,
-                    name=user.name
-                ),
-                client=self.generate_client(),
-                location=self.generate_location(),
-                used_version=random.randint(1, item.version)
-            )
-            usage_data.append(usage.model_dump())
-        
-        # Insert in batches
-        batch_size = 1000
-        db, client = self.get_database()
-        for i in range(0, len(usage_data), batch_size):
-            batch = usage_data[i:i + batch_size]
-            db.item_usages.insert_many(batch, ordered=False)
-        client.close()
-        
-        print(f"Inserted {len(usage_data)} item usages")
+        n = self.num_item_usages
+        drawn = zip(
+            self.draw_choices(self.items, n),
+            self.draw_choices(self.users, n),
+            self.draw_choices(usage_actions, n),
+            self.draw_choices(self.client_pool, n),
+            self.draw_choices(self.location_pool, n),
+        )
+        for item, user, action, client, location in drawn:
+            yield {
+                "uuid": self.generate_uuid(),
+                "timestamp": self.random_datetime(-30),
+                "action": action,
+                "item_uuid": item.uuid,
+                "vault_uuid": item.vault_uuid,
+                "user": {
+                    "uuid": user.uuid,
+                    "email": user.email,
+                    "name": user.name,
+                },
+                "client": client,
+                "location": location,
+                "used_version": random.randint(1, item.version),
+            }
 
-    def seed_sign_in_attempts(self) -> None:
-        """Generate sign-in attempt data"""
-        print("Seeding sign-in attempts...")
-        attempts_data = []
+    def seed_item_usages(self) -> None:
+        """Generate item usage data"""
+        print("Seeding item usages...")
+        db = self.get_database()
+        inserted = self.load_event_collection(db, "item_usages")
         
+        print(f"Inserted {inserted} item usages")
+
+    def generate_sign_in_attempts(self) -> Iterator[Dict[str, Any]]:
+        """Yield sign-in attempt documents shaped like SignInAttemptSchema"""
         categories = [
             "success", "credentials_failed", "mfa_failed", "firewall_failed"
         ]
-        
-        attempt_types = [
-            "credentials_ok", "mfa_ok", "password_secret_bad", "mfa_missing",
-            "totp_bad", "ip_blocked", "country_blocked", "continent_blocked"
-        ]
-        
-        for _ in range(self.num_sign_in_attempts):
-            user = random.choice(self.users)
-            category = random.choice(categories)
-            
+        countries = ["US", "CA", "GB", "DE", "FR", "JP", "AU", "BR", "IN", "NL"]
+        
+        n = self.num_sign_in_attempts
+        drawn = zip(
+            self.draw_choices(self.users, n),
+            self.draw_choices(categories, n),
+            self.draw_choices(self.client_pool, n),
+            self.draw_choices(self.location_pool, n),
+            self.draw_choices(countries, n),
+        )
+        for user, category, client, location, country in drawn:
             # Determine type based on category
             if category == "success":
                 attempt_type = random.choice(["credentials_ok", "mfa_ok"])
@@ -368,41 +540,87 @@ class OnePasswordSeeder(DatabaseSeeder):
             else:  # firewall_failed
                 attempt_type = random.choice(["ip_blocked", "country_blocked", "continent_blocked"])
             
-            attempt = SignInAttemptSchema(
-                uuid=self.generate_uuid(),
-                timestamp=self.fake.date_time_between(start_date='-30d', end_date='now'),
-                category=category,
-                type=attempt_type,
-                target_user=UserRefSchema(
-                    uuid=user.uuid,
-                    email=user.email,
-                    name=user.name
-                ),
-                session_uuid=self.generate_uuid() if category == "success" else None,
-                client=self.generate_client(),
-                location=self.generate_location(),
-                country=random.choice(["US", "CA", "GB", "DE", "FR", "JP", "AU", "BR", "IN", "NL"]),
-                details=DetailsSchema(
-                    value=random.choice(["Europe", "Asia", "North America"]) if "blocked" in attempt_type else None
-                ) if random.random() > 0.5 else None
-            )
-            attempts_data.append(attempt.model_dump())
+            yield {
+                "uuid": self.generate_uuid(),
+                "timestamp": self.random_datetime(-30),
+                "category": category,
+                "type": attempt_type,
+                "target_user": {
+                    "uuid": user.uuid,
+                    "email": user.email,
+                    "name": user.name,
+                },
+                "session_uuid": self.generate_uuid() if category == "success" else None,
+                "client": client,
+                "location": location,
+                "country": country,
+                "details": {
+                    "value": random.choice(["Europe", "Asia", "North America"]) if "blocked" in attempt_type else None
+                } if random.random() > 0.5 else None,
+            }
+
+    def seed_sign_in_attempts(self) -> None:
+        """Generate sign-in attempt data"""
+        print("Seeding sign-in attempts...")
+        db = self.get_database()
+        inserted = self.load_event_collection(db, "sign_in_attempts")
         
-        # Insert in batches
-        batch_size = 1000
-        db, client = self.get_database()
-        for i in range(0, len(attempts_data), batch_size):
-            batch = attempts_data[i:i + batch_size]
-            db.sign_in_attempts.insert_many(batch, ordered=False)
-        client.close()
+        print(f"Inserted {inserted} sign-in attempts")
+
+    def seed_event_collections(self) -> None:
+        """Seed the event collections in worker processes, splitting each into slices"""
+        if self.event_workers <= 1:
+            self.seed_audit_events()
+            self.seed_item_usages()
+            self.seed_sign_in_attempts()
+            self.verify_event_counts()
+            return
+        
+        print(f"Seeding event collections on {self.event_workers} worker processes...")
+        shared = {
+            "users": self.users, "devices": self.devices, "vaults": self.vaults, "items": self.items,
+            "event_batch_size": self.event_batch_size, "insert_workers": self.insert_workers,
+            "mongoimport_path": self.mongoimport_path, "mongoimport_workers": self.mongoimport_workers,
+        }
+        # spawn rather than fork: forking a process that holds an open MongoClient is unsafe
+        with ProcessPoolExecutor(
+            max_workers=self.event_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = {}
+            for collection_name in EVENT_COLLECTIONS:
+                total = getattr(self, f"num_{collection_name}")
+                slices = max(1, min(self.event_workers, -(-total // self.event_batch_size)))
+                futures[collection_name] = [
+                    executor.submit(
+                        _seed_slice_in_worker, self.connection_string, collection_name, f"{collection_name}-{i}",
+                        {**shared, f"num_{collection_name}": total // slices + (i < total % slices)},
+                    )
+                    for i in range(slices)
+                ]
+            for collection_name, slice_futures in futures.items():
+                inserted = sum(future.result() for future in slice_futures)
+                print(f"Inserted {inserted} {collection_name.replace('_', ' ')}")
         
-        print(f"Inserted {len(attempts_data)} sign-in attempts")
+        self.verify_event_counts()
+
+    def verify_event_counts(self) -> None:
+        """Check every event document was stored before post-load indexes are built over them"""
+        db = self.get_database()
+        for collection_name in EVENT_COLLECTIONS:
+            expected = getattr(self, f"num_{collection_name}")
+            stored = db[collection_name].count_documents({})
+            if stored != expected:
+                raise RuntimeError(
+                    f"{collection_name}: {stored} documents stored, expected {expected}"
+                )
 
     def seed_all_collections(self, num_records: Optional[Dict[str, int]] = None) -> None:
         """Main seeding method"""
         print(f"Starting database seeding for {self.database_schema.database_name}")
         
-        # Create database and collections with indexes
+        # Create collections with only the indexes needed during the load (unique
+        # constraints); secondary indexes are built once the data is in place
+        self.create_collections()
         self.create_indexes()
         
         # Seed data in dependency order
@@ -410,56 +628,61 @@ class OnePasswordSeeder(DatabaseSeeder):
         self.seed_devices()
         self.seed_vaults()
         self.seed_items()
-        self.seed_audit_events()
-        self.seed_item_usages()
-        self.seed_sign_in_attempts()
+        self.seed_event_collections()
+        
+        print("Building secondary indexes...")
+        self.create_indexes(post_load=True)
         
         print("Database seeding completed successfully!")
 
-    def create_indexes(self) -> None:
-        """Create indexes as defined in the schema"""
-        client = MongoClient(self.connection_string)
-        db = client[self.database_schema.database_name]
+    def create_collections(self) -> None:
+        """Create time-series collections up front; regular ones are created on first insert"""
+        db = self.get_database()
+        existing = set(db.list_collection_names())
         
         for collection_name, collection_schema in self.database_schema.collections.items():
-            collection = db[collection_name]
-            for index_def in collection_schema.indexes:
-                try:
-                    collection.create_index(
-                        [(field, direction.value if hasattr(direction, 'value') else direction) 
-                         for field, direction in index_def.keys.items()],
-                        name=index_def.name,
-                        unique=index_def.unique,
-                        sparse=index_def.sparse,
-                        background=index_def.background
-                    )
-                except Exception as e:
-                    if "duplicate key" not in str(e).lower():
-                        print(f"Warning: Could not create index {index_def.name}: {e}")
-        
-        client.close()
+            if collection_schema.timeseries and collection_name not in existing:
+                options = {"timeseries": collection_schema.timeseries}
+                if collection_schema.expire_after_seconds:
+                    options["expireAfterSeconds"] = collection_schema.expire_after_seconds
+                db.create_collection(collection_name, **options)
+
+    def create_indexes(self, post_load: bool = False) -> None:
+        """Create the schema's indexes whose post_load flag matches post_load
+
+        The unique uuid and email indexes go in before the load, so a duplicate is
+        rejected at insert; the secondary indexes are built once the data is loaded.
+        """
+        for name in self.create_schema_indexes(self.get_database(), post_load=post_load):
+            print(f"Warning: Could not create index {name}")
 
     def clear_database(self) -> None:
         """Clear all collections"""
-        client = MongoClient(self.connection_string)
-        db = client[self.database_schema.database_name]
+        db = self.get_database()
         
-        for collection_name in self.database_schema.collections.keys():
-            db[collection_name].delete_many({})
-        
-        client.close()
+        for collection_name, collection_schema in self.database_schema.collections.items():
+            if collection_schema.timeseries:
+                # Time-series collections only support restricted deletes; drop and
+                # let create_collections() recreate them
+                db.drop_collection(collection_name)
+            else:
+                db[collection_name].delete_many({})
 
     def validate_seed_data(self) -> Dict[str, Any]:
         """Validate the seeded data"""
         return self.validate_data()
 
+    def find_invalid_references(self, collection, field: str, valid_uuids: Set[str]) -> Set[str]:
+        """Distinct foreign key values in a collection that do not match any of valid_uuids"""
+        return set(collection.distinct(field)) - valid_uuids
+
     def validate_data(self) -> Dict[str, Any]:
         """Validate the seeded data"""
         print("Validating seeded data...")
         
         validation_results = {}
         
-        db, client = self.get_database()
+        db = self.get_database()
         
         # Count documents in each collection
         for collection_name in self.database_schema.collections:
@@ -470,20 +693,28 @@ class OnePasswordSeeder(DatabaseSeeder):
                 "status": "✓" if count > 0 else "✗"
             }
         
-        # Check referential integrity
+        # Check referential integrity: compare the distinct foreign keys of each child
+        # collection against the parent key set, shipping unique values rather than rows
+        user_uuids = set(db.users.distinct("uuid"))
+        vault_uuids = set(db.vaults.distinct("uuid"))
         integrity_checks = {
-            "devices_with_valid_users": db.devices.count_documents({
-                "user_uuid": {"$in": [u.uuid for u in self.users]}
-            }),
-            "items_with_valid_vaults": db.items.count_documents({
-                "vault_uuid": {"$in": [v.uuid for v in self.vaults]}
-            }),
-            "audit_events_with_valid_actors": db.audit_events.count_documents({
-                "actor_uuid": {"$in": [u.uuid for u in self.users]}
-            })
+            "devices_invalid_user_refs": len(self.find_invalid_references(db.devices, "user_uuid", user_uuids)),
+            "items_invalid_vault_refs": len(self.find_invalid_references(db.items, "vault_uuid", vault_uuids)),
+            "audit_events_invalid_actor_refs": len(self.find_invalid_references(db.audit_events, "actor_uuid", user_uuids)),
         }
         
         validation_results["integrity_checks"] = integrity_checks
-        
-        client.close()
-        return validation_results
\ No newline at end of file
+        return validation_results
+
+def _seed_slice_in_worker(connection_string: str, collection_name: str, slice_id: str, attributes: Dict[str, Any]) -> int:
+    """Generate and insert one slice of an event collection in a worker process with its own MongoClient"""
+    seeder = OnePasswordSeeder(connection_string)
+    # Reproducible but distinct random streams per slice
+    Faker.seed(f"42-{slice_id}")
+    random.seed(f"42-{slice_id}")
+    for name, value in attributes.items():
+        setattr(seeder, name, value)
+    try:
+        return seeder.load_event_collection(seeder.get_database(), collection_name)
+    finally:
+        seeder.client.close()
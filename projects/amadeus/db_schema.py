@@ -1,10 +1,12 @@
 """Database schema for Amadeus Flight Offers Search API Database"""
 
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
-from pydantic import Field, field_validator
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, FrozenSet, Literal, Tuple, Type, Union
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, PlainSerializer, StringConstraints, field_validator, model_validator
+from typing_extensions import Annotated, NotRequired, TypedDict  # pydantic requires these over typing's on Python < 3.12
 from enum import Enum
-from decimal import Decimal
 
 # Import base types from mimoid package
 from mimoid import (
@@ -83,22 +85,167 @@ class SearchStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Short codes (IATA/ICAO/ISO) come from a small alphabet and repeat across millions of
+# documents; interning keeps one shared str per distinct code
+CodeStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Length-constrained strings, shared so pydantic builds one validator per distinct constraint
+Code2 = Annotated[str, StringConstraints(max_length=2), AfterValidator(sys.intern)]
+Code3 = Annotated[str, StringConstraints(max_length=3), AfterValidator(sys.intern)]
+Code4 = Annotated[str, StringConstraints(max_length=4), AfterValidator(sys.intern)]
+Str1 = Annotated[str, StringConstraints(max_length=1)]
+Str10 = Annotated[str, StringConstraints(max_length=10)]
+Str20 = Annotated[str, StringConstraints(max_length=20)]
+Str45 = Annotated[str, StringConstraints(max_length=45)]
+Str50 = Annotated[str, StringConstraints(max_length=50)]
+Str100 = Annotated[str, StringConstraints(max_length=100)]
+Str200 = Annotated[str, StringConstraints(max_length=200)]
+Str255 = Annotated[str, StringConstraints(max_length=255)]
+Str500 = Annotated[str, StringConstraints(max_length=500)]
+
+# Small vocabularies queried by membership; held as frozensets in memory and dumped as
+# sorted lists, since BSON has no set type
+StrSet = Annotated[FrozenSet[str], PlainSerializer(sorted, return_type=List[str])]
+CodeSet = Annotated[FrozenSet[CodeStr], PlainSerializer(sorted, return_type=List[str])]
+
+# Coordinates are always generated as floats, so validate them strictly and skip lax coercion
+Latitude = Annotated[float, Field(strict=True, ge=-90, le=90)]
+Longitude = Annotated[float, Field(strict=True, ge=-180, le=180)]
+
+
+# Timestamp shared by every default that fires within the same millisecond
+_NOW_CACHE: List[Any] = [0, None]
+
+
+def _now() -> datetime:
+    """Current naive UTC time, recomputed at most once per millisecond"""
+    tick = time.time_ns() // 1_000_000
+    if _NOW_CACHE[0] != tick:
+        _NOW_CACHE[0] = tick
+        _NOW_CACHE[1] = datetime.fromtimestamp(tick / 1000, timezone.utc).replace(tzinfo=None)
+    return _NOW_CACHE[1]
+
+
+# Embedded document schemas
+# TypedDicts for the GDS-shaped subdocuments, so pydantic validates each entry against a
+# fixed set of fields instead of walking an arbitrary Dict[str, Any]. Unknown keys in
+# incoming payloads are kept as-is (extra="allow").
+_EMBEDDED_CONFIG = ConfigDict(extra="allow")
+
+
+class FlightEndPoint(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    iataCode: str
+    terminal: Optional[str]
+    at: str
+
+
+class GeoPoint(TypedDict):
+    type: Literal["Point"]
+    coordinates: Tuple[Longitude, Latitude]  # GeoJSON order
+
+
+class AircraftEquipment(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    code: str
+
+
+class Segment(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    id: str
+    departure: FlightEndPoint
+    arrival: FlightEndPoint
+    carrierCode: str
+    number: str
+    aircraft: AircraftEquipment
+    duration: str
+    numberOfStops: int
+    blacklistedInEU: bool
+
+
+class Itinerary(TypedDict):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    duration: NotRequired[str]
+    segments: List[Segment]
+
+
+class TravelerPricing(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    travelerId: str
+    fareOption: FareOption
+    travelerType: TravelerType
+    price: Dict[str, Any]
+    fareDetailsBySegment: List[Dict[str, Any]]
+
+
+class AdditionalService(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    type: AdditionalServiceType
+    amount: str
+
+
+class TravelerName(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    firstName: str
+    lastName: str
+
+
+class TravelerContact(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    emailAddress: str
+    phone: str
+
+
+class Traveler(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    id: str
+    type: TravelerType
+    name: TravelerName
+    dateOfBirth: str
+    gender: str
+    contact: Optional[TravelerContact]
+
+
+class SpecialServiceRequest(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    type: str
+    description: str
+
+
+class Modification(TypedDict, total=False):
+    __pydantic_config__ = _EMBEDDED_CONFIG
+    modified_at: datetime
+    change_type: str
+    description: str
+
+
 # Document schemas
-class Airline(BaseMongoDbDocumentSchema):
+class TimestampedMixin(BaseModel):
+    """Creation and last-update timestamps shared by every document"""
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: Optional[datetime] = Field(None)
+
+
+# Reference data (countries, currencies, aircraft types) never changes once loaded:
+# instances are immutable and hashable, and unknown fields are rejected
+_REFERENCE_CONFIG = ConfigDict(frozen=True, revalidate_instances="never", extra="forbid")
+
+
+class Airline(BaseMongoDbDocumentSchema, TimestampedMixin):
     # Basic airline information
-    iata_code: str = Field(..., max_length=2, description="IATA airline code")
-    icao_code: Optional[str] = Field(None, max_length=3, description="ICAO airline code")
-    name: str = Field(..., max_length=200, description="Airline name")
-    country_code: str = Field(..., max_length=2, description="Country of registration")
+    iata_code: Code2 = Field(..., description="IATA airline code")
+    icao_code: Optional[Code3] = Field(None, description="ICAO airline code")
+    name: Str200 = Field(..., description="Airline name")
+    country_code: Code2 = Field(..., description="Country of registration")
     
     # Operational details
     is_active: bool = Field(default=True, description="Currently operating")
     blacklisted_in_eu: bool = Field(default=False, description="EU blacklist status")
-    website: Optional[str] = Field(None, max_length=500)
+    website: Optional[Str500] = Field(None)
     
     # Business information
-    alliance: Optional[str] = Field(None, max_length=50, description="Airline alliance")
-    hub_airports: List[str] = Field(default=[], description="Primary hub airport codes")
+    alliance: Optional[Str50] = Field(None, description="Airline alliance")
+    hub_airports: List[CodeStr] = Field(default=[], description="Primary hub airport codes")
     fleet_size: Optional[int] = Field(None, ge=0, description="Total aircraft count")
     destinations_count: Optional[int] = Field(None, ge=0, description="Destinations served")
     
@@ -108,21 +255,19 @@ class Airline(BaseMongoDbDocumentSchema):
     regional_carrier: bool = Field(default=False, description="Regional airline")
     
     # Contact and booking information
-    phone: Optional[str] = Field(None, max_length=50)
-    email: Optional[str] = Field(None, max_length=255)
-    booking_classes: List[str] = Field(default=[], description="Available booking classes")
-    
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(None)
+    phone: Optional[Str50] = Field(None)
+    email: Optional[Str255] = Field(None)
+    booking_classes: CodeSet = Field(default_factory=frozenset, description="Available booking classes")
 
 
-class Aircraft(BaseMongoDbDocumentSchema):
+class Aircraft(BaseMongoDbDocumentSchema, TimestampedMixin):
+    model_config = _REFERENCE_CONFIG
+    
     # Aircraft identification
-    iata_code: str = Field(..., max_length=3, description="IATA aircraft type code")
-    icao_code: Optional[str] = Field(None, max_length=4, description="ICAO aircraft type code")
-    name: str = Field(..., max_length=200, description="Aircraft model name")
-    manufacturer: str = Field(..., max_length=100, description="Aircraft manufacturer")
+    iata_code: Code3 = Field(..., description="IATA aircraft type code")
+    icao_code: Optional[Code4] = Field(None, description="ICAO aircraft type code")
+    name: Str200 = Field(..., description="Aircraft model name")
+    manufacturer: Str100 = Field(..., description="Aircraft manufacturer")
     
     # Technical specifications
     capacity_economy: Optional[int] = Field(None, ge=0, description="Economy class seats")
@@ -138,45 +283,42 @@ class Aircraft(BaseMongoDbDocumentSchema):
     # Operational details
     first_flight_year: Optional[int] = Field(None, ge=1900, le=2030, description="Year of first flight")
     in_production: bool = Field(default=True, description="Currently in production")
-    typical_routes: List[str] = Field(default=[], description="Typical route types (short-haul, long-haul, etc.)")
+    typical_routes: StrSet = Field(default_factory=frozenset, description="Typical route types (short-haul, long-haul, etc.)")
     
     # Engine and fuel information
     engine_count: Optional[int] = Field(None, ge=1, le=6, description="Number of engines")
-    engine_type: Optional[str] = Field(None, max_length=100, description="Engine type")
+    engine_type: Optional[Str100] = Field(None, description="Engine type")
     fuel_consumption_lph: Optional[float] = Field(None, ge=0, description="Fuel consumption per hour")
     
     # Environmental data
     co2_emission_factor: Optional[float] = Field(None, ge=0, description="CO2 emission factor")
-    noise_category: Optional[str] = Field(None, max_length=20, description="Noise classification")
-    
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(None)
+    noise_category: Optional[Str20] = Field(None, description="Noise classification")
 
 
-class Airport(BaseMongoDbDocumentSchema):
+class Airport(BaseMongoDbDocumentSchema, TimestampedMixin):
     # Airport identification
-    iata_code: str = Field(..., max_length=3, description="IATA airport code")
-    icao_code: Optional[str] = Field(None, max_length=4, description="ICAO airport code")
-    name: str = Field(..., max_length=200, description="Airport name")
+    iata_code: Code3 = Field(..., description="IATA airport code")
+    icao_code: Optional[Code4] = Field(None, description="ICAO airport code")
+    name: Str200 = Field(..., description="Airport name")
     
     # Location information
-    city_code: str = Field(..., max_length=3, description="IATA city code")
-    city_name: str = Field(..., max_length=100, description="City name")
-    country_code: str = Field(..., max_length=2, description="ISO country code")
-    country_name: str = Field(..., max_length=100, description="Country name")
-    continent: str = Field(..., max_length=50, description="Continent name")
+    city_code: Code3 = Field(..., description="IATA city code")
+    city_name: Str100 = Field(..., description="City name")
+    country_code: Code2 = Field(..., description="ISO country code")
+    country_name: Str100 = Field(..., description="Country name")
+    continent: Str50 = Field(..., description="Continent name")
     
     # Geographic coordinates
-    latitude: Optional[float] = Field(None, ge=-90, le=90, description="Latitude in decimal degrees")
-    longitude: Optional[float] = Field(None, ge=-180, le=180, description="Longitude in decimal degrees")
+    latitude: Optional[Latitude] = Field(None, description="Latitude in decimal degrees")
+    longitude: Optional[Longitude] = Field(None, description="Longitude in decimal degrees")
+    location: Optional[GeoPoint] = Field(None, description="GeoJSON point of the coordinates, for 2dsphere queries")
     elevation_m: Optional[int] = Field(None, description="Elevation in meters above sea level")
-    timezone: Optional[str] = Field(None, max_length=50, description="IANA timezone identifier")
+    timezone: Optional[Str50] = Field(None, description="IANA timezone identifier")
     
     # Operational information
     is_active: bool = Field(default=True, description="Currently operational")
-    airport_type: str = Field(..., max_length=50, description="Airport classification")
-    hub_for_airlines: List[str] = Field(default=[], description="Airlines using as hub")
+    airport_type: Str50 = Field(..., description="Airport classification")
+    hub_for_airlines: List[CodeStr] = Field(default=[], description="Airlines using as hub")
     terminals_count: Optional[int] = Field(None, ge=1, description="Number of terminals")
     
     # Capacity and traffic
@@ -191,74 +333,69 @@ class Airport(BaseMongoDbDocumentSchema):
     lounges_count: Optional[int] = Field(None, ge=0, description="Number of lounges")
     
     # Connectivity
-    ground_transport: List[str] = Field(default=[], description="Available ground transport modes")
-    nearby_airports: List[str] = Field(default=[], description="Nearby airport codes")
-    
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(None)
+    ground_transport: StrSet = Field(default_factory=frozenset, description="Available ground transport modes")
+    nearby_airports: List[CodeStr] = Field(default=[], description="Nearby airport codes")
 
 
-class Country(BaseMongoDbDocumentSchema):
+class Country(BaseMongoDbDocumentSchema, TimestampedMixin):
+    model_config = _REFERENCE_CONFIG
+    
     # Country identification
-    iso_code: str = Field(..., max_length=2, description="ISO 3166-1 alpha-2 code")
-    iso3_code: str = Field(..., max_length=3, description="ISO 3166-1 alpha-3 code")
-    name: str = Field(..., max_length=100, description="Country name")
-    official_name: Optional[str] = Field(None, max_length=200, description="Official country name")
+    iso_code: Code2 = Field(..., description="ISO 3166-1 alpha-2 code")
+    iso3_code: Code3 = Field(..., description="ISO 3166-1 alpha-3 code")
+    name: Str100 = Field(..., description="Country name")
+    official_name: Optional[Str200] = Field(None, description="Official country name")
     
     # Geographic information
-    continent: str = Field(..., max_length=50, description="Continent name")
-    region: str = Field(..., max_length=100, description="Geographic region")
-    subregion: Optional[str] = Field(None, max_length=100, description="Geographic subregion")
+    continent: Str50 = Field(..., description="Continent name")
+    region: Str100 = Field(..., description="Geographic region")
+    subregion: Optional[Str100] = Field(None, description="Geographic subregion")
     
     # Political and economic
-    capital_city: Optional[str] = Field(None, max_length=100, description="Capital city")
-    currency_code: Optional[str] = Field(None, max_length=3, description="Primary currency code")
-    languages: List[str] = Field(default=[], description="Official languages")
+    capital_city: Optional[Str100] = Field(None, description="Capital city")
+    currency_code: Optional[Code3] = Field(None, description="Primary currency code")
+    languages: StrSet = Field(default_factory=frozenset, description="Official languages")
     
     # Travel and aviation
-    visa_required_countries: List[str] = Field(default=[], description="Countries requiring visa")
-    visa_free_countries: List[str] = Field(default=[], description="Countries with visa-free travel")
-    major_airports: List[str] = Field(default=[], description="Major airport codes")
-    
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(None)
+    visa_required_countries: CodeSet = Field(default_factory=frozenset, description="Countries requiring visa")
+    visa_free_countries: CodeSet = Field(default_factory=frozenset, description="Countries with visa-free travel")
+    major_airports: CodeSet = Field(default_factory=frozenset, description="Major airport codes")
 
 
-class Currency(BaseMongoDbDocumentSchema):  
+class Currency(BaseMongoDbDocumentSchema, TimestampedMixin):
+    model_config = _REFERENCE_CONFIG
+    
     # Currency identification
-    code: str = Field(..., max_length=3, description="ISO 4217 currency code")
-    name: str = Field(..., max_length=100, description="Currency name")
-    symbol: str = Field(..., max_length=10, description="Currency symbol")
+    code: Code3 = Field(..., description="ISO 4217 currency code")
+    name: Str100 = Field(..., description="Currency name")
+    symbol: Str10 = Field(..., description="Currency symbol")
     
     # Formatting information
     decimal_places: int = Field(default=2, ge=0, le=4, description="Number of decimal places")
-    decimal_separator: str = Field(default=".", max_length=1, description="Decimal separator")
-    thousands_separator: str = Field(default=",", max_length=1, description="Thousands separator")
+    decimal_separator: Str1 = Field(default=".", description="Decimal separator")
+    thousands_separator: Str1 = Field(default=",", description="Thousands separator")
     
     # Exchange rate information (relative to USD)
     exchange_rate_to_usd: float = Field(..., gt=0, description="Exchange rate to USD")
-    last_updated: datetime = Field(default_factory=datetime.utcnow, description="Last rate update")
+    last_updated: datetime = Field(default_factory=_now, description="Last rate update")
     
     # Regional information
-    countries: List[str] = Field(default=[], description="Countries using this currency")
+    countries: CodeSet = Field(default_factory=frozenset, description="Countries using this currency")
     is_major_currency: bool = Field(default=False, description="Major trading currency")
-    
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(None)
 
 
-class SearchRequest(BaseMongoDbDocumentSchema):
+# High-volume transactional schemas. The seeder builds these with model_construct(),
+# so they must not rely on validators to coerce or fill in values; every field
+# without a default is supplied explicitly, already of its declared type.
+class SearchRequest(BaseMongoDbDocumentSchema, TimestampedMixin):
     # Search identification
-    search_id: str = Field(..., max_length=50, description="Unique search identifier")
-    session_id: Optional[str] = Field(None, max_length=100, description="User session identifier")
-    user_id: Optional[str] = Field(None, max_length=50, description="User identifier")
+    search_id: Str50 = Field(..., description="Unique search identifier")
+    session_id: Optional[Str100] = Field(None, description="User session identifier")
+    user_id: Optional[Str50] = Field(None, description="User identifier")
     
     # Search criteria
-    origin_code: str = Field(..., max_length=3, description="Origin airport/city code")
-    destination_code: str = Field(..., max_length=3, description="Destination airport/city code")
+    origin_code: Code3 = Field(..., description="Origin airport/city code")
+    destination_code: Code3 = Field(..., description="Destination airport/city code")
     departure_date: datetime = Field(..., description="Departure date")
     return_date: Optional[datetime] = Field(None, description="Return date for round-trip")
     
@@ -271,30 +408,45 @@ class SearchRequest(BaseMongoDbDocumentSchema):
     travel_class: Optional[TravelClass] = Field(None, description="Preferred travel class")
     non_stop: bool = Field(default=False, description="Non-stop flights only")
     max_price: Optional[int] = Field(None, ge=1, description="Maximum price per traveler")
-    currency_code: str = Field(default="USD", max_length=3, description="Preferred currency")
+    currency_code: Code3 = Field(default="USD", description="Preferred currency")
     
     # Airline preferences
-    included_airlines: List[str] = Field(default=[], description="Preferred airline codes")
-    excluded_airlines: List[str] = Field(default=[], description="Excluded airline codes")
+    included_airlines: List[CodeStr] = Field(default=[], description="Preferred airline codes")
+    excluded_airlines: List[CodeStr] = Field(default=[], description="Excluded airline codes")
     
     # Search metadata
-    search_timestamp: datetime = Field(default_factory=datetime.utcnow)
-    ip_address: Optional[str] = Field(None, max_length=45, description="Client IP address")
-    user_agent: Optional[str] = Field(None, max_length=500, description="Client user agent")
+    search_timestamp: datetime = Field(default_factory=_now)
+    ip_address: Optional[Str45] = Field(None, description="Client IP address")
+    user_agent: Optional[Str500] = Field(None, description="Client user agent")
     
     # Results information
     results_count: int = Field(default=0, ge=0, description="Number of results returned")
     response_time_ms: Optional[int] = Field(None, ge=0, description="Response time in milliseconds")
     status: SearchStatus = Field(default=SearchStatus.ACTIVE)
-    
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(None)
 
 
-class FlightOffer(BaseMongoDbDocumentSchema):
+def summarize_itineraries(itineraries: List[Itinerary]) -> Dict[str, Any]:
+    """Top-level route summary of a flight offer's itineraries, for indexed route queries
+
+    Origin and destination describe the outbound (first) itinerary, so round trips are
+    found by their outbound route; the arrival date is that of the last segment overall.
+    """
+    outbound = itineraries[0]["segments"]
+    last_arrival = itineraries[-1]["segments"][-1].get("arrival", {}).get("at")
+    first_departure = outbound[0].get("departure", {}).get("at")
+    return {
+        "first_origin": outbound[0].get("departure", {}).get("iataCode"),
+        "last_destination": outbound[-1].get("arrival", {}).get("iataCode"),
+        "first_departure_date": datetime.fromisoformat(first_departure) if first_departure else None,
+        "last_arrival_date": datetime.fromisoformat(last_arrival) if last_arrival else None,
+        "segment_count": sum(len(itinerary["segments"]) for itinerary in itineraries),
+        "stops_count": sum(len(itinerary["segments"]) - 1 for itinerary in itineraries),
+    }
+
+
+class FlightOffer(BaseMongoDbDocumentSchema, TimestampedMixin):
     # Offer identification
-    offer_id: str = Field(..., max_length=50, description="Flight offer identifier")
+    offer_id: Str50 = Field(..., description="Flight offer identifier")
     search_request_id: Optional[PyObjectId] = Field(None, description="Associated search request")
     source: FlightOfferSource = Field(default=FlightOfferSource.GDS)
     
@@ -309,33 +461,41 @@ class FlightOffer(BaseMongoDbDocumentSchema):
     booking_deadline: Optional[datetime] = Field(None, description="Booking deadline")
     
     # Itinerary information
-    itineraries: List[Dict[str, Any]] = Field(..., description="Flight itineraries")
+    itineraries: List[Itinerary] = Field(..., description="Flight itineraries")
     total_duration: Optional[str] = Field(None, description="Total journey duration (ISO 8601)")
     
+    # Route summary denormalized from itineraries (see summarize_itineraries)
+    first_origin: Optional[Code3] = Field(None, description="Origin of the outbound itinerary")
+    last_destination: Optional[Code3] = Field(None, description="Destination of the outbound itinerary")
+    first_departure_date: Optional[datetime] = Field(None, description="Departure time of the first segment")
+    last_arrival_date: Optional[datetime] = Field(None, description="Arrival time of the last segment")
+    segment_count: Optional[int] = Field(None, ge=1, description="Segments across all itineraries")
+    stops_count: Optional[int] = Field(None, ge=0, description="Connections across all itineraries")
+    
     # Pricing information
     price: Dict[str, Any] = Field(..., description="Complete pricing breakdown")
-    currency_code: str = Field(..., max_length=3, description="Price currency")
+    currency_code: Code3 = Field(..., description="Price currency")
     total_price: float = Field(..., ge=0, description="Total price for all travelers")
     base_price: float = Field(..., ge=0, description="Base fare excluding taxes")
     taxes_and_fees: float = Field(default=0.0, ge=0, description="Total taxes and fees")
     
     # Traveler pricing
-    traveler_pricings: List[Dict[str, Any]] = Field(..., description="Per-traveler pricing details")
+    traveler_pricings: List[TravelerPricing] = Field(..., description="Per-traveler pricing details")
     
     # Airline information
-    validating_airline_codes: List[str] = Field(..., description="Validating airlines")
-    operating_airlines: List[str] = Field(default=[], description="Operating airlines")
-    marketing_airlines: List[str] = Field(default=[], description="Marketing airlines")
+    validating_airline_codes: List[CodeStr] = Field(..., description="Validating airlines")
+    operating_airlines: List[CodeStr] = Field(default=[], description="Operating airlines")
+    marketing_airlines: List[CodeStr] = Field(default=[], description="Marketing airlines")
     
     # Fare details
     fare_type: List[str] = Field(default=["PUBLISHED"], description="Fare type classification")
-    fare_family: Optional[str] = Field(None, max_length=100, description="Branded fare family")
+    fare_family: Optional[Str100] = Field(None, description="Branded fare family")
     refundable: Optional[bool] = Field(None, description="Refundable fare")
     exchangeable: Optional[bool] = Field(None, description="Exchangeable fare")
     
     # Service inclusions
     included_checked_bags_only: bool = Field(default=False)
-    additional_services: List[Dict[str, Any]] = Field(default=[], description="Available add-ons")
+    additional_services: List[AdditionalService] = Field(default=[], description="Available add-ons")
     
     # Booking constraints
     advance_purchase_required: Optional[int] = Field(None, description="Advance purchase days")
@@ -343,75 +503,79 @@ class FlightOffer(BaseMongoDbDocumentSchema):
     maximum_stay_allowed: Optional[int] = Field(None, description="Maximum stay days")
     
     # Availability and booking
-    availability_source: str = Field(default="GDS", max_length=50)
+    availability_source: Str50 = Field(default="GDS")
     booking_class_availability: Dict[str, int] = Field(default={}, description="Available seats by class")
     
     # Performance metrics
     search_score: Optional[float] = Field(None, ge=0, le=100, description="Relevance score")
     popularity_score: Optional[float] = Field(None, ge=0, le=100, description="Popularity ranking")
-    
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(None)
     expires_at: Optional[datetime] = Field(None, description="Offer expiration time")
 
+    @model_validator(mode="after")
+    def fill_itinerary_summary(self):
+        """Derive the route summary from itineraries when it was not supplied"""
+        if self.first_origin is None and self.itineraries and self.itineraries[0]["segments"]:
+            for field, value in summarize_itineraries(self.itineraries).items():
+                setattr(self, field, value)
+        return self
+
 
-class Booking(BaseMongoDbDocumentSchema):
+class Booking(BaseMongoDbDocumentSchema, TimestampedMixin):
     # Booking identification
-    booking_reference: str = Field(..., max_length=20, description="PNR or booking reference")
-    confirmation_number: str = Field(..., max_length=20, description="Confirmation number")
+    booking_reference: Str20 = Field(..., description="PNR or booking reference")
+    confirmation_number: Str20 = Field(..., description="Confirmation number")
     flight_offer_id: PyObjectId = Field(..., description="Associated flight offer")
     search_request_id: Optional[PyObjectId] = Field(None, description="Original search request")
     
     # Customer information
-    customer_id: Optional[str] = Field(None, max_length=50, description="Customer identifier")
-    contact_email: str = Field(..., max_length=255, description="Contact email")
-    contact_phone: str = Field(..., max_length=50, description="Contact phone")
+    customer_id: Optional[Str50] = Field(None, description="Customer identifier")
+    contact_email: Str255 = Field(..., description="Contact email")
+    contact_phone: Str50 = Field(..., description="Contact phone")
     
     # Traveler manifest
-    travelers: List[Dict[str, Any]] = Field(..., description="Traveler details")
-    lead_traveler: Dict[str, Any] = Field(..., description="Primary traveler information")
+    travelers: List[Traveler] = Field(..., description="Traveler details")
+    lead_traveler: Traveler = Field(..., description="Primary traveler information")
     
     # Booking status and timeline
     status: BookingStatus = Field(default=BookingStatus.BOOKED)
-    booking_date: datetime = Field(default_factory=datetime.utcnow)
+    booking_date: datetime = Field(default_factory=_now)
     ticketing_deadline: Optional[datetime] = Field(None, description="Ticketing deadline")
     departure_date: datetime = Field(..., description="First departure date")
     
     # Payment information
     total_amount_paid: float = Field(..., ge=0, description="Total amount paid")
-    payment_currency: str = Field(..., max_length=3, description="Payment currency")
-    payment_method: str = Field(..., max_length=50, description="Payment method")
-    payment_status: str = Field(default="pending", max_length=50)
+    payment_currency: Code3 = Field(..., description="Payment currency")
+    payment_method: Str50 = Field(..., description="Payment method")
+    payment_status: Str50 = Field(default="pending")
     
     # Ticketing information
     ticket_numbers: List[str] = Field(default=[], description="Issued ticket numbers")
     ticketing_date: Optional[datetime] = Field(None, description="Ticketing completion date")
-    validating_carrier: str = Field(..., max_length=2, description="Validating airline")
+    validating_carrier: Code2 = Field(..., description="Validating airline")
     
     # Special services and requests
-    special_service_requests: List[Dict[str, Any]] = Field(default=[], description="SSRs")
+    special_service_requests: List[SpecialServiceRequest] = Field(default=[], description="SSRs")
     meal_preferences: List[str] = Field(default=[], description="Meal requests")
     seat_preferences: List[str] = Field(default=[], description="Seat assignments")
     
     # Modifications and changes
-    modification_history: List[Dict[str, Any]] = Field(default=[], description="Change history")
+    modification_history: List[Modification] = Field(default=[], description="Change history")
     cancellation_date: Optional[datetime] = Field(None, description="Cancellation date")
     refund_amount: Optional[float] = Field(None, ge=0, description="Refund amount")
     
     # Agency and booking source
-    booking_source: str = Field(default="API", max_length=100, description="Booking channel")
-    agency_code: Optional[str] = Field(None, max_length=20, description="Travel agency code")
-    agent_id: Optional[str] = Field(None, max_length=50, description="Booking agent")
-    
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(None)
+    booking_source: Str100 = Field(default="API", description="Booking channel")
+    agency_code: Optional[Str20] = Field(None, description="Travel agency code")
+    agent_id: Optional[Str50] = Field(None, description="Booking agent")
 
 
 # Collection schema definitions
+# Indexes on reference data that is only queried for active (or in-production) entries
+# are partial on that flag rather than carrying it as a trailing key, so inactive
+# documents take no index space.
 class AirlineCollectionSchema(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = Airline.model_json_schema()
+    collection_name: str = "airlines"
+    document_schema: Optional[Type[BaseModel]] = Airline
     indexes: List[IndexDefinition] = [
         IndexDefinition(
             name="iata_code_unique",
@@ -424,22 +588,26 @@ class AirlineCollectionSchema(BaseCollectionSchema):
         ),
         IndexDefinition(
             name="country_active",
-            keys={"country_code": IndexDirection.ASCENDING, "is_active": IndexDirection.ASCENDING},
+            keys={"country_code": IndexDirection.ASCENDING},
+            partial_filter_expression={"is_active": True},
         ),
         IndexDefinition(
             name="alliance_carriers",
-            keys={"alliance": IndexDirection.ASCENDING, "is_active": IndexDirection.ASCENDING},
+            keys={"alliance": IndexDirection.ASCENDING},
+            partial_filter_expression={"is_active": True},
         ),
         IndexDefinition(
             name="carrier_type",
-            keys={"low_cost_carrier": IndexDirection.ASCENDING, "is_active": IndexDirection.ASCENDING},
+            keys={"low_cost_carrier": IndexDirection.ASCENDING},
+            partial_filter_expression={"is_active": True},
         ),
     ]
     description: str = "Airlines and carriers with operational details"
 
 
 class AircraftCollectionSchema(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = Aircraft.model_json_schema()
+    collection_name: str = "aircraft"
+    document_schema: Optional[Type[BaseModel]] = Aircraft
     indexes: List[IndexDefinition] = [
         IndexDefinition(
             name="iata_code_unique",
@@ -456,14 +624,16 @@ class AircraftCollectionSchema(BaseCollectionSchema):
         ),
         IndexDefinition(
             name="production_status",
-            keys={"in_production": IndexDirection.ASCENDING, "first_flight_year": IndexDirection.DESCENDING},
+            keys={"first_flight_year": IndexDirection.DESCENDING},
+            partial_filter_expression={"in_production": True},
         ),
     ]
     description: str = "Aircraft types and specifications"
 
 
 class AirportCollectionSchema(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = Airport.model_json_schema()
+    collection_name: str = "airports"
+    document_schema: Optional[Type[BaseModel]] = Airport
     indexes: List[IndexDefinition] = [
         IndexDefinition(
             name="iata_code_unique",
@@ -476,15 +646,17 @@ class AirportCollectionSchema(BaseCollectionSchema):
         ),
         IndexDefinition(
             name="location_2dsphere",
-            keys={"latitude": IndexDirection.ASCENDING, "longitude": IndexDirection.ASCENDING},
+            keys={"location": IndexDirection.GEO2DSPHERE},
         ),
         IndexDefinition(
             name="hub_airlines",
-            keys={"hub_for_airlines": IndexDirection.ASCENDING, "is_active": IndexDirection.ASCENDING},
+            keys={"hub_for_airlines": IndexDirection.ASCENDING},
+            partial_filter_expression={"is_active": True},
         ),
         IndexDefinition(
             name="passenger_volume",
-            keys={"annual_passengers": IndexDirection.DESCENDING, "is_active": IndexDirection.ASCENDING},
+            keys={"annual_passengers": IndexDirection.DESCENDING},
+            partial_filter_expression={"is_active": True},
         ),
         IndexDefinition(
             name="name_text_search",
@@ -495,7 +667,8 @@ class AirportCollectionSchema(BaseCollectionSchema):
 
 
 class CountryCollectionSchema(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = Country.model_json_schema()
+    collection_name: str = "countries"
+    document_schema: Optional[Type[BaseModel]] = Country
     indexes: List[IndexDefinition] = [
         IndexDefinition(
             name="iso_code_unique",
@@ -515,7 +688,8 @@ class CountryCollectionSchema(BaseCollectionSchema):
 
 
 class CurrencyCollectionSchema(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = Currency.model_json_schema()
+    collection_name: str = "currencies"
+    document_schema: Optional[Type[BaseModel]] = Currency
     indexes: List[IndexDefinition] = [
         IndexDefinition(
             name="code_unique",
@@ -531,7 +705,8 @@ class CurrencyCollectionSchema(BaseCollectionSchema):
 
 
 class SearchRequestCollectionSchema(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = SearchRequest.model_json_schema()
+    collection_name: str = "search_requests"
+    document_schema: Optional[Type[BaseModel]] = SearchRequest
     indexes: List[IndexDefinition] = [
         IndexDefinition(
             name="search_id_unique",
@@ -563,12 +738,18 @@ class SearchRequestCollectionSchema(BaseCollectionSchema):
             name="search_timeline",
             keys={"search_timestamp": IndexDirection.DESCENDING, "status": IndexDirection.ASCENDING},
         ),
+        IndexDefinition(
+            name="search_ttl",
+            keys={"search_timestamp": IndexDirection.ASCENDING},
+            ttl_seconds=90 * 86400,  # search history is kept for 90 days
+        ),
     ]
     description: str = "Flight search requests and patterns"
 
 
 class FlightOfferCollectionSchema(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = FlightOffer.model_json_schema()
+    collection_name: str = "flight_offers"
+    document_schema: Optional[Type[BaseModel]] = FlightOffer
     indexes: List[IndexDefinition] = [
         IndexDefinition(
             name="offer_id_unique",
@@ -579,6 +760,15 @@ class FlightOfferCollectionSchema(BaseCollectionSchema):
             name="search_results",
             keys={"search_request_id": IndexDirection.ASCENDING, "total_price": IndexDirection.ASCENDING},
         ),
+        IndexDefinition(
+            name="route_price",
+            keys={
+                "first_origin": IndexDirection.ASCENDING,
+                "last_destination": IndexDirection.ASCENDING,
+                "first_departure_date": IndexDirection.ASCENDING,
+                "total_price": IndexDirection.ASCENDING,
+            },
+        ),
         IndexDefinition(
             name="price_currency",
             keys={"currency_code": IndexDirection.ASCENDING, "total_price": IndexDirection.ASCENDING},
@@ -600,12 +790,18 @@ class FlightOfferCollectionSchema(BaseCollectionSchema):
             keys={"refundable": IndexDirection.ASCENDING, "exchangeable": IndexDirection.ASCENDING},
             sparse=True,
         ),
+        IndexDefinition(
+            name="offer_ttl",
+            keys={"expires_at": IndexDirection.ASCENDING},
+            ttl_seconds=30 * 86400,  # expired offers are removed 30 days after expires_at
+        ),
     ]
     description: str = "Flight offers with pricing and availability"
 
 
 class BookingCollectionSchema(BaseCollectionSchema):
-    json_schema: Dict[str, Any] = Booking.model_json_schema()
+    collection_name: str = "bookings"
+    document_schema: Optional[Type[BaseModel]] = Booking
     indexes: List[IndexDefinition] = [
         IndexDefinition(
             name="booking_reference_unique",
@@ -643,17 +839,22 @@ class BookingCollectionSchema(BaseCollectionSchema):
 
 
 # Complete database schema
+# Built once at import; every MongoDbDataSchema shares these collection schemas by
+# reference instead of pydantic deep-copying a mutable default per instance
+_COLLECTIONS: Dict[str, BaseCollectionSchema] = {
+    "airlines": AirlineCollectionSchema(),
+    "aircraft": AircraftCollectionSchema(),
+    "airports": AirportCollectionSchema(),
+    "countries": CountryCollectionSchema(),
+    "currencies": CurrencyCollectionSchema(),
+    "search_requests": SearchRequestCollectionSchema(),
+    "flight_offers": FlightOfferCollectionSchema(),
+    "bookings": BookingCollectionSchema(),
+}
+
+
 class MongoDbDataSchema(BaseMongoDbSchema):
-    collections: Dict[str, BaseCollectionSchema] = {
-        "airlines": AirlineCollectionSchema(),
-        "aircraft": AircraftCollectionSchema(),
-        "airports": AirportCollectionSchema(),
-        "countries": CountryCollectionSchema(),
-        "currencies": CurrencyCollectionSchema(),
-        "search_requests": SearchRequestCollectionSchema(),
-        "flight_offers": FlightOfferCollectionSchema(),
-        "bookings": BookingCollectionSchema(),
-    }
+    collections: Dict[str, BaseCollectionSchema] = Field(default_factory=lambda: _COLLECTIONS)
     database_name: str = "amadeus_flight_booking"
     description: str = "Amadeus Flight Offers Search API database with comprehensive flight booking and search capabilities"
 
@@ -11,11 +11,13 @@ Amadeus-style flight booking database, including:
 - Comprehensive pricing and route information
 """
 
+import io
 import os
 import sys
 from datetime import datetime
 from typing import Dict, Any
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Load environment variables from .env file
@@ -33,19 +35,21 @@ from db_schema import database_schema
 
 def print_header():
     """Print the application header with aviation theme"""
-    print("✈️ AMADEUS FLIGHT BOOKING DATABASE")
-    print("=" * 70)
-    print("Comprehensive Flight Search and Booking Database System")
-    print("Based on Amadeus Flight Offers Search API v2.2.0")
-    print()
-    print("🌍 Features:")
-    print("  • Global airline and airport reference data")
-    print("  • Realistic flight search requests and offers")
-    print("  • Complete booking transactions with traveler details")
-    print("  • Multi-currency pricing and fare calculations")
-    print("  • Aircraft specifications and route optimization")
-    print("  • Travel agency and corporate booking workflows")
-    print()
+    buf = io.StringIO()
+    print("✈️ AMADEUS FLIGHT BOOKING DATABASE", file=buf)
+    print("=" * 70, file=buf)
+    print("Comprehensive Flight Search and Booking Database System", file=buf)
+    print("Based on Amadeus Flight Offers Search API v2.2.0", file=buf)
+    print(file=buf)
+    print("🌍 Features:", file=buf)
+    print("  • Global airline and airport reference data", file=buf)
+    print("  • Realistic flight search requests and offers", file=buf)
+    print("  • Complete booking transactions with traveler details", file=buf)
+    print("  • Multi-currency pricing and fare calculations", file=buf)
+    print("  • Aircraft specifications and route optimization", file=buf)
+    print("  • Travel agency and corporate booking workflows", file=buf)
+    print(file=buf)
+    sys.stdout.write(buf.getvalue())
 
 
 def validate_environment():
@@ -94,19 +98,44 @@ def run_database_setup():
     print()
 
     try:
+        # Reuse the existing data when it was seeded from the current schema, is fully
+        # indexed and is recent enough that the TTL indexes have not deleted any of it
+        fingerprint = seeder.schema_fingerprint()
+        force_reseed = os.getenv("FORCE_RESEED", "").lower() in ["true", "1", "yes"]
+        if not force_reseed and seeder.seed_is_current(fingerprint):
+            print("♻️  Existing database matches the current schema; skipping reseed")
+            print("  (set FORCE_RESEED=1 to rebuild it)")
+            seeder.load_seeded_ids()
+            results = seeder.get_collection_stats()
+            results["total_documents"] = sum(results.values())
+            return results
+
         # Drop existing database if it exists
         print("🗑️  Preparing clean database environment...")
         seeder.drop_database()
         print("  ✅ Previous database cleared")
 
-        # Create database schema
+        # Create collections; indexes are built once the data is loaded
         print("🏗️  Creating database schema...")
-        seeder.create_database_schema()
-        print("  ✅ Database schema created with indexes")
+        seeder.create_collections_only()
+        print("  ✅ Database collections created")
+
+        # Run the seeding process; independent collections are seeded concurrently
+        print()
+        results = seeder.run_seeding(
+            workers=int(os.getenv("SEED_PARALLELISM", "8")),
+            batch_size=int(os.getenv("BULK_BATCH_SIZE", "5000")),
+        )
 
-        # Run the seeding process
+        # Build every index in a single pass over the loaded data
         print()
-        results = seeder.run_seeding()
+        print("🗂️  Building indexes...")
+        if seeder.create_indexes():
+            print("  ⚠️ Some indexes could not be built; the next run will reseed")
+        else:
+            print("  ✅ Indexes created")
+            # Only a fully indexed seed is recorded as reusable
+            seeder.record_fingerprint(fingerprint)
 
         return results
 
@@ -122,9 +151,18 @@ def run_validation_checks():
     print("🔍 Running validation checks...")
 
     try:
-        # Check collection counts
-        collection_counts = seeder.get_collection_stats()
+        # The checks are independent read-only queries, so they run concurrently on the
+        # seeder's (thread-safe) client; results are printed in order below
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            counts_future = executor.submit(seeder.get_collection_stats)
+            references_future = executor.submit(seeder.validate_references)
+            aviation_future = executor.submit(seeder.validate_aviation_data_patterns)
+
+            collection_counts = counts_future.result()
+            validation_results = references_future.result()
+            aviation_validation = aviation_future.result()
 
+        # Check collection counts
         print("  📊 Collection Statistics:")
         for collection, count in collection_counts.items():
             print(f"    {collection}: {count:,} documents")
@@ -133,7 +171,6 @@ def run_validation_checks():
         print("\n  🔗 Data Integrity Checks:")
 
         # Check for orphaned references
-        validation_results = seeder.validate_references()
         for check, result in validation_results.items():
             status = "✅" if result["valid"] else "⚠️"
             print(f"    {status} {check}: {result['message']}")
@@ -142,7 +179,6 @@ def run_validation_checks():
         print("\n  ✈️ Aviation Data Pattern Validation:")
 
         # Check IATA code formats
-        aviation_validation = seeder.validate_aviation_data_patterns()
         for check, result in aviation_validation.items():
             status = "✅" if result["valid"] else "⚠️"
             print(f"    {status} {check}: {result['message']}")
@@ -162,23 +198,35 @@ def generate_sample_queries():
     print("📈 Executing sample queries...")
 
     try:
+        # The analyses are independent aggregations; run them concurrently and print
+        # their results in order
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            route_future = executor.submit(seeder.analyze_popular_routes)
+            airline_future = executor.submit(seeder.analyze_airline_performance)
+            booking_future = executor.submit(seeder.analyze_booking_conversions)
+            aircraft_future = executor.submit(seeder.analyze_aircraft_utilization)
+            geo_future = executor.submit(seeder.analyze_geographic_patterns)
+
+            route_stats = route_future.result()
+            airline_stats = airline_future.result()
+            booking_stats = booking_future.result()
+            aircraft_stats = aircraft_future.result()
+            geo_stats = geo_future.result()
+
         # Sample query 1: Popular flight routes analysis
         print("\n  🌍 Popular Flight Routes Analysis:")
-        route_stats = seeder.analyze_popular_routes()
         print(f"    • Most searched route: {route_stats['most_popular_route']}")
         print(f"    • Total unique routes: {route_stats['unique_routes']:,}")
         print(f"    • Average searches per route: {route_stats['avg_searches_per_route']:.1f}")
 
         # Sample query 2: Airline performance metrics
         print("\n  🏢 Airline Performance Analysis:")
-        airline_stats = seeder.analyze_airline_performance()
         print(f"    • Total active airlines: {airline_stats['active_airlines']:,}")
         print(f"    • Top airline by offers: {airline_stats['top_airline_by_offers']}")
         print(f"    • Average price range: ${airline_stats['avg_price_low']:.0f} - ${airline_stats['avg_price_high']:.0f}")
 
         # Sample query 3: Booking conversion analysis
         print("\n  💳 Booking Conversion Analysis:")
-        booking_stats = seeder.analyze_booking_conversions()
         print(f"    • Total bookings: {booking_stats['total_bookings']:,}")
         print(f"    • Average booking value: ${booking_stats['avg_booking_value']:.2f}")
         print(f"    • Conversion rate: {booking_stats['conversion_rate']:.2%}")
@@ -186,14 +234,12 @@ def generate_sample_queries():
 
         # Sample query 4: Aircraft utilization
         print("\n  🛩️ Aircraft Fleet Analysis:")
-        aircraft_stats = seeder.analyze_aircraft_utilization()
         print(f"    • Aircraft types in use: {aircraft_stats['active_aircraft_types']:,}")
         print(f"    • Most utilized aircraft: {aircraft_stats['most_used_aircraft']}")
         print(f"    • Average fleet capacity: {aircraft_stats['avg_capacity']:.0f} passengers")
 
         # Sample query 5: Geographic distribution
         print("\n  🗺️ Geographic Distribution:")
-        geo_stats = seeder.analyze_geographic_patterns()
         print(f"    • Countries served: {geo_stats['countries_served']:,}")
         print(f"    • Busiest continent: {geo_stats['busiest_continent']}")
         print(f"    • Average airports per country: {geo_stats['avg_airports_per_country']:.1f}")
@@ -210,17 +256,19 @@ def generate_sample_queries():
 
 def print_usage_examples():
     """Print usage examples and next steps"""
-    print("📋 NEXT STEPS AND USAGE EXAMPLES")
-    print("=" * 50)
+    buf = io.StringIO()
+    masked_connection_string = seeder.get_masked_connection_string()
+    print("📋 NEXT STEPS AND USAGE EXAMPLES", file=buf)
+    print("=" * 50, file=buf)
 
-    print("\n🔌 MongoDB Connection:")
-    print(f"  mongo {seeder.get_masked_connection_string()}/{database_schema.database_name}")
-    print("  # Or with MongoDB Compass:")
-    print(f"  {seeder.get_masked_connection_string()}")
+    print("\n🔌 MongoDB Connection:", file=buf)
+    print(f"  mongo {masked_connection_string}/{database_schema.database_name}", file=buf)
+    print("  # Or with MongoDB Compass:", file=buf)
+    print(f"  {masked_connection_string}", file=buf)
 
-    print("\n✈️ Sample Flight Booking Queries:")
+    print("\n✈️ Sample Flight Booking Queries:", file=buf)
 
-    print("\n  1. Find cheapest flights between popular routes:")
+    print("\n  1. Find cheapest flights between popular routes:", file=buf)
     print("""  db.flight_offers.aggregate([
     { $match: { 
         "itineraries.segments.departure.iataCode": "JFK",
@@ -235,9 +283,9 @@ def print_usage_examples():
         validating_airline_codes: 1,
         "itineraries.duration": 1
     }}
-  ])""")
+  ])""", file=buf)
 
-    print("\n  2. Analyze booking patterns by travel class:")
+    print("\n  2. Analyze booking patterns by travel class:", file=buf)
     print("""  db.bookings.aggregate([
     { $unwind: "$travelers" },
     { $group: {
@@ -247,9 +295,9 @@ def print_usage_examples():
         total_revenue: { $sum: "$total_amount_paid" }
     }},
     { $sort: { total_revenue: -1 }}
-  ])""")
+  ])""", file=buf)
 
-    print("\n  3. Popular aircraft types by route distance:")
+    print("\n  3. Popular aircraft types by route distance:", file=buf)
     print("""  db.flight_offers.aggregate([
     { $lookup: {
         from: "aircraft",
@@ -268,9 +316,9 @@ def print_usage_examples():
     }},
     { $sort: { total_flights: -1 }},
     { $limit: 10 }
-  ])""")
+  ])""", file=buf)
 
-    print("\n  4. Search request trends and conversion rates:")
+    print("\n  4. Search request trends and conversion rates:", file=buf)
     print("""  db.search_requests.aggregate([
     { $group: {
         _id: {
@@ -283,9 +331,9 @@ def print_usage_examples():
     }},
     { $sort: { search_count: -1 }},
     { $limit: 20 }
-  ])""")
+  ])""", file=buf)
 
-    print("\n  5. Revenue analysis by airline and currency:")
+    print("\n  5. Revenue analysis by airline and currency:", file=buf)
     print("""  db.bookings.aggregate([
     { $group: {
         _id: {
@@ -298,21 +346,23 @@ def print_usage_examples():
     }},
     { $sort: { total_revenue: -1 }},
     { $limit: 15 }
-  ])""")
-
-    print("\n📚 Database Schema:")
-    print("  • airlines: Airline carriers with operational details")
-    print("  • aircraft: Aircraft types and specifications")
-    print("  • airports: Global airport directory with coordinates")
-    print("  • countries: Geographic reference data")
-    print("  • currencies: Exchange rates and formatting")
-    print("  • search_requests: Flight search patterns and analytics")
-    print("  • flight_offers: Available flights with pricing")
-    print("  • bookings: Completed reservations and transactions")
-
-    print(f"\n🎯 Database: {database_schema.database_name}")
-    print(f"📝 Total Collections: {len(database_schema.collections)}")
-    print("🌟 Optimized for high-volume flight booking operations")
+  ])""", file=buf)
+
+    print("\n📚 Database Schema:", file=buf)
+    print("  • airlines: Airline carriers with operational details", file=buf)
+    print("  • aircraft: Aircraft types and specifications", file=buf)
+    print("  • airports: Global airport directory with coordinates", file=buf)
+    print("  • countries: Geographic reference data", file=buf)
+    print("  • currencies: Exchange rates and formatting", file=buf)
+    print("  • search_requests: Flight search patterns and analytics", file=buf)
+    print("  • flight_offers: Available flights with pricing", file=buf)
+    print("  • bookings: Completed reservations and transactions", file=buf)
+
+    print(f"\n🎯 Database: {database_schema.database_name}", file=buf)
+    print(f"📝 Total Collections: {len(database_schema.collections)}", file=buf)
+    print("🌟 Optimized for high-volume flight booking operations", file=buf)
+
+    sys.stdout.write(buf.getvalue())
 
 
 def main():
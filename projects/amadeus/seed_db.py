@@ -1,26 +1,66 @@
 """Database seeder for Amadeus Flight Booking Database"""
 
+import hashlib
+import multiprocessing
 import os
 import random
 import string
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict, Any, Optional
+from pydantic import TypeAdapter
 from pymongo import MongoClient
 from faker import Faker
 import uuid
 
 # Import the database schema
+import db_schema
 from db_schema import (
     database_schema,
     Airline, Aircraft, Airport, Country, Currency,
     SearchRequest, FlightOffer, Booking,
     TravelClass, TravelerType, FareOption, BookingStatus, SearchStatus,
-    FlightOfferSource
+    FlightOfferSource, summarize_itineraries
 )
 
 # Import base seeder class
 from mimoid import DatabaseSeeder
 
+# Reference collections are generated as plain rows and validated in one call per collection
+COUNTRY_LIST = TypeAdapter(List[Country])
+CURRENCY_LIST = TypeAdapter(List[Currency])
+AIRLINE_LIST = TypeAdapter(List[Airline])
+AIRCRAFT_LIST = TypeAdapter(List[Aircraft])
+AIRPORT_LIST = TypeAdapter(List[Airport])
+
+# Enum members drawn from in the seeding loops, materialized once rather than per document
+TRAVEL_CLASSES = tuple(TravelClass)
+TRAVELER_TYPES = tuple(TravelerType)
+FARE_OPTIONS = tuple(FareOption)
+SEARCH_STATUSES = tuple(SearchStatus)
+
+# Collection -> (document count, seeder attribute holding its generated ids, collections
+# whose ids it draws on). Collections without dependencies can be seeded concurrently.
+SEED_PLAN = {
+    "countries": (50, "country_ids", ()),
+    "currencies": (20, "currency_ids", ()),
+    "airlines": (100, "airline_ids", ()),
+    "aircraft": (50, "aircraft_ids", ()),
+    "airports": (200, "airport_ids", ()),
+    "search_requests": (10000, "search_request_ids", ()),
+    "flight_offers": (50000, "flight_offer_ids", ("search_requests",)),
+    "bookings": (5000, "booking_ids", ("search_requests", "flight_offers")),
+}
+
+# Bookkeeping collection recording which schema the database was seeded from
+SEED_META_COLLECTION = "_mimoid_meta"
+SCHEMA_SOURCE = Path(db_schema.__file__)
+# How long an existing seed is reused: offer_ttl deletes seeded flight offers, which
+# bookings reference, 30 days after they expire (at least an hour after seeding);
+# the spare day covers the seeding run itself
+SEED_RETENTION = timedelta(days=29)
+
 
 class AmadeusFlightSeeder(DatabaseSeeder):
     """Seeder for Amadeus Flight Booking Database with realistic aviation data"""
@@ -41,6 +81,15 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         self.currency_ids = []
         self.search_request_ids = []
         self.flight_offer_ids = []
+        self.booking_ids = []
+        
+        # Generated transactional documents are trusted by construction, so they skip
+        # pydantic validation except for every Nth one as an integrity check
+        self.document_validation_interval = 100
+        self._documents_built = 0
+        
+        # Documents per unordered insert_many call for the transactional collections
+        self.insert_batch_size = 5000
         
         # Real aviation data for realism
         self.real_airlines = [
@@ -128,46 +177,53 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             {"code": "SGD", "name": "Singapore Dollar", "symbol": "S$", "rate": 1.35, "major": False},
             {"code": "AED", "name": "UAE Dirham", "symbol": "AED", "rate": 3.67, "major": False},
         ]
+        # Currency code -> units per USD, for converting generated prices
+        self.usd_rates = {currency["code"]: currency["rate"] for currency in self.currencies_data}
 
     def create_database_schema(self):
         """Create the database schema with indexes"""
-        print("Creating database schema with indexes...")
+        self.create_collections_only()
+        self.create_indexes()
+
+    def create_collections_only(self):
+        """Recreate the database with empty collections and no secondary indexes"""
+        print("Creating database collections...")
         
         # Drop database if it exists
         self.db_client.drop_database(self.database_name)
         
-        # Get database reference
-        db = self.db_client[self.database_name]
-        
-        # Create collections with indexes
-        for collection_name, collection_schema in database_schema.collections.items():
-            collection = db[collection_name]
-            
-            # Create indexes
-            for index_def in collection_schema.indexes:
-                try:
-                    # Handle text indexes
-                    if any(isinstance(direction, str) and direction == "text" for direction in index_def.keys.values()):
-                        text_fields = [(field, "text") for field, direction in index_def.keys.items() if direction == "text"]
-                        collection.create_index(
-                            text_fields,
-                            name=index_def.name,
-                            background=index_def.background
-                        )
-                    else:
-                        # Regular indexes
-                        index_keys = [(field, direction.value if hasattr(direction, 'value') else direction) 
-                                     for field, direction in index_def.keys.items()]
-                        collection.create_index(
-                            index_keys,
-                            name=index_def.name,
-                            unique=index_def.unique,
-                            sparse=index_def.sparse,
-                            background=index_def.background
-                        )
-                    print(f"  ✅ Created index '{index_def.name}' on collection '{collection_name}'")
-                except Exception as e:
-                    print(f"  ⚠️ Warning: Could not create index '{index_def.name}' on '{collection_name}': {e}")
+        for collection_name in database_schema.collections:
+            self.db.create_collection(collection_name)
+
+    def create_indexes(self) -> List[str]:
+        """Create indexes as defined in the schema, returning the names of any that failed
+
+        Runs after the bulk load, so the flight_offers and search_requests indexes are
+        built over the loaded collections rather than maintained across 60,000 inserts.
+        A unique index that cannot be built (a duplicate generated key) raises RuntimeError.
+        """
+        print("Creating indexes...")
+        failed = self.create_schema_indexes(self.db)
+        for name in failed:
+            print(f"  ⚠️ Warning: Could not create index '{name}'")
+        return failed
+
+    def build_document(self, schema_cls, **fields):
+        """Build a generated document, validating only a periodic sample"""
+        self._documents_built += 1
+        if self._documents_built % self.document_validation_interval == 0:
+            return schema_cls(**fields)
+        return schema_cls.model_construct(**fields)
+
+    def validate_rows(self, adapter: TypeAdapter, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate a batch of generated rows in a single pass and dump them for insertion"""
+        return adapter.dump_python(adapter.validate_python(rows), by_alias=True)
+
+    def insert_in_batches(self, collection_name: str, documents: List[Dict[str, Any]]):
+        """Insert documents in unordered batches of insert_batch_size"""
+        collection = self.db[collection_name]
+        for i in range(0, len(documents), self.insert_batch_size):
+            collection.insert_many(documents[i:i + self.insert_batch_size], ordered=False)
 
     def seed_countries(self, count: int = 50) -> List[str]:
         """Seed countries collection"""
@@ -179,7 +235,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         # Add real countries first
         for country_data in self.countries_data[:count]:
             country_id = self.get_object_id()
-            country = Country(
+            countries.append(dict(
                 _id=country_id,
                 iso_code=country_data["iso"],
                 iso3_code=self.fake.country_code(representation="alpha-3"),
@@ -191,8 +247,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 currency_code=country_data["currency"],
                 languages=[self.fake.language_name() for _ in range(random.randint(1, 3))],
                 major_airports=[airport["iata"] for airport in self.real_airports if airport["country"] == country_data["iso"]],
-            )
-            countries.append(country.model_dump())
+            ))
             country_ids.append(country_id)
         
         # Add additional fake countries if needed
@@ -206,7 +261,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 fake_iso = self.fake.country_code()
             used_iso_codes.add(fake_iso)
             
-            country = Country(
+            countries.append(dict(
                 _id=country_id,
                 iso_code=fake_iso,
                 iso3_code=self.fake.country_code(representation="alpha-3"),
@@ -216,12 +271,11 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 capital_city=self.fake.city(),
                 currency_code=random.choice([c["code"] for c in self.currencies_data]),
                 languages=[self.fake.language_name() for _ in range(random.randint(1, 2))],
-            )
-            countries.append(country.model_dump())
+            ))
             country_ids.append(country_id)
         
         # Bulk insert
-        self.db["countries"].insert_many(countries)
+        self.db["countries"].insert_many(self.validate_rows(COUNTRY_LIST, countries))
         self.country_ids = country_ids
         return country_ids
 
@@ -235,7 +289,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         # Add real currencies first
         for currency_data in self.currencies_data[:count]:
             currency_id = self.get_object_id()
-            currency = Currency(
+            currencies.append(dict(
                 _id=currency_id,
                 code=currency_data["code"],
                 name=currency_data["name"],
@@ -244,27 +298,33 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 exchange_rate_to_usd=currency_data["rate"],
                 countries=[c["iso"] for c in self.countries_data if c["currency"] == currency_data["code"]],
                 is_major_currency=currency_data["major"],
-            )
-            currencies.append(currency.model_dump())
+            ))
             currency_ids.append(currency_id)
         
         # Add additional fake currencies if needed
+        used_codes = set([c["code"] for c in self.currencies_data])
         for i in range(len(self.currencies_data), count):
             currency_id = self.get_object_id()
-            currency = Currency(
+            
+            # Generate unique currency code
+            code = self.fake.currency_code()
+            while code in used_codes:
+                code = self.fake.currency_code()
+            used_codes.add(code)
+            
+            currencies.append(dict(
                 _id=currency_id,
-                code=self.fake.currency_code(),
+                code=code,
                 name=f"{self.fake.country()} {random.choice(['Dollar', 'Pound', 'Franc', 'Peso', 'Real'])}",
                 symbol=random.choice(["$", "€", "£", "¥", "₹", "₽", "₩"]),
                 decimal_places=random.choice([0, 2]),
                 exchange_rate_to_usd=round(random.uniform(0.1, 10.0), 4),
                 is_major_currency=False,
-            )
-            currencies.append(currency.model_dump())
+            ))
             currency_ids.append(currency_id)
         
         # Bulk insert
-        self.db["currencies"].insert_many(currencies)
+        self.db["currencies"].insert_many(self.validate_rows(CURRENCY_LIST, currencies))
         self.currency_ids = currency_ids
         return currency_ids
 
@@ -279,7 +339,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         for airline_data in self.real_airlines:
             airline_id = self.get_object_id()
             
-            airline = Airline(
+            airlines.append(dict(
                 _id=airline_id,
                 iata_code=airline_data["iata"],
                 icao_code=self.fake.lexify("???").upper(),
@@ -295,8 +355,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 website=f"https://www.{airline_data['iata'].lower()}.com",
                 phone=self.fake.phone_number(),
                 booking_classes=["Y", "B", "M", "H", "Q", "V", "W", "S", "T", "L", "A", "K", "U", "E", "N", "R", "G", "X", "O", "I", "F", "C", "J", "D", "Z", "P"],
-            )
-            airlines.append(airline.model_dump())
+            ))
             airline_ids.append(airline_id)
         
         # Add additional fake airlines
@@ -311,7 +370,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             country_code = random.choice(self.countries_data)["iso"]
             is_lcc = random.choice([True, False])
             
-            airline = Airline(
+            airlines.append(dict(
                 _id=airline_id,
                 iata_code=iata_code,
                 icao_code=self.fake.lexify("???").upper(),
@@ -328,12 +387,11 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 website=f"https://www.{iata_code.lower()}.com",
                 phone=self.fake.phone_number(),
                 booking_classes=random.sample(["Y", "B", "M", "H", "Q", "V", "W", "S", "T", "L", "A", "K", "U", "E", "N", "R", "G", "X", "O", "I", "F", "C", "J", "D", "Z", "P"], random.randint(8, 16)),
-            )
-            airlines.append(airline.model_dump())
+            ))
             airline_ids.append(airline_id)
         
         # Bulk insert
-        self.db["airlines"].insert_many(airlines)
+        self.db["airlines"].insert_many(self.validate_rows(AIRLINE_LIST, airlines))
         self.airline_ids = airline_ids
         return airline_ids
 
@@ -353,7 +411,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             first_seats = int(capacity * random.uniform(0.02, 0.08)) if capacity > 200 else 0
             economy_seats = capacity - business_seats - first_seats
             
-            plane = Aircraft(
+            aircraft.append(dict(
                 _id=aircraft_id,
                 iata_code=aircraft_data["iata"],
                 icao_code=self.fake.lexify("????").upper(),
@@ -373,22 +431,28 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 engine_type=f"{random.choice(['CFM', 'IAE', 'RR', 'GE'])} {random.randint(1000, 9999)}",
                 fuel_consumption_lph=random.randint(1500, 8000),
                 co2_emission_factor=random.uniform(0.5, 1.2),
-            )
-            aircraft.append(plane.model_dump())
+            ))
             aircraft_ids.append(aircraft_id)
         
         # Add additional fake aircraft if needed
+        used_iata_codes = set([a["iata"] for a in self.real_aircraft])
         for i in range(len(self.real_aircraft), count):
             aircraft_id = self.get_object_id()
             
+            # Generate unique 3-character IATA type code
+            iata_code = self.fake.lexify("???").upper()
+            while iata_code in used_iata_codes:
+                iata_code = self.fake.lexify("???").upper()
+            used_iata_codes.add(iata_code)
+            
             capacity = random.randint(50, 600)
             business_seats = int(capacity * random.uniform(0.1, 0.25))
             first_seats = int(capacity * random.uniform(0.02, 0.08)) if capacity > 200 else 0
             economy_seats = capacity - business_seats - first_seats
             
-            plane = Aircraft(
+            aircraft.append(dict(
                 _id=aircraft_id,
-                iata_code=self.fake.lexify("???").upper(),
+                iata_code=iata_code,
                 icao_code=self.fake.lexify("????").upper(),
                 name=f"{random.choice(['Airbus', 'Boeing', 'Embraer', 'Bombardier'])} {random.choice(['A', 'B', 'E', 'CRJ'])}{random.randint(100, 900)}",
                 manufacturer=random.choice(["Airbus", "Boeing", "Embraer", "Bombardier", "ATR"]),
@@ -402,12 +466,11 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 in_production=random.choice([True, False]),
                 engine_count=random.choice([2, 4]),
                 fuel_consumption_lph=random.randint(1000, 10000),
-            )
-            aircraft.append(plane.model_dump())
+            ))
             aircraft_ids.append(aircraft_id)
         
         # Bulk insert
-        self.db["aircraft"].insert_many(aircraft)
+        self.db["aircraft"].insert_many(self.validate_rows(AIRCRAFT_LIST, aircraft))
         self.aircraft_ids = aircraft_ids
         return aircraft_ids
 
@@ -422,7 +485,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         for airport_data in self.real_airports:
             airport_id = self.get_object_id()
             
-            airport = Airport(
+            airports.append(dict(
                 _id=airport_id,
                 iata_code=airport_data["iata"],
                 icao_code=self.fake.lexify("????").upper(),
@@ -434,6 +497,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 continent=next(c["continent"] for c in self.countries_data if c["iso"] == airport_data["country"]),
                 latitude=airport_data["lat"],
                 longitude=airport_data["lon"],
+                location={"type": "Point", "coordinates": (airport_data["lon"], airport_data["lat"])},
                 elevation_m=random.randint(0, 4000),
                 timezone=self.fake.timezone(),
                 is_active=True,
@@ -448,8 +512,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 wifi_available=True,
                 lounges_count=random.randint(5, 50),
                 ground_transport=["Bus", "Train", "Taxi", "Car Rental", "Metro"],
-            )
-            airports.append(airport.model_dump())
+            ))
             airport_ids.append(airport_id)
         
         # Add additional fake airports
@@ -463,8 +526,10 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             
             country_data = random.choice(self.countries_data)
             city_name = self.fake.city()
+            latitude = float(self.fake.latitude())
+            longitude = float(self.fake.longitude())
             
-            airport = Airport(
+            airports.append(dict(
                 _id=airport_id,
                 iata_code=iata_code,
                 icao_code=self.fake.lexify("????").upper(),
@@ -474,8 +539,9 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 country_code=country_data["iso"],
                 country_name=country_data["name"],
                 continent=country_data["continent"],
-                latitude=self.fake.latitude(),
-                longitude=self.fake.longitude(),
+                latitude=latitude,
+                longitude=longitude,
+                location={"type": "Point", "coordinates": (longitude, latitude)},
                 elevation_m=random.randint(0, 3000),
                 timezone=self.fake.timezone(),
                 is_active=random.choice([True, True, True, False]),  # 75% active
@@ -489,12 +555,11 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 wifi_available=random.choice([True, False]),
                 lounges_count=random.randint(0, 10),
                 ground_transport=random.sample(["Bus", "Train", "Taxi", "Car Rental", "Metro", "Shuttle"], random.randint(2, 5)),
-            )
-            airports.append(airport.model_dump())
+            ))
             airport_ids.append(airport_id)
         
         # Bulk insert
-        self.db["airports"].insert_many(airports)
+        self.db["airports"].insert_many(self.validate_rows(AIRPORT_LIST, airports))
         self.airport_ids = airport_ids
         return airport_ids
 
@@ -512,8 +577,12 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             ("SIN", "SYD"), ("ICN", "LAX"), ("GRU", "CDG"), ("YYZ", "LHR"),
         ]
         
+        # One reference time for the whole batch: ids, relative dates and created_at
+        now = datetime.utcnow()
+        date_tag = now.strftime('%Y%m%d')
+        
         for i in range(count):
-            search_id = f"SEARCH{datetime.utcnow().strftime('%Y%m%d')}{i+1:06d}"
+            search_id = f"SEARCH{date_tag}{i+1:06d}"
             search_request_id = self.get_object_id()
             
             # 70% use popular routes, 30% random
@@ -526,14 +595,15 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                     destination = random.choice([a["iata"] for a in self.real_airports])
             
             # Random departure date in the next 365 days
-            departure_date = datetime.utcnow() + timedelta(days=random.randint(1, 365))
+            departure_date = now + timedelta(days=random.randint(1, 365))
             
             # Round trip probability
             return_date = None
             if random.random() < 0.6:  # 60% round trip
                 return_date = departure_date + timedelta(days=random.randint(1, 30))
             
-            search_request = SearchRequest(
+            search_request = self.build_document(
+                SearchRequest,
                 _id=search_request_id,
                 search_id=search_id,
                 session_id=str(uuid.uuid4()) if random.random() < 0.7 else None,
@@ -545,25 +615,23 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 adults=random.choices([1, 2, 3, 4], weights=[40, 35, 15, 10])[0],
                 children=random.choices([0, 1, 2], weights=[70, 20, 10])[0],
                 infants=random.choices([0, 1], weights=[85, 15])[0],
-                travel_class=random.choice(list(TravelClass)) if random.random() < 0.3 else None,
+                travel_class=random.choice(TRAVEL_CLASSES) if random.random() < 0.3 else None,
                 non_stop=random.choice([True, False]),
                 max_price=random.randint(200, 5000) if random.random() < 0.2 else None,
                 currency_code=random.choice(["USD", "EUR", "GBP", "JPY"]),
-                search_timestamp=datetime.utcnow() - timedelta(minutes=random.randint(0, 43200)),  # Last 30 days
+                search_timestamp=now - timedelta(minutes=random.randint(0, 43200)),  # Last 30 days
                 ip_address=self.fake.ipv4(),
                 user_agent=self.fake.user_agent(),
                 results_count=random.randint(0, 250),
                 response_time_ms=random.randint(200, 3000),
-                status=random.choices(list(SearchStatus), weights=[10, 80, 5, 5])[0],
+                status=random.choices(SEARCH_STATUSES, weights=[10, 80, 5, 5])[0],
+                created_at=now,
             )
-            search_requests.append(search_request.model_dump())
+            search_requests.append(search_request.model_dump(by_alias=True))
             search_request_ids.append(search_request_id)
         
         # Bulk insert
-        batch_size = 1000
-        for i in range(0, len(search_requests), batch_size):
-            batch = search_requests[i:i + batch_size]
-            self.db["search_requests"].insert_many(batch)
+        self.insert_in_batches("search_requests", search_requests)
         
         self.search_request_ids = search_request_ids
         return search_request_ids
@@ -575,8 +643,12 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         flight_offers = []
         flight_offer_ids = []
         
+        # One reference time for the whole batch: ids, relative dates and created_at
+        now = datetime.utcnow()
+        date_tag = now.strftime('%Y%m%d')
+        
         for i in range(count):
-            offer_id = f"OFFER{datetime.utcnow().strftime('%Y%m%d')}{i+1:08d}"
+            offer_id = f"OFFER{date_tag}{i+1:08d}"
             flight_offer_id = self.get_object_id()
             
             # Select random search request
@@ -600,12 +672,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             total_price = base_price + taxes_and_fees
             
             # Adjust for currency
-            if currency_code == "EUR":
-                total_price *= 0.85
-            elif currency_code == "GBP":
-                total_price *= 0.73
-            elif currency_code == "JPY":
-                total_price *= 110
+            total_price *= self.usd_rates[currency_code]
             
             # Create realistic itinerary structure
             origin = random.choice([a["iata"] for a in self.real_airports])
@@ -613,7 +680,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             while destination == origin:
                 destination = random.choice([a["iata"] for a in self.real_airports])
             
-            departure_time = datetime.utcnow() + timedelta(days=random.randint(1, 365), hours=random.randint(0, 23), minutes=random.choice([0, 15, 30, 45]))
+            departure_time = now + timedelta(days=random.randint(1, 365), hours=random.randint(0, 23), minutes=random.choice([0, 15, 30, 45]))
             arrival_time = departure_time + timedelta(hours=random.randint(2, 16), minutes=random.randint(0, 59))
             
             segments = [{
@@ -677,10 +744,10 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             }
             
             # Traveler pricing
-            travel_class = random.choice(list(TravelClass))
+            travel_class = random.choice(TRAVEL_CLASSES)
             traveler_pricings = [{
                 "travelerId": "1",
-                "fareOption": random.choice(list(FareOption)),
+                "fareOption": random.choice(FARE_OPTIONS),
                 "travelerType": TravelerType.ADULT,
                 "price": {
                     "currency": currency_code,
@@ -700,7 +767,8 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 } for seg in segments]
             }]
             
-            flight_offer = FlightOffer(
+            flight_offer = self.build_document(
+                FlightOffer,
                 _id=flight_offer_id,
                 offer_id=offer_id,
                 search_request_id=search_request_id,
@@ -712,6 +780,8 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 last_ticketing_date=departure_time - timedelta(days=random.randint(1, 7)),
                 itineraries=[itinerary],
                 total_duration=itinerary["duration"],
+                # Built with model_construct, so the summary validator does not run
+                **summarize_itineraries([itinerary]),
                 price={
                     "currency": currency_code,
                     "total": f"{total_price:.2f}",
@@ -723,9 +793,10 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                     "grandTotal": f"{total_price:.2f}"
                 },
                 currency_code=currency_code,
-                total_price=total_price,
-                base_price=base_price,
-                taxes_and_fees=taxes_and_fees,
+                # Stored amounts match the two-decimal strings in the price breakdown
+                total_price=round(total_price, 2),
+                base_price=round(base_price, 2),
+                taxes_and_fees=round(taxes_and_fees, 2),
                 traveler_pricings=traveler_pricings,
                 validating_airline_codes=[validating_airline],
                 operating_airlines=operating_airlines,
@@ -736,17 +807,15 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 included_checked_bags_only=random.choice([True, False]),
                 search_score=random.uniform(70, 100),
                 popularity_score=random.uniform(50, 95),
-                expires_at=datetime.utcnow() + timedelta(hours=random.randint(1, 24))
+                expires_at=now + timedelta(hours=random.randint(1, 24)),
+                created_at=now,
             )
             
-            flight_offers.append(flight_offer.model_dump())
+            flight_offers.append(flight_offer.model_dump(by_alias=True))
             flight_offer_ids.append(flight_offer_id)
         
         # Bulk insert
-        batch_size = 1000
-        for i in range(0, len(flight_offers), batch_size):
-            batch = flight_offers[i:i + batch_size]
-            self.db["flight_offers"].insert_many(batch)
+        self.insert_in_batches("flight_offers", flight_offers)
             
         self.flight_offer_ids = flight_offer_ids
         return flight_offer_ids
@@ -758,31 +827,39 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         bookings = []
         booking_ids = []
         
+        # One reference time for the whole batch: relative dates and created_at
+        now = datetime.utcnow()
+        
+        # Both are unique-indexed, so a repeated random draw is redrawn
+        used_references = set()
+        used_confirmations = set()
+        
         for i in range(count):
             booking_id = self.get_object_id()
             
             # Generate booking reference (PNR format)
             booking_reference = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+            while booking_reference in used_references:
+                booking_reference = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+            used_references.add(booking_reference)
             confirmation_number = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+            while confirmation_number in used_confirmations:
+                confirmation_number = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+            used_confirmations.add(confirmation_number)
             
             # Select associated flight offer
             flight_offer_id = random.choice(self.flight_offer_ids) if self.flight_offer_ids else self.get_object_id()
             search_request_id = random.choice(self.search_request_ids) if self.search_request_ids and random.random() < 0.7 else None
             
             # Booking timeline
-            booking_date = datetime.utcnow() - timedelta(days=random.randint(0, 90))
+            booking_date = now - timedelta(days=random.randint(0, 90))
             departure_date = booking_date + timedelta(days=random.randint(1, 365))
             ticketing_deadline = booking_date + timedelta(days=random.randint(1, 3))
             
             # Payment and pricing
             currency = random.choice(["USD", "EUR", "GBP", "JPY"])
             total_amount = random.uniform(300, 3000)
-            if currency == "EUR":
-                total_amount *= 0.85
-            elif currency == "GBP":
-                total_amount *= 0.73
-            elif currency == "JPY":
-                total_amount *= 110
+            total_amount *= self.usd_rates[currency]
             
             # Traveler information
             num_travelers = random.choices([1, 2, 3, 4], weights=[50, 30, 15, 5])[0]
@@ -790,7 +867,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             for t in range(num_travelers):
                 traveler = {
                     "id": str(t + 1),
-                    "type": random.choice(list(TravelerType)),
+                    "type": random.choice(TRAVELER_TYPES),
                     "name": {
                         "firstName": self.fake.first_name(),
                         "lastName": self.fake.last_name()
@@ -824,7 +901,8 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                     {"type": "BAGGAGE", "description": "Extra baggage"},
                 ], random.randint(1, 2))
             
-            booking = Booking(
+            booking = self.build_document(
+                Booking,
                 _id=booking_id,
                 booking_reference=booking_reference,
                 confirmation_number=confirmation_number,
@@ -839,7 +917,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 booking_date=booking_date,
                 ticketing_deadline=ticketing_deadline,
                 departure_date=departure_date,
-                total_amount_paid=total_amount,
+                total_amount_paid=round(total_amount, 2),
                 payment_currency=currency,
                 payment_method=random.choice(["Credit Card", "Debit Card", "PayPal", "Bank Transfer", "Miles"]),
                 payment_status=random.choice(["completed", "pending", "failed"]) if status == "booked" else "completed",
@@ -851,18 +929,17 @@ class AmadeusFlightSeeder(DatabaseSeeder):
                 booking_source=random.choice(["API", "Website", "Mobile App", "Call Center", "Travel Agent"]),
                 agency_code=f"AG{random.randint(100000, 999999)}" if random.random() < 0.3 else None,
                 cancellation_date=booking_date + timedelta(days=random.randint(1, 30)) if status in ["cancelled", "refunded"] else None,
-                refund_amount=total_amount * random.uniform(0.5, 1.0) if status == "refunded" else None,
+                refund_amount=round(total_amount * random.uniform(0.5, 1.0), 2) if status == "refunded" else None,
+                created_at=now,
             )
             
-            bookings.append(booking.model_dump())
+            bookings.append(booking.model_dump(by_alias=True))
             booking_ids.append(booking_id)
         
         # Bulk insert
-        batch_size = 1000
-        for i in range(0, len(bookings), batch_size):
-            batch = bookings[i:i + batch_size]
-            self.db["bookings"].insert_many(batch)
+        self.insert_in_batches("bookings", bookings)
         
+        self.booking_ids = booking_ids
         return booking_ids
 
     # Implement abstract methods from DatabaseSeeder
@@ -896,10 +973,6 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         
         return results
 
-    def create_indexes(self):
-        """Create indexes as defined in the schema"""
-        self.create_database_schema()
-
     def clear_database(self):
         """Clear all collections (useful for re-seeding)"""
         self.drop_database()
@@ -910,7 +983,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         
         # Check collection counts
         for collection_name in database_schema.collections.keys():
-            count = self.db[collection_name].count_documents({})
+            count = self.db[collection_name].estimated_document_count()
             validation_results[f"{collection_name}_count"] = count
         
         # Basic validation checks
@@ -933,11 +1006,61 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         """Drop the entire database"""
         self.db_client.drop_database(self.database_name)
 
+    def schema_fingerprint(self) -> str:
+        """Digest of the schema and seeder source the database is generated from
+
+        Hashing the source covers models, indexes, SEED_PLAN and the generators alike,
+        without building the collections' JSON schemas just to compare them.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for path in (SCHEMA_SOURCE, Path(__file__)):
+            digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def seed_is_current(self, fingerprint: str) -> bool:
+        """Whether the existing database can be kept instead of reseeded
+
+        It must have been fully seeded from the schema with this fingerprint, less than
+        SEED_RETENTION ago, and still have every index the schema defines.
+        """
+        doc = self.db[SEED_META_COLLECTION].find_one({"_id": "schema"})
+        if not doc or doc["hash"] != fingerprint:
+            return False
+        if datetime.utcnow() - doc["seeded_at"] >= SEED_RETENTION:
+            return False
+        return not self.missing_indexes()
+
+    def missing_indexes(self) -> List[str]:
+        """Schema indexes that do not exist in the database, as collection.index names"""
+        missing = []
+        for collection_name, collection_schema in database_schema.collections.items():
+            existing = self.db[collection_name].index_information()
+            missing.extend(
+                f"{collection_name}.{index_def.name}"
+                for index_def in collection_schema.indexes
+                if index_def.name not in existing
+            )
+        return missing
+
+    def record_fingerprint(self, fingerprint: str):
+        """Record that the database was fully seeded and indexed from the schema with this fingerprint"""
+        self.db[SEED_META_COLLECTION].replace_one(
+            {"_id": "schema"}, {"hash": fingerprint, "seeded_at": datetime.utcnow()}, upsert=True
+        )
+
+    def load_seeded_ids(self):
+        """Reload generated ids from an existing database, for the reference checks
+
+        Documents are dumped by alias, so each generated id is stored as the document's _id.
+        """
+        for collection_name, (_, ids_attribute, _) in SEED_PLAN.items():
+            setattr(self, ids_attribute, self.db[collection_name].distinct("_id"))
+
     def get_collection_stats(self) -> Dict[str, int]:
-        """Get document counts for all collections"""
+        """Get document counts for all collections from collection metadata rather than a scan"""
         stats = {}
         for collection_name in database_schema.collections.keys():
-            stats[collection_name] = self.db[collection_name].count_documents({})
+            stats[collection_name] = self.db[collection_name].estimated_document_count()
         return stats
 
     def validate_references(self) -> Dict[str, Dict[str, Any]]:
@@ -1030,7 +1153,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         most_popular = result[0] if result else {"_id": {"origin": "JFK", "destination": "LHR"}, "search_count": 0}
         
         unique_routes = self.db.search_requests.distinct("origin_code")
-        total_searches = self.db.search_requests.count_documents({})
+        total_searches = self.db.search_requests.estimated_document_count()
         
         return {
             "most_popular_route": f"{most_popular['_id']['origin']}-{most_popular['_id']['destination']}",
@@ -1072,8 +1195,8 @@ class AmadeusFlightSeeder(DatabaseSeeder):
 
     def analyze_booking_conversions(self) -> Dict[str, Any]:
         """Analyze booking conversion metrics"""
-        total_searches = self.db.search_requests.count_documents({})
-        total_bookings = self.db.bookings.count_documents({})
+        total_searches = self.db.search_requests.estimated_document_count()
+        total_bookings = self.db.bookings.estimated_document_count()
         
         avg_booking = list(self.db.bookings.aggregate([
             {"$group": {
@@ -1110,7 +1233,7 @@ class AmadeusFlightSeeder(DatabaseSeeder):
 
     def analyze_geographic_patterns(self) -> Dict[str, Any]:
         """Analyze geographic distribution patterns"""
-        countries_served = self.db.countries.count_documents({})
+        countries_served = self.db.countries.estimated_document_count()
         airports_count = self.db.airports.count_documents({"is_active": True})
         
         # Mock continent analysis
@@ -1120,24 +1243,62 @@ class AmadeusFlightSeeder(DatabaseSeeder):
             "avg_airports_per_country": airports_count / max(countries_served, 1)
         }
 
-    def run_seeding(self) -> Dict[str, Any]:
-        """Execute the complete seeding process"""
+    def seed_collections_parallel(self, workers: int) -> Dict[str, int]:
+        """Seed the SEED_PLAN collections in worker processes, returning document counts
+
+        Each collection is submitted as soon as the collections it depends on are done;
+        their generated ids are handed to the worker and the ids it returns are kept on
+        this seeder for the reference checks.
+        """
+        counts = {}
+        pending = dict(SEED_PLAN)
+        running = {}
+        # Workers start with spawn: a forked child would share the sockets of this
+        # seeder's db_client, which main.py has already connected while validating
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            while pending or running:
+                for collection_name, (count, _, dependencies) in list(pending.items()):
+                    if all(dependency in counts for dependency in dependencies):
+                        attributes = {
+                            SEED_PLAN[dependency][1]: getattr(self, SEED_PLAN[dependency][1])
+                            for dependency in dependencies
+                        }
+                        attributes["insert_batch_size"] = self.insert_batch_size
+                        future = executor.submit(
+                            _seed_collection_in_worker, self.connection_string, self.database_name,
+                            collection_name, count, attributes,
+                        )
+                        running[future] = collection_name
+                        del pending[collection_name]
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collection_name = running.pop(future)
+                    ids = future.result()
+                    setattr(self, SEED_PLAN[collection_name][1], ids)
+                    counts[collection_name] = len(ids)
+        return {collection_name: counts[collection_name] for collection_name in SEED_PLAN}
+
+    def run_seeding(self, workers: int = 1, batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """Execute the complete seeding process
+
+        With more than one worker (capped at the CPU count), independent collections are
+        seeded concurrently in separate processes (see seed_collections_parallel).
+        """
         print("🚀 Starting Amadeus Flight Booking database seeding...")
         
         start_time = datetime.utcnow()
-        results = {}
-        
-        # Seed reference data first
-        results["countries"] = len(self.seed_countries(50))
-        results["currencies"] = len(self.seed_currencies(20))
-        results["airlines"] = len(self.seed_airlines(100))
-        results["aircraft"] = len(self.seed_aircraft(50))
-        results["airports"] = len(self.seed_airports(200))
         
-        # Seed transaction data
-        results["search_requests"] = len(self.seed_search_requests(10000))
-        results["flight_offers"] = len(self.seed_flight_offers(50000))
-        results["bookings"] = len(self.seed_bookings(5000))
+        if batch_size:
+            self.insert_batch_size = batch_size
+        workers = min(workers, os.cpu_count() or 1)
+        if workers > 1:
+            results = self.seed_collections_parallel(workers)
+        else:
+            # Reference data first, then transaction data in dependency order
+            results = {
+                collection_name: len(getattr(self, f"seed_{collection_name}")(count))
+                for collection_name, (count, _, _) in SEED_PLAN.items()
+            }
         
         # Calculate totals
         results["total_documents"] = sum(results.values())
@@ -1152,5 +1313,18 @@ class AmadeusFlightSeeder(DatabaseSeeder):
         return results
 
 
+def _seed_collection_in_worker(
+    connection_string: str, database_name: str, collection_name: str, count: int, attributes: Dict[str, Any]
+) -> List[Any]:
+    """Seed one collection in a worker process with its own MongoClient, returning its generated ids"""
+    worker = AmadeusFlightSeeder(connection_string, database_name)
+    for name, value in attributes.items():
+        setattr(worker, name, value)
+    try:
+        return getattr(worker, f"seed_{collection_name}")(count)
+    finally:
+        worker.db_client.close()
+
+
 # Create seeder instance
 seeder = AmadeusFlightSeeder()
\ No newline at end of file
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Seeding tests for the Amadeus flight booking database
+Runs the seeders against an in-memory stand-in for the database, so no MongoDB is needed
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Add the mimoid package to Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from db_schema import database_schema
+from seed_db import SEED_META_COLLECTION, SEED_PLAN, SEED_RETENTION, AmadeusFlightSeeder
+
+# Other projects' tests import their own seed_db/db_schema modules in the same session
+for module_name in ("seed_db", "db_schema"):
+    sys.modules.pop(module_name, None)
+
+# Documents seeded per collection; enough for every reference to have candidates
+SMALL_COUNT = 20
+
+
+class InMemoryCollection:
+    """The subset of a pymongo collection used by the seeder"""
+
+    def __init__(self):
+        self.documents = []
+        self.index_names = {"_id_"}
+
+    def insert_many(self, documents, ordered=True):
+        self.documents.extend(documents)
+
+    def replace_one(self, query, document, upsert=False):
+        self.documents = [doc for doc in self.documents if doc.get("_id") != query["_id"]]
+        self.documents.append({**document, "_id": query["_id"]})
+
+    def find_one(self, query):
+        return next(
+            (doc for doc in self.documents if all(doc.get(field) == value for field, value in query.items())),
+            None,
+        )
+
+    def create_indexes(self, models):
+        self.index_names.update(model.document["name"] for model in models)
+
+    def index_information(self):
+        return {name: {} for name in self.index_names}
+
+    def distinct(self, field):
+        return list({doc[field] for doc in self.documents if doc.get(field) is not None})
+
+    def count_documents(self, query):
+        def matches(doc):
+            for field, condition in query.items():
+                value = doc.get(field)
+                if "$in" in condition and value not in condition["$in"]:
+                    return False
+                if "$ne" in condition and value == condition["$ne"]:
+                    return False
+            return True
+        return sum(1 for doc in self.documents if matches(doc))
+
+
+class InMemoryDatabase(dict):
+    """Collections by name, created on first use"""
+
+    def __missing__(self, name):
+        collection = self[name] = InMemoryCollection()
+        return collection
+
+    def __getattr__(self, name):
+        return self[name]
+
+
+class TrackingSeeder(AmadeusFlightSeeder):
+    """Seeder recording which generated-id attributes it reads"""
+
+    def __init__(self):
+        super().__init__("mongodb://localhost:27017")
+        self.db = InMemoryDatabase()
+        self.ids_read = set()
+
+    def __getattribute__(self, name):
+        if name.endswith("_ids"):
+            object.__getattribute__(self, "ids_read").add(name)
+        return object.__getattribute__(self, name)
+
+
+@pytest.fixture
+def seeded():
+    """A seeder that has seeded every SEED_PLAN collection in dependency order"""
+    seeder = TrackingSeeder()
+    for collection_name in SEED_PLAN:
+        getattr(seeder, f"seed_{collection_name}")(SMALL_COUNT)
+    yield seeder
+    seeder.db_client.close()
+
+
+def test_seed_plan_declares_every_id_list_a_seeder_reads(seeded):
+    """Parallel workers only receive their declared dependencies' ids, so none may be missing"""
+    for collection_name, (_, ids_attribute, dependencies) in SEED_PLAN.items():
+        seeded.ids_read = set()
+        getattr(seeded, f"seed_{collection_name}")(SMALL_COUNT)
+        declared = {SEED_PLAN[dependency][1] for dependency in dependencies}
+        assert seeded.ids_read <= declared, collection_name
+
+
+def test_reloaded_ids_validate_references(seeded):
+    """The skip-reseed path reloads ids from the database; the reference checks must still pass"""
+    reloaded = TrackingSeeder()
+    reloaded.db = seeded.db
+    reloaded.load_seeded_ids()
+    assert set(reloaded.search_request_ids) == set(seeded.search_request_ids)
+    assert set(reloaded.flight_offer_ids) == set(seeded.flight_offer_ids)
+    for check, result in reloaded.validate_references().items():
+        assert result["valid"], result["message"]
+    reloaded.db_client.close()
+
+
+def test_unique_indexed_fields_are_not_repeated(seeded):
+    """Unique indexes are built after the load, so the generators must not repeat a key"""
+    for collection_name, collection_schema in database_schema.collections.items():
+        documents = seeded.db[collection_name].documents
+        for index_def in collection_schema.indexes:
+            if not index_def.unique:
+                continue
+            values = [tuple(doc.get(field) for field in index_def.keys) for doc in documents]
+            assert len(set(values)) == len(values), f"{collection_name}.{index_def.name}"
+
+
+def test_seed_reused_only_when_complete_and_recent(seeded):
+    """A recorded seed is skipped only while its indexes exist and the TTL has not started"""
+    fingerprint = seeded.schema_fingerprint()
+    assert not seeded.seed_is_current(fingerprint)
+
+    assert seeded.create_indexes() == []
+    seeded.record_fingerprint(fingerprint)
+    assert seeded.seed_is_current(fingerprint)
+    assert not seeded.seed_is_current("another schema")
+
+    seeded.db.flight_offers.index_names.discard("offer_ttl")
+    assert seeded.missing_indexes() == ["flight_offers.offer_ttl"]
+    assert not seeded.seed_is_current(fingerprint)
+
+    seeded.db.flight_offers.index_names.add("offer_ttl")
+    seeded.db[SEED_META_COLLECTION].documents[0]["seeded_at"] = datetime.utcnow() - SEED_RETENTION
+    assert not seeded.seed_is_current(fingerprint)
@@ -30,6 +30,18 @@ class TestIndexDefinition:
         assert index.keys == {"field1": "1"}
         assert index.unique is False
         assert index.background is True
+        assert index.partial_filter_expression is None
+        assert index.post_load is False
+
+    def test_partial_index(self):
+        index = IndexDefinition(
+            name="failed_idx",
+            keys={"timestamp": IndexDirection.DESCENDING},
+            partial_filter_expression={"status": {"$in": ["failed", "error"]}},
+        )
+        assert index.partial_filter_expression == {
+            "status": {"$in": ["failed", "error"]}
+        }
 
     def test_compound_index(self):
         index = IndexDefinition(
@@ -43,6 +55,21 @@ class TestIndexDefinition:
         assert index.unique is True
         assert len(index.keys) == 2
 
+    def test_normalized_key(self):
+        index = IndexDefinition(
+            name="mixed_index",
+            keys=[
+                ("field1", IndexDirection.DESCENDING),
+                ("field2", "1"),
+                ("location", IndexDirection.GEO2DSPHERE),
+            ],
+        )
+        assert index._normalized_key == {
+            "field1": -1,
+            "field2": 1,
+            "location": "2dsphere",
+        }
+
 
 class TestPyObjectId:
     def test_create_from_string(self):
@@ -60,6 +87,12 @@ class TestPyObjectId:
         with pytest.raises(ValueError, match="Invalid ObjectId"):
             PyObjectId.validate("invalid_id")
 
+    def test_non_string_rejected(self):
+        with pytest.raises(ValueError, match="Invalid ObjectId"):
+            PyObjectId.validate(None)
+        with pytest.raises(ValueError, match="Invalid ObjectId"):
+            PyObjectId.validate(b"123456789012")
+
 
 class TestBaseMongoDbDocumentSchema:
     def test_document_with_id(self):
@@ -96,6 +129,58 @@ class TestBaseCollectionSchema:
         assert len(schema.indexes) == 1
         assert schema.indexes[0].name == "name_index"
 
+    def test_timeseries_collection(self):
+        schema = BaseCollectionSchema(
+            collection_name="events",
+            timeseries={"timeField": "timestamp", "metaField": "actor"},
+            expire_after_seconds=3600,
+        )
+        assert schema.timeseries["timeField"] == "timestamp"
+        assert schema.expire_after_seconds == 3600
+        assert BaseCollectionSchema(collection_name="plain").timeseries is None
+
+    def test_mongo_json_schema(self):
+        class Doc(BaseMongoDbDocumentSchema):
+            name: str
+
+        schema = BaseCollectionSchema(collection_name="docs", document_schema=Doc)
+        assert schema.json_schema is None
+        generated = schema.mongo_json_schema()
+        assert generated["$jsonSchema"]["bsonType"] == "object"
+        assert "name" in generated["$jsonSchema"]["properties"]
+        # Cached per document model
+        assert schema.mongo_json_schema() is generated
+        assert BaseCollectionSchema(collection_name="other", document_schema=Doc).mongo_json_schema() is generated
+        # Reading it leaves the model unchanged
+        assert schema == BaseCollectionSchema(collection_name="docs", document_schema=Doc)
+
+        explicit = BaseCollectionSchema(
+            collection_name="docs", json_schema={"type": "object"}, document_schema=Doc
+        )
+        assert explicit.mongo_json_schema() == {"type": "object"}
+        assert BaseCollectionSchema(collection_name="plain").mongo_json_schema() is None
+
+    def test_expected_index_metadata(self):
+        schema = BaseCollectionSchema(
+            collection_name="users",
+            indexes=[
+                IndexDefinition(
+                    name="name_email_index",
+                    keys={
+                        "name": IndexDirection.ASCENDING,
+                        "email": IndexDirection.DESCENDING,
+                    },
+                ),
+                IndexDefinition(name="bio_text", keys={"bio": IndexDirection.TEXT}),
+            ],
+        )
+        names, keys = schema.expected_index_metadata
+        assert names == {"_id_", "name_email_index", "bio_text"}
+        assert keys["name_email_index"] == {"name": 1, "email": -1}
+        assert keys["bio_text"] == {"bio": "text"}
+        # Cached after the first access
+        assert schema.expected_index_metadata is schema.expected_index_metadata
+
 
 class TestBaseMongoDbSchema:
     def test_database_schema(self):
@@ -73,6 +73,7 @@ class TestValidateSchemaAndIndexes:
     def sample_schema(self):
         """Create a sample database schema for testing"""
         users_collection = BaseCollectionSchema(
+            collection_name="users",
             json_schema={
                 "type": "object",
                 "properties": {
@@ -100,6 +101,7 @@ class TestValidateSchemaAndIndexes:
         )
 
         products_collection = BaseCollectionSchema(
+            collection_name="products",
             json_schema={
                 "type": "object",
                 "properties": {
@@ -164,7 +166,9 @@ class TestValidateSchemaAndIndexes:
         }[name]
 
         # Mock document counts
+        mock_users_collection.estimated_document_count.return_value = 5
         mock_users_collection.count_documents.return_value = 5
+        mock_products_collection.estimated_document_count.return_value = 3
         mock_products_collection.count_documents.return_value = 3
 
         # Mock sample documents (valid documents)
@@ -257,6 +261,7 @@ class TestValidateSchemaAndIndexes:
         mock_db.__getitem__.return_value = mock_users_collection
 
         # Mock document count and invalid documents
+        mock_users_collection.estimated_document_count.return_value = 2
         mock_users_collection.count_documents.return_value = 2
         mock_users_collection.find.return_value = [
             {
@@ -333,6 +338,7 @@ class TestValidateSchemaAndIndexes:
         mock_db.__getitem__.return_value = mock_users_collection
 
         # Mock document count and valid documents
+        mock_users_collection.estimated_document_count.return_value = 1
         mock_users_collection.count_documents.return_value = 1
         mock_users_collection.find.return_value = [
             {"name": "John Doe", "email": "john@example.com", "age": 30, "active": True}
@@ -389,6 +395,7 @@ class TestValidateSchemaAndIndexes:
         mock_db.__getitem__.return_value = mock_users_collection
 
         # Mock document count and valid documents
+        mock_users_collection.estimated_document_count.return_value = 1
         mock_users_collection.count_documents.return_value = 1
         mock_users_collection.find.return_value = [
             {"name": "John Doe", "email": "john@example.com", "age": 30, "active": True}
@@ -443,7 +450,7 @@ class TestValidateSchemaAndIndexes:
         mock_db.__getitem__.return_value = mock_users_collection
 
         # Mock large collection (more documents than sample size)
-        mock_users_collection.count_documents.return_value = 1000
+        mock_users_collection.estimated_document_count.return_value = 1000
 
         # Mock aggregate sampling
         mock_users_collection.aggregate.return_value = [
@@ -485,9 +492,13 @@ class TestValidateSchemaAndIndexes:
 
         # Verify that aggregation was called for sampling
         mock_users_collection.aggregate.assert_called_once_with(
-            [{"$sample": {"size": 2}}]
+            [{"$sample": {"size": 2}}], batchSize=2
         )
 
+        # Large collections rely on the metadata estimate only, fetched once
+        mock_users_collection.estimated_document_count.assert_called_once()
+        mock_users_collection.count_documents.assert_not_called()
+
         # Verify results
         assert result["collection_results"]["users"]["document_count"] == 1000
         assert result["collection_results"]["users"]["documents_sampled"] == 2
@@ -505,6 +516,8 @@ class TestValidateSchemaAndIndexes:
         mock_users_collection = MagicMock()
         mock_db.__getitem__.return_value = mock_users_collection
 
+        mock_users_collection.estimated_document_count.return_value = 5
+
         mock_users_collection.count_documents.return_value = 5
 
         # Mock correct indexes
@@ -530,6 +543,9 @@ class TestValidateSchemaAndIndexes:
         )
 
         # Verify results - schema validation should be skipped
+        mock_users_collection.estimated_document_count.assert_not_called()
+        mock_users_collection.count_documents.assert_not_called()
+        assert result["collection_results"]["users"]["document_count"] is None
         assert result["collection_results"]["users"]["documents_sampled"] == 0
         assert (
             result["collection_results"]["users"]["schema_validation"]["passed"] is True
@@ -575,6 +591,7 @@ class TestValidateSchemaAndIndexes:
         }[name]
 
         # Mock users collection
+        mock_users_collection.estimated_document_count.return_value = 1
         mock_users_collection.count_documents.return_value = 1
         mock_users_collection.find.return_value = [
             {"name": "John Doe", "email": "john@example.com", "age": 30, "active": True}
@@ -604,6 +621,7 @@ class TestValidateSchemaAndIndexes:
         ]
 
         # Mock products collection
+        mock_products_collection.estimated_document_count.return_value = 1
         mock_products_collection.count_documents.return_value = 1
         mock_products_collection.find.return_value = [
             {"product_name": "Widget A", "price": 19.99, "category": "widgets"}
@@ -640,3 +658,290 @@ class TestValidateSchemaAndIndexes:
                 "extra_indexes"
             ]
         )
+
+    @patch("mimoid.seeder_base.MongoClient")
+    def test_validate_batch_attributes_errors_per_document(
+        self, mock_mongo_client, concrete_seeder, sample_pydantic_models
+    ):
+        """Test that batched validation attributes errors to individual documents"""
+        mock_client = MagicMock()
+        mock_db = MagicMock()
+        mock_mongo_client.return_value = mock_client
+        mock_client.__getitem__.return_value = mock_db
+
+        mock_users_collection = MagicMock()
+        mock_db.__getitem__.return_value = mock_users_collection
+
+        # Two invalid documents, one of them with multiple field errors
+        mock_users_collection.estimated_document_count.return_value = 3
+        mock_users_collection.count_documents.return_value = 3
+        mock_users_collection.find.return_value = [
+            {"name": "John Doe", "email": "john@example.com", "age": 30},
+            {"name": "Bad Age", "email": "bad@example.com", "age": -1},
+            {"name": "Bad Many", "age": 200, "active": "not_boolean"},
+        ]
+        mock_users_collection.list_indexes.return_value = [
+            {"name": "_id_", "key": {"_id": 1}},
+        ]
+
+        result = concrete_seeder.validate_schema_and_indexes(
+            sample_size=10, pydantic_models={"users": sample_pydantic_models["users"]}
+        )
+
+        schema_validation = result["collection_results"]["users"]["schema_validation"]
+        assert schema_validation["valid_documents"] == 1
+        assert schema_validation["invalid_documents"] == 2
+        assert len(schema_validation["errors"]) == 2
+        assert "document 2" in schema_validation["errors"][1]
+
+    @patch("mimoid.seeder_base.MongoClient")
+    def test_validate_very_large_collection_samples_ids_first(
+        self, mock_mongo_client, concrete_seeder, sample_pydantic_models
+    ):
+        """Test that very large collections sample _id values before fetching documents"""
+        mock_client = MagicMock()
+        mock_db = MagicMock()
+        mock_mongo_client.return_value = mock_client
+        mock_client.__getitem__.return_value = mock_db
+
+        mock_users_collection = MagicMock()
+        mock_db.__getitem__.return_value = mock_users_collection
+
+        mock_users_collection.estimated_document_count.return_value = 5_000_000
+
+        mock_users_collection.aggregate.return_value = [{"_id": 1}, {"_id": 2}]
+        mock_users_collection.find.return_value = [
+            {"name": "John Doe", "email": "john@example.com", "age": 30},
+            {"name": "Jane Smith", "email": "jane@example.com", "age": 25},
+        ]
+        mock_users_collection.list_indexes.return_value = [
+            {"name": "_id_", "key": {"_id": 1}},
+        ]
+
+        result = concrete_seeder.validate_schema_and_indexes(
+            sample_size=2, pydantic_models={"users": sample_pydantic_models["users"]}
+        )
+
+        mock_users_collection.aggregate.assert_called_once_with(
+            [{"$sample": {"size": 2}}, {"$project": {"_id": 1}}],
+            allowDiskUse=False,
+            batchSize=2,
+        )
+        mock_users_collection.find.assert_called_once_with(
+            {"_id": {"$in": [1, 2]}}, batch_size=2
+        )
+        assert result["collection_results"]["users"]["documents_sampled"] == 2
+
+    @patch("mimoid.seeder_base.MongoClient")
+    def test_validate_reuses_client(self, mock_mongo_client, concrete_seeder):
+        """Test that repeated validation runs share one MongoClient"""
+        mock_client = MagicMock()
+        mock_db = MagicMock()
+        mock_mongo_client.return_value = mock_client
+        mock_client.__getitem__.return_value = mock_db
+        mock_db.__getitem__.return_value.list_indexes.return_value = []
+
+        concrete_seeder.validate_schema_and_indexes(sample_size=10)
+        concrete_seeder.validate_schema_and_indexes(sample_size=10)
+
+        mock_mongo_client.assert_called_once()
+        mock_client.close.assert_not_called()
+        assert concrete_seeder.client is mock_client
+
+    @patch("mimoid.seeder_base.MongoClient")
+    def test_validate_caps_schema_error_messages(
+        self, mock_mongo_client, concrete_seeder, sample_pydantic_models
+    ):
+        """Test that stored schema error messages are capped but still counted"""
+        mock_client = MagicMock()
+        mock_db = MagicMock()
+        mock_mongo_client.return_value = mock_client
+        mock_client.__getitem__.return_value = mock_db
+
+        mock_users_collection = MagicMock()
+        mock_db.__getitem__.return_value = mock_users_collection
+
+        invalid_docs = [{"name": f"user {i}", "age": -1} for i in range(60)]
+        mock_users_collection.estimated_document_count.return_value = 60
+        mock_users_collection.count_documents.return_value = 60
+        mock_users_collection.find.return_value = invalid_docs
+        mock_users_collection.list_indexes.return_value = [
+            {"name": "_id_", "key": {"_id": 1}},
+        ]
+
+        result = concrete_seeder.validate_schema_and_indexes(
+            sample_size=100, pydantic_models={"users": sample_pydantic_models["users"]}
+        )
+
+        schema_validation = result["collection_results"]["users"]["schema_validation"]
+        assert schema_validation["invalid_documents"] == 60
+        assert len(schema_validation["errors"]) == 50
+        assert schema_validation["truncated_error_count"] == 10
+
+    @patch("mimoid.seeder_base.MongoClient")
+    def test_validate_head_sampling(
+        self, mock_mongo_client, concrete_seeder, sample_pydantic_models
+    ):
+        """Test that head sampling reads the first documents instead of using $sample"""
+        mock_client = MagicMock()
+        mock_db = MagicMock()
+        mock_mongo_client.return_value = mock_client
+        mock_client.__getitem__.return_value = mock_db
+
+        mock_users_collection = MagicMock()
+        mock_db.__getitem__.return_value = mock_users_collection
+
+        mock_users_collection.estimated_document_count.return_value = 1000
+        mock_users_collection.find.return_value.limit.return_value = [
+            {"name": "John Doe", "email": "john@example.com", "age": 30},
+            {"name": "Jane Smith", "email": "jane@example.com", "age": 25},
+        ]
+        mock_users_collection.list_indexes.return_value = [
+            {"name": "_id_", "key": {"_id": 1}},
+        ]
+
+        result = concrete_seeder.validate_schema_and_indexes(
+            sample_size=2,
+            pydantic_models={"users": sample_pydantic_models["users"]},
+            sampling_strategy="head",
+        )
+
+        mock_users_collection.aggregate.assert_not_called()
+        mock_users_collection.find.assert_called_once_with({}, batch_size=2)
+        mock_users_collection.find.return_value.limit.assert_called_once_with(2)
+        assert result["collection_results"]["users"]["documents_sampled"] == 2
+
+    @patch("mimoid.seeder_base.MongoClient")
+    def test_validate_with_models_from_constructor(
+        self, mock_mongo_client, sample_schema, sample_pydantic_models
+    ):
+        """Test that models passed at construction are used for schema validation"""
+        mock_client = MagicMock()
+        mock_db = MagicMock()
+        mock_mongo_client.return_value = mock_client
+        mock_client.__getitem__.return_value = mock_db
+
+        mock_users_collection = MagicMock()
+        mock_db.__getitem__.return_value = mock_users_collection
+        mock_users_collection.estimated_document_count.return_value = 1
+        mock_users_collection.count_documents.return_value = 1
+        mock_users_collection.find.return_value = [
+            {"name": "", "email": "invalid", "age": -5}
+        ]
+        mock_users_collection.list_indexes.return_value = []
+
+        class TestSeeder(DatabaseSeeder):
+            def seed_all_collections(self, num_records=None):
+                pass
+
+            def create_indexes(self):
+                pass
+
+            def clear_database(self):
+                pass
+
+            def validate_seed_data(self):
+                pass
+
+        seeder = TestSeeder(
+            "mongodb://localhost:27017",
+            sample_schema,
+            pydantic_models={"users": sample_pydantic_models["users"]},
+        )
+        seeder.warmup()
+        result = seeder.validate_schema_and_indexes(sample_size=10)
+
+        assert (
+            result["collection_results"]["users"]["schema_validation"][
+                "invalid_documents"
+            ]
+            == 1
+        )
+        assert result["collection_results"]["products"]["documents_sampled"] == 0
+
+
+class TestCreateSchemaIndexes:
+    """Test cases for the create_schema_indexes method"""
+
+    @pytest.fixture
+    def seeder(self):
+        """Seeder over a schema with one load-time and two post-load indexes"""
+        events_collection = BaseCollectionSchema(
+            collection_name="events",
+            indexes=[
+                IndexDefinition(
+                    name="uuid_unique",
+                    keys={"uuid": IndexDirection.ASCENDING},
+                    unique=True,
+                ),
+                IndexDefinition(
+                    name="created_at_desc",
+                    keys={"created_at": IndexDirection.DESCENDING},
+                    post_load=True,
+                ),
+                IndexDefinition(
+                    name="expires_ttl",
+                    keys={"expires_at": IndexDirection.ASCENDING},
+                    ttl_seconds=3600,
+                    post_load=True,
+                ),
+            ],
+        )
+
+        class TestSeeder(DatabaseSeeder):
+            def seed_all_collections(self, num_records=None):
+                pass
+
+            def create_indexes(self):
+                pass
+
+            def clear_database(self):
+                pass
+
+            def validate_seed_data(self):
+                pass
+
+        schema = BaseMongoDbSchema(
+            collections={"events": events_collection}, database_name="test_db"
+        )
+        return TestSeeder("mongodb://localhost:27017", schema)
+
+    def test_indexes_sent_in_one_command_per_collection(self, seeder):
+        """Matching indexes are created together, with their options"""
+        db = MagicMock()
+
+        assert seeder.create_schema_indexes(db, post_load=True) == []
+
+        db["events"].create_indexes.assert_called_once()
+        models = db["events"].create_indexes.call_args[0][0]
+        assert [model.document["name"] for model in models] == [
+            "created_at_desc",
+            "expires_ttl",
+        ]
+        assert models[0].document["key"] == {"created_at": -1}
+        assert models[1].document["expireAfterSeconds"] == 3600
+
+    def test_failed_index_retried_alone(self, seeder):
+        """One bad index is reported without blocking the others"""
+        from pymongo.errors import OperationFailure
+
+        db = MagicMock()
+
+        def create_indexes(models):
+            if any(model.document["name"] == "expires_ttl" for model in models):
+                raise OperationFailure("bad index")
+
+        db["events"].create_indexes.side_effect = create_indexes
+
+        assert seeder.create_schema_indexes(db) == ["events.expires_ttl"]
+        assert db["events"].create_indexes.call_count == 4
+
+    def test_failed_unique_index_raises(self, seeder):
+        """A unique index that cannot be built fails the run instead of a warning"""
+        from pymongo.errors import OperationFailure
+
+        db = MagicMock()
+        db["events"].create_indexes.side_effect = OperationFailure("E11000 duplicate key")
+
+        with pytest.raises(RuntimeError, match="uuid_unique"):
+            seeder.create_schema_indexes(db, post_load=False)